@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Timing report for merge_all_data_for_website.py on a synthetic dataset.
+
+Builds a throwaway repo-shaped tree (individual employee files, individual
+computer info files and a GPU master list) with N employees, runs the merge
+script against it and reports the wall time. With --baseline, another version
+of the script is run on the same tree and the employees.json outputs are
+compared (exit status 1 if they differ). With --incremental N, N source files
+are then edited, added or removed and an incremental run is timed and checked
+against a --full rebuild of the same tree.
+
+Usage:
+    python .github/scripts/benchmark_merge.py --employees 10000
+
+    # Compare with the previous implementation
+    git show HEAD~1:.github/scripts/merge_all_data_for_website.py > /tmp/merge_old.py
+    python .github/scripts/benchmark_merge.py --employees 10000 --baseline /tmp/merge_old.py
+
+    # Re-merge after 20 source files changed
+    python .github/scripts/benchmark_merge.py --employees 10000 --incremental 20
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+SCRIPT_NAME = "merge_all_data_for_website.py"
+# Modules the merge script imports from its own directory
+HELPER_MODULES = ("name_matcher.py", "site_data.py")
+MERGE_OUTPUT = Path("docs") / "assets" / "employees.json"
+GPU_MASTER_NAME = "EA_US_Desktop_Hardware_GPU_Master List_2025.json"
+
+
+FIRST_NAMES = [
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda", "David", "Elizabeth",
+    "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Charles", "Karen",
+    "Christopher", "Lisa", "Daniel", "Nancy", "Matthew", "Betty", "Anthony", "Margaret", "Mark", "Sandra",
+    "Wei", "Li", "Jing", "Xinyue", "Hao", "Yan", "Mei", "Chen", "Sen", "Zeyi", "Priya", "Arjun", "Ananya",
+    "Mariana", "Paula", "Diego", "Sofia", "Lucas", "Camila", "Mateo", "Yuki", "Haruto", "Sakura", "Kenji",
+    "Olga", "Ivan", "Anastasia", "Dmitri", "Fatima", "Omar", "Aisha", "Youssef", "Callie", "Brian", "Manson",
+]
+SYLLABLES = ["ba", "ber", "cal", "chen", "da", "den", "fer", "gan", "han", "hsu", "jo", "kaw", "kin", "la",
+             "lin", "mar", "mo", "nak", "ner", "o", "pa", "quin", "ro", "sa", "son", "ta", "ter", "ue", "vas",
+             "wang", "wi", "xu", "ya", "zhang", "zo", "man", "ley", "ton", "ski", "ez", "elli", "berg"]
+
+
+def _unique_names(rng: random.Random, count: int) -> list:
+    names = set()
+    while len(names) < count:
+        last = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 3))).title()
+        names.add(f"{rng.choice(FIRST_NAMES)} {last}")
+    return sorted(names)
+
+
+def _typo(rng: random.Random, name: str) -> str:
+    """A near-miss spelling, like the ones the GPU master list has."""
+    # Swap two adjacent letters (never the space between first and last name)
+    i = rng.choice([i for i in range(1, len(name) - 1) if " " not in name[i:i + 2]])
+    return name[:i] + name[i + 1] + name[i] + name[i + 2:]
+
+
+def _individual_computer(rng: random.Random, name: str) -> dict:
+    first, last = name.split(" ", 1)
+    computer = f"EANY-{rng.randrange(16 ** 7):07X}"
+    return {computer: {
+        "computername": computer, "os": "Microsoft Windows 11 Enterprise", "manufacturer": "Dell Inc.",
+        "model": "Precision 5820 Tower", "cpu": "Intel(R) Xeon(R) W-2123 CPU @ 3.60GHz",
+        "gpu_name": "NVIDIA RTX A4000", "gpu_driver": "31.0.15.3623", "memory_bytes": 68719476736,
+        "serial_number": computer[5:], "last_updated": "2025-09-01T08:00:00",
+        "human_name": name, "first_name": first, "last_name": last,
+    }}
+
+
+def _gpu_computers(rng: random.Random, name: str) -> dict:
+    first, last = name.split(" ", 1)
+    computer = f"EANY-{rng.randrange(16 ** 7):07X}"
+    return {computer: {
+        "Computername": computer, "Username": (first[0] + last).lower(), "Last Name": last,
+        "First Name": first, "OS": "Microsoft Windows NT Workstation 10.0", "Manufacturer": "Dell Inc.",
+        "Model": "Precision 5820 Tower", "Total Physical Memory": 100326216, "GPU Name": "NVIDIA Quadro P5000",
+    }}
+
+
+def build_dataset(root: Path, employees: int, seed: int) -> None:
+    """Write a synthetic docs/ and 99-workfiles/ tree with roughly the proportions of the real data."""
+    rng = random.Random(seed)
+    names = _unique_names(rng, int(employees * 1.1))
+    staff, extra = names[:employees], names[employees:]
+
+    employees_dir = root / "docs" / "assets" / "individual_employees"
+    computers_dir = root / "docs" / "assets" / "individual_computer_data"
+    workfiles_dir = root / "99-workfiles"
+    for directory in (employees_dir, computers_dir, workfiles_dir):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    for name in staff:
+        record = {"human_name": name, "email": f"{name.replace(' ', '.').lower()}@ennead.com",
+                  "position": rng.choice(["Architect", "Designer", "Associate", "Principal"]),
+                  "office_location": rng.choice(["New York", "Shanghai", "Los Angeles"]),
+                  "projects": {}, "education": [], "licenses": []}
+        (employees_dir / f"{name.replace(' ', '_')}.json").write_text(json.dumps(record), encoding="utf-8")
+
+    # ~12% of staff (plus a few people outside the directory) report their computer
+    for name in rng.sample(staff, employees // 8) + extra[:len(extra) // 2]:
+        (computers_dir / f"{name.replace(' ', '_')}_computer_info.json").write_text(
+            json.dumps(_individual_computer(rng, name)), encoding="utf-8")
+
+    # ~80% of staff are on the GPU master list, some under a misspelled name, plus people who left
+    gpu = {}
+    for name in rng.sample(staff, int(employees * 0.8)) + extra[len(extra) // 2:]:
+        listed = _typo(rng, name) if rng.random() < 0.05 else name
+        gpu[listed] = _gpu_computers(rng, listed)
+    (workfiles_dir / GPU_MASTER_NAME).write_text(json.dumps(gpu), encoding="utf-8")
+
+
+def edit_dataset(root: Path, changes: int, seed: int) -> None:
+    """Edit, add and remove about `changes` source files, like a day of scraper updates."""
+    rng = random.Random(seed + 1)
+    employees_dir = root / "docs" / "assets" / "individual_employees"
+    computers_dir = root / "docs" / "assets" / "individual_computer_data"
+    employee_files = sorted(employees_dir.glob("*.json"))
+    computer_files = sorted(computers_dir.glob("*.json"))
+    for path in rng.sample(employee_files, max(1, changes // 2)):
+        record = json.loads(path.read_text(encoding="utf-8"))
+        record["position"] = "Senior " + record["position"]
+        path.write_text(json.dumps(record), encoding="utf-8")
+    for path in rng.sample(computer_files, max(1, changes // 4)):
+        path.unlink()
+    for name in _unique_names(random.Random(seed + 2), max(1, changes // 4)):
+        record = {"human_name": name, "position": "Designer", "office_location": "New York"}
+        (employees_dir / f"{name.replace(' ', '_')}.json").write_text(json.dumps(record), encoding="utf-8")
+
+
+def run_script(script: Path, root: Path, *args: str, fresh: bool = True) -> tuple:
+    """Run a copy of the merge script inside the synthetic tree; returns (seconds, employees.json bytes)."""
+    scripts_dir = root / ".github" / "scripts"
+    scripts_dir.mkdir(parents=True, exist_ok=True)
+    target = scripts_dir / SCRIPT_NAME
+    shutil.copyfile(script, target)
+    for helper in HELPER_MODULES:
+        shutil.copyfile(Path(__file__).resolve().parent / helper, scripts_dir / helper)
+    output = root / MERGE_OUTPUT
+    if fresh:
+        output.unlink(missing_ok=True)
+
+    started = time.perf_counter()
+    subprocess.run([sys.executable, str(target), *args], check=False, stdout=subprocess.DEVNULL,
+                   env={**os.environ, "NAME_MATCH_CACHE": str(root / ".cache" / "name_match_cache.json"),
+                        "MERGE_MANIFEST": str(root / ".cache" / "merge_manifest.json")})
+    elapsed = time.perf_counter() - started
+    return elapsed, output.read_bytes() if output.exists() else b""
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time the website data merge on synthetic data")
+    parser.add_argument("--employees", type=int, default=10000, help="Number of synthetic employees")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for the dataset")
+    parser.add_argument("--baseline", type=str, default=None, help="Another version of the merge script to compare")
+    parser.add_argument("--incremental", type=int, default=0,
+                        help="Then change this many source files and time an incremental re-merge")
+    args = parser.parse_args()
+
+    current = Path(__file__).resolve().parent / SCRIPT_NAME
+    with tempfile.TemporaryDirectory(prefix="merge_benchmark_") as tmp:
+        root = Path(tmp)
+        build_dataset(root, args.employees, args.seed)
+        print(f"Synthetic dataset: {args.employees} employees in {root}")
+
+        elapsed, output = run_script(current, root)
+        print(f"  current : {elapsed:.2f}s")
+        if args.incremental:
+            edit_dataset(root, args.incremental, args.seed)
+            incremental_elapsed, incremental_output = run_script(current, root, fresh=False)
+            full_elapsed, full_output = run_script(current, root, "--full")
+            print(f"  after {args.incremental} changes: incremental {incremental_elapsed:.2f}s, "
+                  f"full {full_elapsed:.2f}s")
+            identical = incremental_output == full_output
+            print(f"  incremental output identical to full rebuild: {identical}")
+            return 0 if identical else 1
+        if not args.baseline:
+            return 0
+
+        baseline_elapsed, baseline_output = run_script(Path(args.baseline), root)
+        print(f"  baseline: {baseline_elapsed:.2f}s ({baseline_elapsed / elapsed:.1f}x slower)")
+        identical = output == baseline_output
+        print(f"  identical employees.json: {identical}")
+        if not identical and output and baseline_output:
+            current_employees, baseline_employees = json.loads(output), json.loads(baseline_output)
+            differing = sum(1 for name in current_employees.keys() | baseline_employees.keys()
+                            if current_employees.get(name) != baseline_employees.get(name))
+            print(f"  employees that differ: {differing}")
+        return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,12 +9,41 @@ Output:
 - docs/assets/employees.json: dictionary of employee objects keyed by human_name, merged from individual files,
   each optionally augmented with per-employee computer_info from
   docs/assets/individual_computer_data/{employee_name}_computer_info.json
+- docs/assets/site_data/: the same data as a compact grid index, per-employee detail shards and a
+  minified full file, content-hashed and pre-compressed, listed in manifest.json (see site_data.py)
+
+Sources are joined through name-key indexes, so the merge stays linear in the number of
+records; GPU master list names that don't match exactly go through name_matcher.NameMatcher.
+
+Runs are incremental: a manifest of source file fingerprints (mtime, size, SHA-256) and
+the name keys each file touches is kept in .cache/merge_manifest.json, and only the
+employees sharing a name key with a changed file are re-merged and patched into the
+previous employees.json. A changed GPU master list or merge script, a missing manifest
+or --full re-merges everything.
+
+benchmark_merge.py times the merge on a synthetic dataset (and, with --incremental,
+checks an incremental run against a full one).
 """
 
+import argparse
+import hashlib
 import json
+import os
+import tempfile
+import time
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 import sys
 
+from name_matcher import NameMatcher
+from site_data import write_site_data
+
+
+MERGE_MANIFEST_VERSION = 1
+# Changes to these invalidate every merged employee (forcing a full merge)
+MERGE_CODE_FILES = ("merge_all_data_for_website.py", "name_matcher.py")
+
 
 def get_repo_root() -> Path:
     # .github/scripts/ -> repo root is two parents up
@@ -42,23 +71,14 @@ def fuzzy_name_matching(employee_name: str, gpu_names: list, threshold: float =
     """
     Use fuzzy matching to find the best match for an employee name in GPU data.
     Returns the best matching GPU name if similarity is above threshold, otherwise None.
+    For repeated lookups build a NameMatcher once instead.
     """
-    from difflib import SequenceMatcher
-    
-    best_match = None
-    best_score = 0.0
-    
-    for gpu_name in gpu_names:
-        # Calculate similarity score
-        score = SequenceMatcher(None, employee_name.lower(), gpu_name.lower()).ratio()
-        
+    return NameMatcher(gpu_names, threshold=threshold).best_match(employee_name)
 
-            
-        if score > best_score:
-            best_score = score
-            best_match = gpu_name
-    
-    return best_match if best_score >= threshold else None
+
+def name_match_cache_path(repo_root: Path) -> Path:
+    """Pair-score cache shared between runs (restored by the workflow's cache step)."""
+    return Path(os.environ.get("NAME_MATCH_CACHE", repo_root / ".cache" / "name_match_cache.json"))
 
 
 def validate_data_structure(data: dict, expected_type: str) -> bool:
@@ -150,29 +170,174 @@ def add_computer_data_to_employee(employee_data: dict, computer_data: dict, sect
     print(f"✅ Added {section_name} data for {employee_data.get('human_name', 'Unknown')}")
 
 
-def merge_all_employees() -> bool:
-    repo_root = get_repo_root()
-    docs_dir = repo_root / "docs"
-    employees_dir = docs_dir / "assets" / "individual_employees"
-    computers_dir = docs_dir / "assets" / "individual_computer_data"
-    workfiles_dir = repo_root / "99-workfiles"
-    gpu_master_file = workfiles_dir / "EA_US_Desktop_Hardware_GPU_Master List_2025.json"
-    merged_output = docs_dir / "assets" / "employees.json"
+def _index_computer_info(index: dict, computer_info) -> None:
+    """Add an employee's computer_info to an index keyed by its set of computer names."""
+    if isinstance(computer_info, dict):
+        index[frozenset(computer_info)].append(computer_info)
+
+
+def name_key(name) -> str:
+    """Case-, spacing- and underscore-insensitive key under which every source names a person."""
+    return " ".join(str(name or "").replace("_", " ").split()).lower()
+
+
+def _file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _first_record(data) -> dict:
+    first = next(iter(data.values()), None) if isinstance(data, dict) and data else None
+    return first if isinstance(first, dict) else {}
+
+
+def employee_file_keys(path: Path, data) -> set:
+    """Name keys an individual employee file can produce or match."""
+    keys = {name_key(path.stem)}
+    if isinstance(data, dict):
+        keys.add(name_key(data.get("human_name")))
+    return keys - {""}
+
+
+def computer_file_keys(path: Path, data) -> set:
+    """Name keys an individual computer info file can attach to or create."""
+    keys = {name_key(path.stem.replace("_computer_info", ""))}
+    first = _first_record(data)
+    keys.add(name_key(first.get("human_name")))
+    keys.add(name_key(f"{first.get('first_name', '')} {first.get('last_name', '')}"))
+    return keys - {""}
+
+
+def gpu_entry_keys(full_name: str, computers) -> set:
+    """Name keys a GPU master list entry can match or create."""
+    first = _first_record(computers)
+    return {name_key(full_name), name_key(f"{first.get('First Name', '')} {first.get('Last Name', '')}")} - {""}
+
+
+def employee_output_keys(employee_key: str, employee_data: dict) -> set:
+    return {name_key(employee_key), name_key(employee_data.get("human_name"))} - {""}
+
+
+def merge_manifest_path(repo_root: Path) -> Path:
+    """Source file fingerprints of the last merge (restored by the workflow's cache step)."""
+    return Path(os.environ.get("MERGE_MANIFEST", repo_root / ".cache" / "merge_manifest.json"))
 
-    if not employees_dir.exists():
-        print(f"Error: Directory {employees_dir} does not exist")
-        return False
 
+def merge_code_digest() -> str:
+    """Hash of the merge code; a different version invalidates every merged employee."""
+    digest = hashlib.sha256()
+    scripts_dir = Path(__file__).resolve().parent
+    for name in MERGE_CODE_FILES:
+        digest.update((scripts_dir / name).read_bytes())
+    return digest.hexdigest()
+
+
+def relative_source_paths(repo_root: Path, paths: list) -> dict:
+    """Map each source file to its repo-relative POSIX path (the manifest's file key)."""
+    prefixes = {}
+    relative = {}
+    for path in paths:
+        # One relative_to per directory instead of per file
+        prefix = prefixes.get(path.parent)
+        if prefix is None:
+            prefix = prefixes[path.parent] = path.parent.relative_to(repo_root).as_posix()
+        relative[path] = f"{prefix}/{path.name}"
+    return relative
+
+
+def scan_sources(relative_paths: dict, previous: dict) -> dict:
+    """
+    Fingerprint source files, hashing only those whose mtime or size changed.
+
+    Args:
+        relative_paths: Source files mapped to their manifest keys (see relative_source_paths)
+        previous: File entries of the previous manifest
+
+    Returns:
+        dict: relative path -> {"mtime_ns", "size", "sha256"} plus the previous
+        "keys"/"valid" entries for files whose content is unchanged
+    """
+    entries = {}
+    for path, relative in relative_paths.items():
+        stat = path.stat()
+        old = previous.get(relative)
+        if old and old["mtime_ns"] == stat.st_mtime_ns and old["size"] == stat.st_size:
+            entries[relative] = dict(old)
+            continue
+        entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": _file_digest(path)}
+        if old and old["sha256"] == entry["sha256"]:
+            # Touched (e.g. by a fresh checkout) but not modified
+            entry.update({k: v for k, v in old.items() if k in ("keys", "valid")})
+        entries[relative] = entry
+    return entries
+
+
+def affected_name_keys(seed_keys: set, units: list) -> set:
+    """
+    Close seed_keys over units (sets of name keys): every unit sharing a key with the
+    result is entirely inside it, so the units it selects can be merged on their own.
+    """
+    units_by_key = defaultdict(list)
+    for unit in units:
+        for key in unit:
+            units_by_key[key].append(unit)
+    affected = set()
+    pending = list(seed_keys)
+    while pending:
+        key = pending.pop()
+        if key in affected:
+            continue
+        affected.add(key)
+        for unit in units_by_key.get(key, ()):
+            pending.extend(unit - affected)
+    return affected
+
+
+def load_gpu_master_list(gpu_master_file: Path):
+    """GPU master list keyed by normalized name, or None if missing or malformed."""
+    if not gpu_master_file.exists():
+        print(f"Note: GPU master list not found: {gpu_master_file}")
+        return None
+    gpu_data = _safe_read_json(gpu_master_file)
+    if not isinstance(gpu_data, dict):
+        return None
+    print("✅ Loading GPU master list data as-is (assuming correct structure)")
+    # Create normalized name mapping for better matching
+    gpu_data_by_name = {}
+    for full_name, computers in gpu_data.items():
+        normalized_key = normalize_name_for_matching(full_name)
+        gpu_data_by_name[normalized_key] = computers
+    return gpu_data_by_name
+
+
+def merge_sources(employee_files: list, computer_files: list, gpu_data_by_name, gpu_name_matcher,
+                  gpu_create_names=None):
+    """
+    Merge parsed source files into website employees.
+
+    Args:
+        employee_files: (path, data) of individual employee files, sorted by path
+        computer_files: (path, data) of individual computer info files, sorted by path
+        gpu_data_by_name: GPU master list keyed by normalized name (None to skip)
+        gpu_name_matcher: Returns the NameMatcher over the GPU master list names (called
+            only when a name has no exact match)
+        gpu_create_names: Normalized GPU names allowed to create employees (None = all)
+
+    Returns:
+        (employees, origins, stats): employees keyed by output key, origins mapping each
+        key to its [source number, position] sort key, and merge counters
+    """
     print("=== DATA SOURCE 1: INDIVIDUAL EMPLOYEE FILES ===")
     # Load individual employee data files
     employees = {}
-    for p in sorted(employees_dir.glob("*.json")):
-        data = _safe_read_json(p)
+    # Output order of a full merge: source 1 by file name, then created employees by file / list position
+    origins = {}
+    for p, data in employee_files:
         if data is None:
             continue
         clean_key = p.stem  # matches how individual files are named
         employee_key = data.get("human_name", clean_key)
         employees[employee_key] = data
+        origins.setdefault(employee_key, [1, p.name])
         # Add data source tracking
         add_data_source_to_employee(employees[employee_key], "Individual Employee Files")
     print(f"Loaded {len(employees)} employees from individual employee files")
@@ -180,212 +345,381 @@ def merge_all_employees() -> bool:
     print("\n=== DATA SOURCE 2: INDIVIDUAL COMPUTER INFO FILES (CONFIDENTIAL) ===")
     # Load individual computer info files
     computer_info_by_employee = {}
+    computer_file_by_key = {}
     computer_matches = 0
     computer_created_employees = 0
     computer_validation_errors = 0
     
-    if computers_dir.exists():
-        # Load all individual computer data files
-        for cp in sorted(computers_dir.glob("*_computer_info.json")):
-            clean_key = cp.stem.replace("_computer_info", "")
-            normalized_key = "_".join(clean_key.strip().split()).lower()
-            payload = _safe_read_json(cp)
-            if isinstance(payload, dict):
-                # Validate this is individual computer data structure
-                if validate_data_structure(payload, "individual_computer"):
-                    computer_info_by_employee[normalized_key] = payload
-                    print(f"✅ Validated individual computer data: {cp.name}")
-                else:
-                    computer_validation_errors += 1
-                    print(f"❌ Invalid individual computer data structure: {cp.name}")
+    # Load all individual computer data files
+    for cp, payload in computer_files:
+        clean_key = cp.stem.replace("_computer_info", "")
+        normalized_key = "_".join(clean_key.strip().split()).lower()
+        if isinstance(payload, dict):
+            # Validate this is individual computer data structure
+            if validate_data_structure(payload, "individual_computer"):
+                computer_info_by_employee[normalized_key] = payload
+                computer_file_by_key.setdefault(normalized_key, cp.name)
+                print(f"✅ Validated individual computer data: {cp.name}")
             else:
                 computer_validation_errors += 1
-                print(f"❌ Invalid data format in: {cp.name}")
+                print(f"❌ Invalid individual computer data structure: {cp.name}")
+        else:
+            computer_validation_errors += 1
+            print(f"❌ Invalid data format in: {cp.name}")
+    
+    # Match individual computer data to existing employees by normalized name key
+    for employee_key, employee_data in employees.items():
+        clean_key = employee_key.lower().replace(" ", "_")
+        comp = computer_info_by_employee.get(clean_key)
+        if comp:
+            # Add to separate "computer_info" section
+            add_computer_data_to_employee(employee_data, comp, "computer_info")
+            add_data_source_to_employee(employee_data, "Individual Computer Data")
+            computer_matches += 1
+            print(f"✅ Matched individual computer data for: {employee_key}")
+    
+    # Index the computer_info now attached to employees by its computer names, so the
+    # "already matched" check compares against a handful of dicts instead of every employee
+    attached_computer_info = defaultdict(list)
+    for employee_data in employees.values():
+        _index_computer_info(attached_computer_info, employee_data.get("computer_info"))
+    
+    # Create new employees for unmatched computer data
+    for clean_key, comp_data in computer_info_by_employee.items():
+        # Check if this computer data already matched to an existing employee
+        already_matched = any(
+            attached == comp_data for attached in attached_computer_info.get(frozenset(comp_data), ())
+        )
         
-        # Try to match individual computer data to existing employees
-        for employee_key, employee_data in employees.items():
-            # Try to find matching computer info by normalized key
-            clean_key = employee_key.lower().replace(" ", "_")
-            comp = computer_info_by_employee.get(clean_key)
-            if comp:
-                # Add to separate "computer_info" section
-                add_computer_data_to_employee(employee_data, comp, "computer_info")
-                add_data_source_to_employee(employee_data, "Individual Computer Data")
+        if not already_matched:
+            # Extract name from computer data (use clean_key as fallback)
+            first_computer = next(iter(comp_data.values())) if comp_data else {}
+            human_name = first_computer.get("human_name", "").strip()
+            first_name = first_computer.get("first_name", "").strip()
+            last_name = first_computer.get("last_name", "").strip()
+            full_name = f"{first_name} {last_name}".strip() or human_name
+            
+            if not full_name:
+                # Use clean_key as fallback, convert back to readable format
+                full_name = clean_key.replace("_", " ").title()
+            
+            if full_name in employees:
+                # Augment existing employee from source 1 instead of creating a new one
+                add_computer_data_to_employee(employees[full_name], comp_data, "computer_info")
+                add_data_source_to_employee(employees[full_name], "Individual Computer Data")
                 computer_matches += 1
-                print(f"✅ Matched individual computer data for: {employee_key}")
+                print(f"✅ Augmented existing employee with individual computer data: {full_name}")
             else:
-                # Try alternative matching - remove "_computer_info" suffix from computer data keys
-                matched = False
-                for comp_key, comp_data in computer_info_by_employee.items():
-                    # comp_key is already normalized
-                    if comp_key == clean_key:
-                        add_computer_data_to_employee(employee_data, comp_data, "computer_info")
-                        add_data_source_to_employee(employee_data, "Individual Computer Data")
-                        computer_matches += 1
-                        print(f"✅ Matched individual computer data for: {employee_key} (via alternative matching)")
-                        matched = True
-                        break
+                new_employee = {
+                    "human_name": full_name,
+                    "source": "individual_computer_only"
+                }
+                # Add computer data to separate section
+                add_computer_data_to_employee(new_employee, comp_data, "computer_info")
+                add_data_source_to_employee(new_employee, "Individual Computer Data")
+                employees[full_name] = new_employee
+                origins.setdefault(full_name, [2, computer_file_by_key[clean_key]])
+                computer_created_employees += 1
+                print(f"Created new employee from individual computer data: {full_name}")
+            _index_computer_info(attached_computer_info, employees[full_name].get("computer_info"))
+    
+    print(f"Loaded computer info for {len(computer_info_by_employee)} employees")
+    print(f"Successfully matched {computer_matches} employees with individual computer data")
+    print(f"Created {computer_created_employees} new employees from individual computer data")
+    if computer_validation_errors > 0:
+        print(f"⚠️  {computer_validation_errors} individual computer data files failed validation")
+
+    print("\n=== DATA SOURCE 3: GPU MASTER LIST JSON (STATIC) ===")
+    gpu_matches = 0
+    created_employees = 0
+    if gpu_data_by_name is not None:
+        # Add GPU master list data to existing employee data under "Static GPU Master List" section
+        for employee_key, employee_data in employees.items():
+            human_name = employee_data.get("human_name", "")
+            if human_name:
+                normalized_name = normalize_name_for_matching(human_name)
+                gpu_computers = gpu_data_by_name.get(normalized_name)
                 
-                # If still no match, try fuzzy matching by name
-                if not matched:
-                    for comp_key, comp_data in computer_info_by_employee.items():
-                        if comp_key.endswith("_computer_info"):
-                            # Extract name from computer data
-                            first_computer = next(iter(comp_data.values())) if comp_data else {}
-                            comp_first_name = first_computer.get("First Name", "").strip()
-                            comp_last_name = first_computer.get("Last Name", "").strip()
-                            comp_full_name = f"{comp_first_name} {comp_last_name}".strip()
-                            
-                            if comp_full_name and comp_full_name.lower() == employee_key.lower():
-                                add_computer_data_to_employee(employee_data, comp_data, "computer_info")
-                                add_data_source_to_employee(employee_data, "Individual Computer Data")
-                                computer_matches += 1
-                                print(f"✅ Matched individual computer data for: {employee_key} (via name matching)")
-                                matched = True
-                                break
+                # If exact match failed, try fuzzy matching
+                if not gpu_computers:
+                    fuzzy_match = gpu_name_matcher().best_match(human_name)
+                    if fuzzy_match:
+                        gpu_computers = gpu_data_by_name.get(fuzzy_match)
+                        print(f"Fuzzy matched '{human_name}' with GPU data '{fuzzy_match}'")
                 
-                # If still no match, try matching by human_name field in computer data
-                if not matched:
-                    for comp_key, comp_data in computer_info_by_employee.items():
-                        if comp_key.endswith("_computer_info"):
-                            # Check if any computer has matching human_name
-                            for computer_name, computer_info in comp_data.items():
-                                comp_human_name = computer_info.get("human_name", "").strip()
-                                if comp_human_name and comp_human_name.lower() == employee_key.lower():
-                                    add_computer_data_to_employee(employee_data, comp_data, "computer_info")
-                                    add_data_source_to_employee(employee_data, "Individual Computer Data")
-                                    computer_matches += 1
-                                    print(f"✅ Matched individual computer data for: {employee_key} (via human_name matching)")
-                                    matched = True
-                                    break
-                            if matched:
-                                break
+                if gpu_computers:
+                    # Add to separate "Static GPU Master List" section
+                    add_computer_data_to_employee(employee_data, gpu_computers, "Static GPU Master List")
+                    add_data_source_to_employee(employee_data, "GPU Master List 2025")
+                    gpu_matches += 1
+                    print(f"Matched GPU master list data for: {human_name}")
         
-        # Create new employees for unmatched computer data
-        for clean_key, comp_data in computer_info_by_employee.items():
-            # Check if this computer data already matched to an existing employee
-            already_matched = False
-            for employee_data in employees.values():
-                if employee_data.get("computer_info") == comp_data:
-                    already_matched = True
-                    break
-            
-            if not already_matched:
-                # Extract name from computer data (use clean_key as fallback)
-                first_computer = next(iter(comp_data.values())) if comp_data else {}
-                human_name = first_computer.get("human_name", "").strip()
-                first_name = first_computer.get("first_name", "").strip()
-                last_name = first_computer.get("last_name", "").strip()
-                full_name = f"{first_name} {last_name}".strip() or human_name
-                
-                if not full_name:
-                    # Use clean_key as fallback, convert back to readable format
-                    full_name = clean_key.replace("_", " ").title()
+        # Normalized names of every employee so far (kept up to date as employees are created)
+        existing_names = {
+            normalize_name_for_matching(employee_data["human_name"])
+            for employee_data in employees.values() if employee_data.get("human_name")
+        }
+        
+        # Create missing employees from GPU master list
+        for position, (normalized_name, gpu_computers) in enumerate(gpu_data_by_name.items()):
+            if gpu_create_names is not None and normalized_name not in gpu_create_names:
+                continue
+            if normalized_name not in existing_names:
+                # Create new employee entry from GPU data
+                # Extract name from first computer entry
+                first_computer = next(iter(gpu_computers.values()))
+                first_name = first_computer.get("First Name", "").strip()
+                last_name = first_computer.get("Last Name", "").strip()
+                full_name = f"{first_name} {last_name}".strip()
                 
-                if full_name in employees:
-                    # Augment existing employee from source 1 instead of creating a new one
-                    add_computer_data_to_employee(employees[full_name], comp_data, "computer_info")
-                    add_data_source_to_employee(employees[full_name], "Individual Computer Data")
-                    computer_matches += 1
-                    print(f"✅ Augmented existing employee with individual computer data: {full_name}")
-                else:
+                if full_name:
                     new_employee = {
                         "human_name": full_name,
-                        "source": "individual_computer_only"
+                        "source": "gpu_master_list_only"
                     }
-                    # Add computer data to separate section
-                    add_computer_data_to_employee(new_employee, comp_data, "computer_info")
-                    add_data_source_to_employee(new_employee, "Individual Computer Data")
+                    # Add GPU data to separate section
+                    add_computer_data_to_employee(new_employee, gpu_computers, "Static GPU Master List")
+                    add_data_source_to_employee(new_employee, "GPU Master List 2025")
                     employees[full_name] = new_employee
-                    computer_created_employees += 1
-                    print(f"Created new employee from individual computer data: {full_name}")
+                    origins.setdefault(full_name, [3, position])
+                    existing_names.add(normalize_name_for_matching(full_name))
+                    created_employees += 1
+                    print(f"Created missing employee from GPU master list: {full_name}")
         
-        print(f"Loaded computer info for {len(computer_info_by_employee)} employees")
-        print(f"Successfully matched {computer_matches} employees with individual computer data")
-        print(f"Created {computer_created_employees} new employees from individual computer data")
-        if computer_validation_errors > 0:
-            print(f"⚠️  {computer_validation_errors} individual computer data files failed validation")
-    else:
+        print(f"Loaded GPU data for {len(gpu_data_by_name)} employees from master list")
+        print(f"Successfully matched {gpu_matches} employees with GPU master list data")
+        print(f"Created {created_employees} missing employees from GPU master list")
+
+    stats = {
+        "computer_matches": computer_matches,
+        "computer_created_employees": computer_created_employees,
+        "computer_validation_errors": computer_validation_errors,
+        "gpu_matches": gpu_matches,
+        "created_employees": created_employees,
+    }
+    return employees, origins, stats
+
+
+def employee_fragment(employee_key: str, employee_data: dict) -> str:
+    """One top-level entry of employees.json, exactly as json.dumps(employees, indent=2) writes it."""
+    # JSON strings never contain raw newlines, so re-indenting the nested dump is safe
+    value = json.dumps(employee_data, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+    return f"{json.dumps(employee_key, ensure_ascii=False)}: {value}"
+
+
+def render_employees_json(fragments: list) -> str:
+    """employees.json text from employee_fragment() entries (same bytes as json.dumps(indent=2))."""
+    return "{\n  " + ",\n  ".join(fragments) + "\n}" if fragments else "{}"
+
+
+def read_employee_fragments(text: str):
+    """
+    Parse employees.json written by render_employees_json, keeping each entry's text.
+
+    Returns:
+        (employees, fragments): the parsed dict and key -> employee_fragment() text
+    """
+    decoder = json.JSONDecoder()
+    employees, fragments = {}, {}
+    position = text.index("{") + 1
+    while True:
+        position = _skip_json_whitespace(text, position)
+        if text[position] == "}":
+            return employees, fragments
+        start = position
+        employee_key, position = decoder.raw_decode(text, position)
+        position = _skip_json_whitespace(text, position) + 1  # ':'
+        employees[employee_key], position = decoder.raw_decode(text, _skip_json_whitespace(text, position))
+        fragments[employee_key] = text[start:position]
+        position = _skip_json_whitespace(text, position)
+        if text[position] == ",":
+            position += 1
+
+
+def _skip_json_whitespace(text: str, position: int) -> int:
+    while text[position] in " \t\n\r":
+        position += 1
+    return position
+
+
+def _load_previous_merge(manifest_path: Path, merged_output: Path, code_digest: str):
+    """
+    Previous manifest and employees.json, or a reason why they can't be patched.
+
+    Returns:
+        (manifest, (employees, fragments), None) or (None, None, reason)
+    """
+    if not manifest_path.exists():
+        return None, None, "no merge manifest from a previous run"
+    if not merged_output.exists():
+        return None, None, f"{merged_output.name} does not exist"
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        return None, None, f"unreadable merge manifest ({e})"
+    if manifest.get("version") != MERGE_MANIFEST_VERSION:
+        return None, None, "merge manifest format changed"
+    if manifest.get("code") != code_digest:
+        return None, None, "merge code changed"
+    output_bytes = merged_output.read_bytes()
+    # The manifest must describe this exact output (a failed push leaves an older one behind)
+    if manifest.get("output_sha256") != hashlib.sha256(output_bytes).hexdigest():
+        return None, None, f"{merged_output.name} differs from the last merge"
+    employees, fragments = read_employee_fragments(output_bytes.decode("utf-8"))
+    if set(employees) != set(manifest.get("outputs", {})):
+        return None, None, "merge manifest does not list the current employees"
+    return manifest, (employees, fragments), None
+
+
+def _save_merge_manifest(manifest_path: Path, manifest: dict):
+    """Write the manifest atomically so an interrupted run can't leave half a file behind."""
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=manifest_path.parent, prefix=f".{manifest_path.name}.", suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(json.dumps(manifest, separators=(",", ":")))
+    os.replace(tmp_name, manifest_path)
+
+
+def merge_all_employees(full: bool = False) -> bool:
+    """
+    Merge every data source into docs/assets/employees.json and the site data.
+
+    Unless full is set, the previous run's manifest is used to re-merge only the
+    employees whose source files changed and patch them into the existing output.
+
+    Args:
+        full: Rebuild everything from all source files
+
+    Returns:
+        bool: False if any individual computer data file failed validation
+    """
+    started = time.perf_counter()
+    repo_root = get_repo_root()
+    docs_dir = repo_root / "docs"
+    employees_dir = docs_dir / "assets" / "individual_employees"
+    computers_dir = docs_dir / "assets" / "individual_computer_data"
+    workfiles_dir = repo_root / "99-workfiles"
+    gpu_master_file = workfiles_dir / "EA_US_Desktop_Hardware_GPU_Master List_2025.json"
+    merged_output = docs_dir / "assets" / "employees.json"
+    site_data_dir = docs_dir / "assets" / "site_data"
+    manifest_path = merge_manifest_path(repo_root)
+
+    if not employees_dir.exists():
+        print(f"Error: Directory {employees_dir} does not exist")
+        return False
+
+    employee_paths = sorted(employees_dir.glob("*.json"))
+    computer_paths = sorted(computers_dir.glob("*_computer_info.json")) if computers_dir.exists() else []
+    if not computers_dir.exists():
         print(f"Note: Individual computers directory not found: {computers_dir}")
+    gpu_paths = [gpu_master_file] if gpu_master_file.exists() else []
+    code_digest = merge_code_digest()
 
-    print("\n=== DATA SOURCE 3: GPU MASTER LIST JSON (STATIC) ===")
-    # Load GPU master list data
-    gpu_data_by_name = {}
-    gpu_matches = 0
-    created_employees = 0
-    if gpu_master_file.exists():
-        gpu_data = _safe_read_json(gpu_master_file)
-        if isinstance(gpu_data, dict):
-            print("✅ Loading GPU master list data as-is (assuming correct structure)")
-            # Create normalized name mapping for better matching
-            for full_name, computers in gpu_data.items():
-                normalized_key = normalize_name_for_matching(full_name)
-                gpu_data_by_name[normalized_key] = computers
-            
-            # Add GPU master list data to existing employee data under "Static GPU Master List" section
-            for employee_key, employee_data in employees.items():
-                human_name = employee_data.get("human_name", "")
-                if human_name:
-                    normalized_name = normalize_name_for_matching(human_name)
-                    gpu_computers = gpu_data_by_name.get(normalized_name)
-                    
-                    # If exact match failed, try fuzzy matching
-                    if not gpu_computers:
-                        gpu_names = list(gpu_data_by_name.keys())
-                        fuzzy_match = fuzzy_name_matching(human_name, gpu_names)
-                        if fuzzy_match:
-                            gpu_computers = gpu_data_by_name.get(fuzzy_match)
-                            print(f"Fuzzy matched '{human_name}' with GPU data '{fuzzy_match}'")
-                    
-                    if gpu_computers:
-                        # Add to separate "Static GPU Master List" section
-                        add_computer_data_to_employee(employee_data, gpu_computers, "Static GPU Master List")
-                        add_data_source_to_employee(employee_data, "GPU Master List 2025")
-                        gpu_matches += 1
-                        print(f"Matched GPU master list data for: {human_name}")
-            
-            # Create missing employees from GPU master list
-            for normalized_name, gpu_computers in gpu_data_by_name.items():
-                # Check if this employee already exists
-                employee_exists = False
-                for employee_data in employees.values():
-                    if employee_data.get("human_name") and normalize_name_for_matching(employee_data["human_name"]) == normalized_name:
-                        employee_exists = True
-                        break
-                
-                if not employee_exists:
-                    # Create new employee entry from GPU data
-                    # Extract name from first computer entry
-                    first_computer = next(iter(gpu_computers.values()))
-                    first_name = first_computer.get("First Name", "").strip()
-                    last_name = first_computer.get("Last Name", "").strip()
-                    full_name = f"{first_name} {last_name}".strip()
-                    
-                    if full_name:
-                        new_employee = {
-                            "human_name": full_name,
-                            "source": "gpu_master_list_only"
-                        }
-                        # Add GPU data to separate section
-                        add_computer_data_to_employee(new_employee, gpu_computers, "Static GPU Master List")
-                        add_data_source_to_employee(new_employee, "GPU Master List 2025")
-                        employees[full_name] = new_employee
-                        created_employees += 1
-                        print(f"Created missing employee from GPU master list: {full_name}")
-            
-            print(f"Loaded GPU data for {len(gpu_data_by_name)} employees from master list")
-            print(f"Successfully matched {gpu_matches} employees with GPU master list data")
-            print(f"Created {created_employees} missing employees from GPU master list")
+    previous, previous_output, reason = (None, None, "--full requested") if full else \
+        _load_previous_merge(manifest_path, merged_output, code_digest)
+    relative_paths = relative_source_paths(repo_root, employee_paths + computer_paths + gpu_paths)
+    files = scan_sources(relative_paths, previous["files"] if previous else {})
+    gpu_relative = relative_source_paths(repo_root, [gpu_master_file])[gpu_master_file]
+
+    if previous is not None:
+        old_files = previous["files"]
+        changed = {path for path, entry in files.items()
+                   if path not in old_files or old_files[path]["sha256"] != entry["sha256"]}
+        removed = set(old_files) - set(files)
+        if gpu_relative in changed or gpu_relative in removed:
+            previous, reason = None, "GPU master list changed"
+        elif not changed and not removed:
+            print("✅ No source files changed since the last merge - nothing to do")
+            previous["files"] = files
+            _save_merge_manifest(manifest_path, previous)
+            print(f"⏱️  Checked in {time.perf_counter() - started:.2f}s")
+            return not any(entry.get("valid") is False for entry in files.values())
+
+    gpu_data_by_name = load_gpu_master_list(gpu_master_file)
+
+    @lru_cache(maxsize=None)
+    def gpu_name_matcher() -> NameMatcher:
+        # Built on first use: an incremental run often has no name to match fuzzily
+        return NameMatcher(gpu_data_by_name or (), cache_path=name_match_cache_path(repo_root))
+
+    sources_by_path = {relative: path for path, relative in relative_paths.items()}
+
+    if previous is None:
+        print(f"🔄 Full merge ({reason})")
+        employee_files = [(p, _safe_read_json(p)) for p in employee_paths]
+        computer_files = [(p, _safe_read_json(p)) for p in computer_paths]
+        employees, origins, merge_stats = merge_sources(employee_files, computer_files, gpu_data_by_name,
+                                                        gpu_name_matcher)
+        merged = employees
     else:
-        print(f"Note: GPU master list not found: {gpu_master_file}")
+        # Name keys touched by changed or removed files, closed over every file, GPU entry and
+        # merged employee that shares one (those can't be re-merged separately)
+        seed_keys = set()
+        for path in changed | removed:
+            seed_keys.update(old_files.get(path, {}).get("keys", ()))
+        parsed = {}
+        for path in changed:
+            source = sources_by_path[path]
+            parsed[path] = _safe_read_json(source)
+            keys_of = employee_file_keys if source.parent == employees_dir else computer_file_keys
+            files[path]["keys"] = sorted(keys_of(source, parsed[path]))
+            seed_keys.update(files[path]["keys"])
+        gpu_keys = {name: gpu_entry_keys(name, computers) for name, computers in (gpu_data_by_name or {}).items()}
+        units = [set(entry.get("keys", ())) for entry in files.values()]
+        units += list(gpu_keys.values())
+        units += [set(output["keys"]) for output in previous["outputs"].values()]
+        affected = affected_name_keys(seed_keys, units)
+
+        def selected(paths):
+            for p in paths:
+                relative = relative_paths[p]
+                if affected.intersection(files[relative].get("keys", ())):
+                    yield p, parsed[relative] if relative in parsed else _safe_read_json(p)
+
+        employee_files = list(selected(employee_paths))
+        computer_files = list(selected(computer_paths))
+        gpu_create_names = {name for name, keys in gpu_keys.items() if keys & affected}
+        print(f"🔄 Incremental merge: {len(changed)} changed and {len(removed)} removed source files, "
+              f"re-merging {len(employee_files)} employee and {len(computer_files)} computer files")
+        merged, merged_origins, merge_stats = merge_sources(employee_files, computer_files, gpu_data_by_name,
+                                                            gpu_name_matcher, gpu_create_names)
+
+        # Patch: drop the affected employees from the last output, add the re-merged ones and
+        # restore the order a full merge would produce
+        origins = {key: output["origin"] for key, output in previous["outputs"].items()
+                   if not affected.intersection(output["keys"])}
+        previous_employees, fragments = previous_output
+        employees = {key: previous_employees[key] for key in origins}
+        for key in set(employees) & set(merged):
+            print(f"⚠️  WARNING: re-merged employee {key} collides with an unchanged one - run with --full")
+        employees.update(merged)
+        origins.update(merged_origins)
+        employees = {key: employees[key] for key in sorted(employees, key=lambda key: tuple(origins[key]))}
+        print(f"Patched {len(merged)} employees into {len(employees)} (previously {len(previous_employees)})")
+
+    if gpu_name_matcher.cache_info().currsize:
+        gpu_name_matcher().save_cache()
+
+    # Fingerprints of every parsed file for the next run (validity of computer files included)
+    for p, data in employee_files:
+        files[relative_paths[p]]["keys"] = sorted(employee_file_keys(p, data))
+    for p, data in computer_files:
+        entry = files[relative_paths[p]]
+        entry["keys"] = sorted(computer_file_keys(p, data))
+        entry["valid"] = isinstance(data, dict) and validate_data_structure(data, "individual_computer")
+    computer_validation_errors = sum(1 for entry in files.values() if entry.get("valid") is False)
 
     print("\n=== MERGING COMPLETE ===")
     
     # Final validation summary
+    computer_created_employees = merge_stats["computer_created_employees"]
+    created_employees = merge_stats["created_employees"]
     print("\n🔍 DATA SEPARATION VALIDATION SUMMARY:")
-    print(f"Source 1 - Individual Employee Files: {len(employees) - computer_created_employees - created_employees} employees")
-    print(f"Source 2 - Individual Computer Data: {computer_matches} matched + {computer_created_employees} created")
-    print(f"Source 3 - GPU Master List Data: {gpu_matches} matched + {created_employees} created")
+    if previous is not None:
+        print("(source counts cover the re-merged employees only)")
+    print(f"Source 1 - Individual Employee Files: {len(merged) - computer_created_employees - created_employees} employees")
+    print(f"Source 2 - Individual Computer Data: {merge_stats['computer_matches']} matched + {computer_created_employees} created")
+    print(f"Source 3 - GPU Master List Data: {merge_stats['gpu_matches']} matched + {created_employees} created")
     print(f"Total employees with individual computer data: {sum(1 for emp in employees.values() if emp.get('computer_info'))}")
     print(f"Total employees with GPU master list data: {sum(1 for emp in employees.values() if emp.get('Static GPU Master List'))}")
     print(f"Total final employees: {len(employees)}")
@@ -409,16 +743,40 @@ def merge_all_employees() -> bool:
     else:
         print(f"⚠️  {cross_contamination} employees have both data sources - review matching logic")
     
-    merged_output.write_text(json.dumps(employees, indent=2, ensure_ascii=False), encoding="utf-8")
+    # Unchanged employees keep the text they had in the previous output
+    if previous is None:
+        fragments = {}
+    output_bytes = render_employees_json([
+        fragments[key] if key not in merged else employee_fragment(key, employee)
+        for key, employee in employees.items()
+    ]).encode("utf-8")
+    merged_output.write_bytes(output_bytes)
     print(f"\n📁 Generated {merged_output.relative_to(repo_root)} with {len(employees)} employees")
+    site_manifest = write_site_data(employees, site_data_dir, changed=None if previous is None else set(merged))
+    site_stats = site_manifest["stats"]
+    index_sizes = ", ".join(f"{label} {size / 1024:.0f} KiB" for label, size in site_stats["index_sizes"].items())
+    print(f"📁 Generated {site_data_dir.relative_to(repo_root)}/ ({site_stats['new_files']} new files, "
+          f"{site_stats['removed_files']} stale files removed; index: {index_sizes})")
+
+    _save_merge_manifest(manifest_path, {
+        "version": MERGE_MANIFEST_VERSION,
+        "code": code_digest,
+        "output_sha256": hashlib.sha256(output_bytes).hexdigest(),
+        "files": files,
+        "outputs": {key: {"origin": origins[key], "keys": sorted(employee_output_keys(key, employee))}
+                    for key, employee in employees.items()},
+    })
+    print(f"⏱️  Merged in {time.perf_counter() - started:.2f}s")
     
     # Return success only if no critical errors
     return computer_validation_errors == 0
 
 
 if __name__ == "__main__":
-    success = merge_all_employees()
+    parser = argparse.ArgumentParser(description="Merge employee, computer and GPU data for the website")
+    parser.add_argument("--full", action="store_true",
+                        help="Re-merge every source file instead of only the ones changed since the last run")
+    args = parser.parse_args()
+    success = merge_all_employees(full=args.full)
     if not success:
         sys.exit(1)
-
-
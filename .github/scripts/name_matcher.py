@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Reusable person-name matching for the data merge scripts.
+
+``NameMatcher`` holds a list of names and answers "which of them is this
+person?" without scoring every name: each name is filed under blocking keys
+(the Soundex code of one name part plus the initial of another), and only
+names sharing a key with the query are scored.
+
+Scoring compares first names (equal, known nickname, or one a prefix of the
+other such as Matt/Matthew count as a full match) and last names separately,
+so "Sen Zhang" no longer matches "Sen Yang" just because most letters agree.
+Middle names, hyphenated surnames, "Last, First" order and spacing differences
+("Ji Hyeon" / "Jihyeon") are handled before scoring.
+
+Pair scores can be cached in a JSON file across runs (see ``cache_path``).
+
+Used by merge_all_data_for_website.py and 99-workfiles/excel_to_json_merger.py.
+Standard library only.
+"""
+
+import json
+import os
+import re
+import tempfile
+import unicodedata
+from collections import defaultdict
+from difflib import SequenceMatcher
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Bump when scoring changes so cached scores from older runs are discarded
+SCORER_VERSION = 1
+
+# Formal first name -> common nicknames
+NICKNAMES = {
+    'robert': ['bob', 'rob', 'bobby'],
+    'richard': ['rick', 'dick', 'rich'],
+    'william': ['will', 'bill', 'billy'],
+    'michael': ['mike', 'mick'],
+    'david': ['dave', 'davey'],
+    'christopher': ['chris', 'christy'],
+    'daniel': ['dan', 'danny'],
+    'matthew': ['matt', 'matty'],
+    'anthony': ['tony', 'ant'],
+    'andrew': ['andy', 'drew'],
+    'joseph': ['joe', 'joey'],
+    'james': ['jim', 'jimmy', 'jamie'],
+    'charles': ['charlie', 'chuck'],
+    'thomas': ['tom', 'tommy'],
+    'alexander': ['alex', 'al'],
+    'benjamin': ['ben', 'benny'],
+    'samuel': ['sam', 'sammy'],
+    'jonathan': ['jon', 'johnny'],
+    'nicholas': ['nick', 'nicky'],
+    'timothy': ['tim', 'timmy'],
+    'jennifer': ['jen', 'jenny'],
+    'elizabeth': ['liz', 'beth', 'betty'],
+    'patricia': ['pat', 'patty', 'tricia'],
+    'jessica': ['jess', 'jessie'],
+    'sarah': ['sally', 'sara'],
+    'michelle': ['mich', 'shell'],
+    'stephanie': ['steph', 'stephie'],
+    'katherine': ['kate', 'katie', 'kat'],
+    'kathleen': ['kate', 'kathy', 'katie'],
+    'christina': ['chris', 'christy'],
+    'amanda': ['mandy', 'mandi'],
+}
+
+# Nickname -> formal names it may stand for
+FORMAL_NAMES: Dict[str, List[str]] = defaultdict(list)
+for _formal, _nicks in NICKNAMES.items():
+    for _nick in _nicks:
+        FORMAL_NAMES[_nick].append(_formal)
+
+# A match needs at least this much first-name and last-name similarity, whatever the total
+FIRST_NAME_MIN = 0.65
+LAST_NAME_MIN = 0.8
+# Weight of the first name in the score (last names are more distinctive)
+FIRST_NAME_WEIGHT = 0.4
+
+_SOUNDEX_CODES = {
+    char: digit
+    for letters, digit in (("bfpv", "1"), ("cgjkqsxz", "2"), ("dt", "3"), ("l", "4"), ("mn", "5"), ("r", "6"))
+    for char in letters
+}
+
+
+def name_tokens(name: str) -> Tuple[str, ...]:
+    """
+    Lowercase ASCII name parts in first-to-last order, without duplicates.
+
+    "Feder, AJ" becomes ("aj", "feder"); hyphens, periods and accents are dropped.
+    """
+    if not name:
+        return ()
+    text = unicodedata.normalize("NFKD", str(name))
+    text = "".join(char for char in text if not unicodedata.combining(char)).lower()
+    parts = text.split(",")
+    if len(parts) == 2 and parts[0].strip() and parts[1].strip():
+        text = f"{parts[1]} {parts[0]}"
+    tokens = []
+    for token in re.split(r"[^a-z0-9']+", text):
+        token = token.strip("'")
+        if token and token not in tokens:
+            tokens.append(token)
+    return tuple(tokens)
+
+
+def soundex(token: str) -> str:
+    """American Soundex code of a name part ("" for no letters)."""
+    letters = [char for char in token.lower() if "a" <= char <= "z"]
+    if not letters:
+        return ""
+    code = letters[0].upper()
+    previous = _SOUNDEX_CODES.get(letters[0], "")
+    for char in letters[1:]:
+        digit = _SOUNDEX_CODES.get(char, "")
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        if char not in "hw":
+            previous = digit
+    return code.ljust(4, "0")
+
+
+def nickname_match(name1: str, name2: str) -> bool:
+    """Check whether any part of one name is a known nickname of any part of the other."""
+    for part1 in name1.lower().split():
+        for part2 in name2.lower().split():
+            if part2 in NICKNAMES.get(part1, ()) or part1 in NICKNAMES.get(part2, ()):
+                return True
+    return False
+
+
+def _ratio(a: str, b: str) -> float:
+    # Order the pair so the score doesn't depend on argument order
+    if a > b:
+        a, b = b, a
+    return _ordered_ratio(a, b)
+
+
+@lru_cache(maxsize=65536)
+def _ordered_ratio(a: str, b: str) -> float:
+    # Name parts repeat a lot (first names especially), so pairs are memoized
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def _first_name_score(a: str, b: str) -> float:
+    if a == b or b in NICKNAMES.get(a, ()) or a in NICKNAMES.get(b, ()):
+        return 1.0
+    shorter, longer = sorted((a, b), key=len)
+    if len(shorter) >= 3 and longer.startswith(shorter):
+        return 1.0
+    return _ratio(a, b)
+
+
+def _last_name_score(tokens_a: Tuple[str, ...], tokens_b: Tuple[str, ...]) -> float:
+    # Each last name against every non-first part of the other (middle names, double-barrelled surnames)
+    scores = [_ratio(tokens_a[-1], part) for part in tokens_b[1:]]
+    scores += [_ratio(tokens_b[-1], part) for part in tokens_a[1:]]
+    return max(scores)
+
+
+def _oriented_score(tokens_a: Tuple[str, ...], tokens_b: Tuple[str, ...]) -> float:
+    last = _last_name_score(tokens_a, tokens_b)
+    if last < LAST_NAME_MIN:
+        return 0.0
+    first = _first_name_score(tokens_a[0], tokens_b[0])
+    if first < FIRST_NAME_MIN:
+        return 0.0
+    return FIRST_NAME_WEIGHT * first + (1 - FIRST_NAME_WEIGHT) * last
+
+
+def token_similarity(tokens_a: Tuple[str, ...], tokens_b: Tuple[str, ...]) -> float:
+    """Similarity (0-1) of two tokenized names; see name_similarity."""
+    if not tokens_a or not tokens_b:
+        return 0.0
+    if set(tokens_a) == set(tokens_b) or "".join(tokens_a) == "".join(tokens_b):
+        return 1.0
+    if len(tokens_a) == 1 or len(tokens_b) == 1:
+        # Usernames / single names: plain string similarity
+        return _ratio("".join(tokens_a), "".join(tokens_b))
+    # Also try the other name in last-first order
+    return max(_oriented_score(tokens_a, tokens_b), _oriented_score(tokens_a, tokens_b[::-1]))
+
+
+def name_similarity(name1: str, name2: str) -> float:
+    """
+    Similarity (0-1) of two person names.
+
+    1.0 for the same parts in any order or spacing; otherwise a weighted mix of
+    first-name and last-name similarity, or 0.0 if either is too different.
+    """
+    return token_similarity(name_tokens(name1), name_tokens(name2))
+
+
+def blocking_keys(tokens: Tuple[str, ...]) -> set:
+    """
+    Keys under which a name is filed; names sharing no key are never compared.
+
+    Each part's Soundex code is paired with the initial of every other part (and of
+    the formal name behind a nickname), so "Tony Roman" and "Anthony Roman" meet
+    under (R550, "a") while people who merely share a first name don't.
+    """
+    keys = {("solo", soundex("".join(tokens)))}
+    for i, token in enumerate(tokens):
+        code = soundex(token)
+        for j, other in enumerate(tokens):
+            if i != j:
+                keys.add((code, other[0]))
+                keys.update((code, formal[0]) for formal in FORMAL_NAMES.get(other, ()))
+    return keys
+
+
+class ScoreCache:
+    """
+    Pair scores persisted as JSON between runs.
+    """
+
+    def __init__(self, path: Optional[Path]):
+        self.path = Path(path) if path else None
+        self.scores: Dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        if self.path and self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if data.get("version") == SCORER_VERSION:
+                    self.scores = data.get("scores", {})
+            except (OSError, ValueError) as e:
+                print(f"Warning: ignoring unreadable name match cache {self.path}: {e}")
+
+    def score(self, tokens_a: Tuple[str, ...], tokens_b: Tuple[str, ...]) -> float:
+        key = "\t".join(sorted((" ".join(tokens_a), " ".join(tokens_b))))
+        score = self.scores.get(key)
+        if score is not None:
+            self.hits += 1
+            return score
+        self.misses += 1
+        score = self.scores[key] = token_similarity(tokens_a, tokens_b)
+        self._dirty = True
+        return score
+
+    def save(self):
+        """Write the cache atomically (no-op without a path or new scores)."""
+        if not self.path or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            # dumps() uses the C encoder, dump() doesn't (matters for large caches)
+            f.write(json.dumps({"version": SCORER_VERSION, "scores": self.scores}, separators=(",", ":")))
+        os.replace(tmp_name, self.path)
+        self._dirty = False
+
+
+class NameMatcher:
+    """
+    Insertion-ordered set of names with blocked fuzzy lookups.
+    """
+
+    def __init__(self, names: Iterable[str] = (), threshold: float = 0.8, cache_path: Optional[Path] = None):
+        """
+        Initialize the matcher.
+
+        Args:
+            names: Initial names (more can be added with add())
+            threshold: Minimum similarity (0-1) for match() to return a name
+            cache_path: Optional JSON file for pair scores shared across runs
+        """
+        self.threshold = threshold
+        self.cache = ScoreCache(cache_path)
+        self._names: List[str] = []
+        self._tokens: List[Tuple[str, ...]] = []
+        self._exact: Dict[Tuple[str, ...], int] = {}
+        self._blocks: Dict[tuple, List[int]] = defaultdict(list)
+        for name in names:
+            self.add(name)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, name: str):
+        """Add a name (names that normalize to an existing one are ignored)."""
+        tokens = name_tokens(name)
+        if not tokens or tokens in self._exact:
+            return
+        position = len(self._names)
+        self._names.append(name)
+        self._tokens.append(tokens)
+        self._exact[tokens] = position
+        for key in blocking_keys(tokens):
+            self._blocks[key].append(position)
+
+    def candidates(self, name: str) -> List[str]:
+        """Names sharing a blocking key with name, in insertion order."""
+        return [self._names[p] for p in self._candidate_positions(name_tokens(name))]
+
+    def _candidate_positions(self, tokens: Tuple[str, ...]) -> List[int]:
+        positions = set()
+        for key in blocking_keys(tokens):
+            positions.update(self._blocks.get(key, ()))
+        return sorted(positions)
+
+    def match(self, name: str) -> Tuple[Optional[str], float]:
+        """
+        Best matching name and its score.
+
+        Returns:
+            (name, score) for the highest score at or above the threshold (the
+            earliest added name wins ties), otherwise (None, best score seen)
+        """
+        tokens = name_tokens(name)
+        if not tokens:
+            return None, 0.0
+        exact = self._exact.get(tokens)
+        if exact is not None:
+            return self._names[exact], 1.0
+        best_position, best_score = None, 0.0
+        for position in self._candidate_positions(tokens):
+            score = self.cache.score(tokens, self._tokens[position])
+            if score > best_score:
+                best_position, best_score = position, score
+        if best_position is None or best_score < self.threshold:
+            return None, best_score
+        return self._names[best_position], best_score
+
+    def best_match(self, name: str) -> Optional[str]:
+        """Best matching name at or above the threshold, or None."""
+        return self.match(name)[0]
+
+    def save_cache(self):
+        """Persist new pair scores (if a cache path was given)."""
+        self.cache.save()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Sharded, minified and content-hashed website data.
+
+employees.json is a single pretty-printed file the browser has to download in
+full before the directory can render. ``write_site_data`` writes the same
+employees to docs/assets/site_data/ as:
+
+- index.<hash>.json: one compact entry per employee (name, title, office,
+  thumbnail and the path of its detail shard), enough to render the grid
+- employees/<slug>.<hash>.json: the full record of one employee, loaded when
+  its card scrolls into view
+- employees.<hash>.json: every full record, minified (loaded only once search
+  or the project filter needs bios, projects, education...)
+- manifest.json: the only file without a hash; points at the current index
+  and full file
+
+Files are minified and named after a hash of their content, so browsers and
+CDNs can cache them forever and a changed employee only changes its own shard
+(plus the index and full file). No compressed copies are written: GitHub Pages
+compresses responses itself and never serves pre-compressed siblings, and
+compressed files don't delta-compress in git history. Files no longer
+referenced by the manifest are removed. After an incremental merge only the
+changed employees' shards are re-serialized.
+
+Standard library only.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import unicodedata
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+
+SITE_DATA_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+# Hex digits of the SHA-256 content hash kept in file names
+HASH_LENGTH = 10
+
+
+def minified_json(data) -> bytes:
+    """UTF-8 JSON without indentation or spaces after separators."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def content_hash(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()[:HASH_LENGTH]
+
+
+def employee_slug(name: str) -> str:
+    """File-name-safe ASCII form of a name ("Zoë O'Neil" -> "zoe-o-neil")."""
+    text = unicodedata.normalize("NFKD", str(name or ""))
+    text = "".join(char for char in text if not unicodedata.combining(char)).lower()
+    return re.sub(r"[^a-z0-9]+", "-", text).strip("-") or "employee"
+
+
+def thumbnail(employee: dict) -> str:
+    """Smallest image for the grid: first JPEG srcset candidate, else the local or remote image."""
+    srcset = employee.get("image_srcset") or {}
+    candidates = srcset.get("jpeg") if isinstance(srcset, dict) else None
+    if candidates:
+        return candidates.split(",")[0].strip().split(" ")[0]
+    return employee.get("image_local_path") or employee.get("image_url") or ""
+
+
+def index_entry(employee: dict, detail_path: str) -> dict:
+    """Compact grid entry for an employee; the UI fills in the rest from detail_path."""
+    return {
+        "human_name": employee.get("human_name"),
+        "position": employee.get("position") or employee.get("title") or "",
+        "office_location": employee.get("office_location") or "",
+        "thumb": thumbnail(employee),
+        "detail": detail_path,
+    }
+
+
+class SiteDataWriter:
+    """
+    Writes content-hashed files under one directory.
+    """
+
+    def __init__(self, out_dir: Path):
+        self.out_dir = Path(out_dir)
+        # Relative POSIX paths of the files already there (listed once instead of a stat per file)
+        self.existing: Set[str] = set()
+        for directory, _, file_names in os.walk(self.out_dir):
+            prefix = Path(directory).relative_to(self.out_dir).as_posix()
+            self.existing.update(name if prefix == "." else f"{prefix}/{name}" for name in file_names)
+        self.written: Set[str] = set()
+        self.new_files = 0
+
+    def write(self, stem: str, data) -> str:
+        """
+        Write data as <stem>.<hash>.json and return its path relative to out_dir.
+
+        Files that already exist under the same name have the same content and are
+        left alone, so unchanged shards keep their timestamps.
+        """
+        payload = minified_json(data)
+        relative = f"{stem}.{content_hash(payload)}.json"
+        self.written.add(relative)
+        if relative not in self.existing:
+            path = self.out_dir / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(payload)
+            self.new_files += 1
+        return relative
+
+    def keep(self, relative: str) -> bool:
+        """Keep a file from an earlier run; False if it's missing."""
+        if relative not in self.existing:
+            return False
+        self.written.add(relative)
+        return True
+
+    def write_manifest(self, manifest: dict):
+        """Write manifest.json (unhashed, replaced atomically so readers never see half a file)."""
+        path = self.out_dir / MANIFEST_NAME
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_name, path)
+        self.written.add(MANIFEST_NAME)
+
+    def size_of(self, relative: str) -> Dict[str, int]:
+        """Size in bytes of a written file, and roughly what it transfers as (gzip, as Pages serves it)."""
+        payload = (self.out_dir / relative).read_bytes()
+        return {"raw": len(payload), "gzip": len(gzip.compress(payload, 6, mtime=0))}
+
+    def prune(self) -> int:
+        """Delete files (and then empty directories) that this run didn't write; returns the file count."""
+        stale = self.existing - self.written
+        for relative in stale:
+            (self.out_dir / relative).unlink()
+        for directory, _, _ in sorted(os.walk(self.out_dir), reverse=True):
+            if directory != str(self.out_dir) and not os.listdir(directory):
+                os.rmdir(directory)
+        return len(stale)
+
+
+def _previous_details(out_dir: Path) -> Dict[str, str]:
+    """human_name -> detail shard path from the index the current manifest points at."""
+    try:
+        manifest = json.loads((out_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+        index = json.loads((out_dir / manifest["index"]).read_text(encoding="utf-8"))
+        return {entry["human_name"]: entry["detail"] for entry in index["employees"] if entry.get("human_name")}
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+
+def write_site_data(employees: Dict[str, dict], out_dir: Path, changed: Optional[Set[str]] = None) -> dict:
+    """
+    Write the sharded site data for the merged employees.
+
+    Args:
+        employees: Merged employees keyed by human_name (as in employees.json)
+        out_dir: Directory dedicated to the site data (stale files in it are deleted)
+        changed: Keys of the employees that may differ from the last run; the others
+            keep their detail shards without re-serializing them (None = all changed)
+
+    Returns:
+        The manifest, with a "stats" entry added for reporting (not written to disk)
+    """
+    writer = SiteDataWriter(out_dir)
+    previous_details = _previous_details(writer.out_dir) if changed is not None else {}
+    used_slugs: Dict[str, int] = {}
+    index = []
+    for name, employee in employees.items():
+        slug = employee_slug(employee.get("human_name") or name)
+        # Two people whose names reduce to the same slug still get separate shards
+        used_slugs[slug] = used_slugs.get(slug, 0) + 1
+        if used_slugs[slug] > 1:
+            slug = f"{slug}-{used_slugs[slug]}"
+        detail = None if changed is None or name in changed else previous_details.get(employee.get("human_name"))
+        if detail and detail.startswith(f"employees/{slug}.") and writer.keep(detail):
+            index.append(index_entry(employee, detail))
+            continue
+        detail = writer.write(f"employees/{slug}", employee)
+        index.append(index_entry(employee, detail))
+
+    manifest = {
+        "version": SITE_DATA_VERSION,
+        "employee_count": len(index),
+        "index": writer.write("index", {"version": SITE_DATA_VERSION, "employees": index}),
+        "employees": writer.write("employees", employees),
+    }
+    writer.write_manifest(manifest)
+    removed = writer.prune()
+    return {**manifest, "stats": {
+        "new_files": writer.new_files,
+        "removed_files": removed,
+        "index_sizes": writer.size_of(manifest["index"]),
+        "employees_sizes": writer.size_of(manifest["employees"]),
+    }}
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Incremental merge vs --full rebuild.
+
+Each test builds a small synthetic tree with benchmark_merge.build_dataset, runs
+a full merge to leave a manifest behind, changes the sources and checks that
+the incremental run writes exactly the employees.json a --full rebuild writes.
+
+pytest does not look inside .github/ by default, so run it explicitly:
+    python -m pytest .github/scripts
+"""
+
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from benchmark_merge import (HELPER_MODULES, MERGE_OUTPUT, SCRIPT_NAME, _individual_computer,  # noqa: E402
+                             build_dataset)
+
+
+def _merge(root: Path, *args: str) -> tuple:
+    """Run the merge script copied into root; returns (stdout, employees.json bytes)."""
+    result = subprocess.run([sys.executable, str(root / ".github" / "scripts" / SCRIPT_NAME), *args],
+                            capture_output=True, text=True, encoding="utf-8",
+                            env={**os.environ, "NAME_MATCH_CACHE": str(root / ".cache" / "name_match_cache.json"),
+                                 "MERGE_MANIFEST": str(root / ".cache" / "merge_manifest.json")})
+    return result.stdout, (root / MERGE_OUTPUT).read_bytes()
+
+
+@pytest.fixture
+def merged_tree(tmp_path):
+    """A synthetic tree that has been merged once (so it has a manifest and an output)."""
+    build_dataset(tmp_path, employees=60, seed=11)
+    scripts_dir = tmp_path / ".github" / "scripts"
+    scripts_dir.mkdir(parents=True)
+    for name in (SCRIPT_NAME, *HELPER_MODULES):
+        shutil.copyfile(SCRIPTS_DIR / name, scripts_dir / name)
+    stdout, _ = _merge(tmp_path)
+    assert "Full merge" in stdout
+    return tmp_path
+
+
+def _assert_incremental_matches_full(root: Path, expected_mode: str):
+    incremental_stdout, incremental = _merge(root)
+    assert expected_mode in incremental_stdout
+    _, full = _merge(root, "--full")
+    assert incremental == full
+
+
+def _employee_files(root: Path) -> list:
+    return sorted((root / "docs" / "assets" / "individual_employees").glob("*.json"))
+
+
+def test_deleted_source(merged_tree):
+    _employee_files(merged_tree)[3].unlink()
+    next((merged_tree / "docs" / "assets" / "individual_computer_data").glob("*.json")).unlink()
+    _assert_incremental_matches_full(merged_tree, "Incremental merge")
+
+
+def test_changed_source(merged_tree):
+    path = _employee_files(merged_tree)[5]
+    record = json.loads(path.read_text(encoding="utf-8"))
+    record["position"] = "Senior " + record["position"]
+    record["office_location"] = "Shanghai"
+    path.write_text(json.dumps(record), encoding="utf-8")
+    _assert_incremental_matches_full(merged_tree, "Incremental merge")
+
+
+def test_new_computer_only_person(merged_tree):
+    name = "Zeyi Quinterberg"
+    computers_dir = merged_tree / "docs" / "assets" / "individual_computer_data"
+    (computers_dir / f"{name.replace(' ', '_')}_computer_info.json").write_text(
+        json.dumps(_individual_computer(random.Random(3), name)), encoding="utf-8")
+    _assert_incremental_matches_full(merged_tree, "Incremental merge")
+    assert name in json.loads((merged_tree / MERGE_OUTPUT).read_text(encoding="utf-8"))
+
+
+def test_output_differs_from_manifest(merged_tree):
+    # employees.json edited after the last merge (e.g. an older copy pulled back in)
+    output = merged_tree / MERGE_OUTPUT
+    employees = json.loads(output.read_text(encoding="utf-8"))
+    employees.pop(next(iter(employees)))
+    output.write_text(json.dumps(employees, indent=2), encoding="utf-8")
+    path = _employee_files(merged_tree)[7]
+    record = json.loads(path.read_text(encoding="utf-8"))
+    record["position"] = "Principal"
+    path.write_text(json.dumps(record), encoding="utf-8")
+    _assert_incremental_matches_full(merged_tree, "differs from the last merge")
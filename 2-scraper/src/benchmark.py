@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for the extraction pipeline.
+
+Replays a recording made with ``python -m src.main --record <dir>`` through the
+full scraper (directory discovery, profile extraction, JSON writes) without the
+intranet, then reports profiles/sec and per-stage timings and checks that the
+replayed EmployeeData matches the recorded run.
+
+Usage Examples:
+    # Record a small live run (signed in as usual)
+    python -m src.main --limit 25 --record debug/recordings/sample
+
+    # Replay it three times on 4 pages
+    python -m src.benchmark debug/recordings/sample --workers 4 --repeat 3
+
+    # Compare against per-section extraction
+    python -m src.benchmark debug/recordings/sample --no-bundle
+
+Exits with status 1 if any replayed employee differs from the recording.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from .config.settings import ScraperConfig
+from .core.unified_scraper import UnifiedEmployeeScraper
+from .services.replay import ReplayServer
+
+
+def build_config(recording_dir: Path, args) -> ScraperConfig:
+    """Configuration for a replayed run: offline, no images, output kept inside the recording."""
+    config = ScraperConfig.from_env()
+    output_dir = recording_dir / "replay_output"
+    config.REPLAY_DIR = str(recording_dir)
+    config.HEADLESS = True
+    config.DOWNLOAD_IMAGES = False
+    config.SESSION_CACHE = False
+    config.INCREMENTAL = False
+    config.RESUME = False
+    config.DOM_CAPTURE = False
+    config.DEBUG_MODE = False
+    config.LIMIT = None
+    config.EXTRACTION_BUNDLE = not args.no_bundle
+    config.MAX_CONCURRENT_PAGES = args.workers or config.MAX_CONCURRENT_PAGES
+    config.DEBUG_DIR = str(output_dir / "debug")
+    config.LOG_FILE = str(output_dir / "debug" / "scraper.log")
+    return config
+
+
+async def run_once(config: ScraperConfig):
+    """Replay the recording once; returns (employees, elapsed seconds, stage statistics)."""
+    scraper = UnifiedEmployeeScraper(download_images=False, headless=True, timeout=config.TIMEOUT, config=config)
+    async with scraper:
+        started = time.perf_counter()
+        # The pipeline prints every extracted profile; keep the benchmark output readable
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            employees = await scraper.scrape_all_employees()
+        elapsed = time.perf_counter() - started
+    return employees, elapsed, scraper.perf
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the scraper against a recorded session")
+    parser.add_argument("recording", type=str, help="Recording directory written by --record")
+    parser.add_argument("--workers", type=int, default=None, help="Number of concurrent profile pages")
+    parser.add_argument("--repeat", type=int, default=1, help="Number of replays (best and median are reported)")
+    parser.add_argument("--no-bundle", action="store_true", help="Extract each profile section with its own evaluate call")
+    parser.add_argument("--json-out", type=str, default=None, help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    recording_dir = Path(args.recording)
+    config = build_config(recording_dir, args)
+    Path(config.DEBUG_DIR).mkdir(parents=True, exist_ok=True)
+    logging.basicConfig(filename=config.LOG_FILE, level=logging.INFO, format=config.LOG_FORMAT, force=True)
+
+    replay = ReplayServer(recording_dir)
+    print(f"🎬 Replaying {recording_dir} (recorded {replay.recorded_at}, "
+          f"{len(replay.expected_employees)} employees, {config.MAX_CONCURRENT_PAGES} page(s))")
+
+    rates = []
+    mismatched = False
+    for run in range(1, max(1, args.repeat) + 1):
+        employees, elapsed, perf = await run_once(config)
+        rate = len(employees) / elapsed if elapsed else 0.0
+        rates.append(rate)
+        missing, unexpected, different = replay.compare([employee.to_dict() for employee in employees])
+        identical = not (missing or unexpected or different)
+        mismatched = mismatched or not identical
+        print(f"⏱️ Run {run}: {len(employees)} profiles in {elapsed:.2f}s ({rate:.2f} profiles/sec) - "
+              f"{'output identical' if identical else 'OUTPUT DIFFERS'}")
+        if not identical:
+            print(f"   missing: {missing[:5]}, unexpected: {unexpected[:5]}, different: {different[:5]}")
+
+    print(f"\n📊 Profiles/sec: best {max(rates):.2f}, median {statistics.median(rates):.2f}")
+    print("\n⏱️ Stage timings (last run):")
+    print(perf.format_stage_table())
+
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump({
+                "recording": str(recording_dir),
+                "workers": config.MAX_CONCURRENT_PAGES,
+                "extraction_bundle": config.EXTRACTION_BUNDLE,
+                "profiles_per_sec": rates,
+                "stage_statistics": perf.get_stage_statistics(),
+                "identical_output": not mismatched,
+            }, f, indent=2)
+        print(f"\n💾 Results written to {args.json_out}")
+
+    return 1 if mismatched else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
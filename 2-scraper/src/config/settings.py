@@ -23,6 +23,56 @@ class ScraperConfig:
     DOWNLOAD_IMAGES = True
     IMAGE_DOWNLOAD_DIR = "docs/assets/images"  # Keep in docs/assets for GitHub Pages
     MAX_CONCURRENT_DOWNLOADS = 5
+    BACKGROUND_IMAGE_DOWNLOADS = True  # Download images while profiles are still being scraped
+    IMAGE_DERIVATIVES = True  # Thumbnail/profile sizes in AVIF/WebP/JPEG (needs Pillow)
+    
+    # Profile scraping pool - number of pages sharing the authenticated context
+    MAX_CONCURRENT_PAGES = 4
+    JSON_WRITER_THREADS = 4  # Threads writing individual employee JSON files
+    
+    # Incremental mode - skip profiles whose directory card is unchanged
+    INCREMENTAL = False
+    INCREMENTAL_TTL_DAYS = 28  # Refresh every profile at least this often
+    
+    # Encrypted browser session cache (skips the Microsoft sign-in while valid)
+    SESSION_CACHE = True
+    # 0 = no age limit: expired cookies are dropped and a session the site rejects is
+    # discarded. A limit must exceed the time between runs (a week in CI) to be useful
+    SESSION_MAX_AGE_HOURS = 0
+    
+    # Resume an interrupted run from debug/scrape_checkpoint.jsonl
+    RESUME = False
+    
+    # Profile extraction - "dom" renders each profile, "api" maps the site's JSON (DOM fallback)
+    EXTRACTION_MODE = "dom"
+    
+    # Single-pass in-page extraction (one evaluate per profile); validation re-runs
+    # the per-section scripts and logs any difference
+    EXTRACTION_BUNDLE = True
+    VALIDATE_EXTRACTION_BUNDLE = False
+    
+    # Readiness detection - waits end once the DOM and XHRs are quiet this long
+    READINESS_QUIET_MS = 500
+    READINESS_TIMEOUT = 10.0  # Upper bound (seconds) for a single wait
+    
+    # "Show All" projects grid - pages/scroll windows per profile, and how many consecutive
+    # projects known from the previous scrape end the walk early (0 = always read the whole grid).
+    # Early stops assume the grid lists newest projects first (unconfirmed), so they're off by
+    # default; when on, every profile still gets a full walk once per GRID_FULL_WALK_WEEKS weeks
+    GRID_MAX_CHUNKS = 100
+    GRID_STOP_AFTER_KNOWN = 0
+    GRID_FULL_WALK_WEEKS = 4
+    
+    # Resource blocking during profile extraction (profile photos stay allowed)
+    BLOCK_RESOURCES = True
+    # Not 'stylesheet': without the theme CSS the projects grid loses its scroll container
+    BLOCKED_RESOURCE_TYPES = ['image', 'media', 'font']
+    BLOCK_THIRD_PARTY = True
+    RESOURCE_ALLOW_PATTERNS = ['/api/image/']
+    
+    # Offline benchmarking - record responses to RECORD_DIR, or serve REPLAY_DIR instead of the site
+    RECORD_DIR: str | None = None
+    REPLAY_DIR: str | None = None
     
     # Output settings - use absolute paths relative to project root
     # HTML (index.html) remains at OUTPUT_DIR (repo root)
@@ -83,10 +133,27 @@ class ScraperConfig:
         config.BASE_URL = os.getenv('SCRAPER_BASE_URL', config.BASE_URL)
         config.HEADLESS = os.getenv('SCRAPER_HEADLESS', 'true').lower() == 'true'
         config.DOWNLOAD_IMAGES = os.getenv('SCRAPER_DOWNLOAD_IMAGES', 'true').lower() == 'true'
+        config.IMAGE_DERIVATIVES = os.getenv('SCRAPER_IMAGE_DERIVATIVES', 'true').lower() == 'true'
         config.OUTPUT_DIR = os.getenv('SCRAPER_OUTPUT_DIR', config.OUTPUT_DIR)
         config.ASSETS_DIR = os.getenv('SCRAPER_ASSETS_DIR', config.ASSETS_DIR)
         config.DEBUG_DIR = os.getenv('SCRAPER_DEBUG_DIR', config.DEBUG_DIR)
         config.LOG_LEVEL = os.getenv('SCRAPER_LOG_LEVEL', config.LOG_LEVEL)
+        config.MAX_CONCURRENT_PAGES = int(os.getenv('SCRAPER_MAX_CONCURRENT_PAGES', config.MAX_CONCURRENT_PAGES))
+        config.JSON_WRITER_THREADS = int(os.getenv('SCRAPER_JSON_WRITER_THREADS', config.JSON_WRITER_THREADS))
+        config.INCREMENTAL = os.getenv('SCRAPER_INCREMENTAL', 'false').lower() == 'true'
+        config.INCREMENTAL_TTL_DAYS = int(os.getenv('SCRAPER_INCREMENTAL_TTL_DAYS', config.INCREMENTAL_TTL_DAYS))
+        config.SESSION_CACHE = os.getenv('SCRAPER_SESSION_CACHE', 'true').lower() == 'true'
+        config.SESSION_MAX_AGE_HOURS = int(os.getenv('SCRAPER_SESSION_MAX_AGE_HOURS', config.SESSION_MAX_AGE_HOURS))
+        config.RESUME = os.getenv('SCRAPER_RESUME', 'false').lower() == 'true'
+        config.EXTRACTION_MODE = os.getenv('SCRAPER_EXTRACTION_MODE', config.EXTRACTION_MODE).lower()
+        config.EXTRACTION_BUNDLE = os.getenv('SCRAPER_EXTRACTION_BUNDLE', 'true').lower() == 'true'
+        config.VALIDATE_EXTRACTION_BUNDLE = os.getenv('SCRAPER_VALIDATE_EXTRACTION_BUNDLE', 'false').lower() == 'true'
+        config.GRID_STOP_AFTER_KNOWN = int(os.getenv('SCRAPER_GRID_STOP_AFTER_KNOWN', config.GRID_STOP_AFTER_KNOWN))
+        config.GRID_FULL_WALK_WEEKS = int(os.getenv('SCRAPER_GRID_FULL_WALK_WEEKS', config.GRID_FULL_WALK_WEEKS))
+        config.BLOCK_RESOURCES = os.getenv('SCRAPER_BLOCK_RESOURCES', 'true').lower() == 'true'
+        if os.getenv('SCRAPER_BLOCKED_RESOURCE_TYPES') is not None:
+            config.BLOCKED_RESOURCE_TYPES = [t.strip() for t in os.getenv('SCRAPER_BLOCKED_RESOURCE_TYPES').split(',') if t.strip()]
+        config.BLOCK_THIRD_PARTY = os.getenv('SCRAPER_BLOCK_THIRD_PARTY', 'true').lower() == 'true'
         
         return config
     
@@ -1,13 +1,93 @@
 """
 Employee data model for JSON serialization.
+
+``EmployeeData`` is a slotted dataclass with a hand-written ``to_dict`` /
+``from_dict`` (``dataclasses.asdict`` deep-copies every value through
+``copy.deepcopy`` and dominated load/save time). Records carry a
+``schema_version``; keys this version doesn't know are kept in
+``extra_fields`` and written back unchanged, so files produced by a newer
+scraper survive a round trip through an older one.
+
+``dumps_json`` / ``loads_json`` use orjson or msgspec when installed and fall
+back to the standard library with identical output.
+
+Run ``python -m src.core.models`` to benchmark loading the published profiles
+and computer data.
 """
-from dataclasses import dataclass, asdict, field
-from typing import Optional, Dict, Any, List
+from dataclasses import dataclass, field, fields
+from typing import Optional, Dict, Any, List, Union
 import json
 from datetime import datetime
 
+# Optional fast JSON backends (output is byte-identical to json.dumps(indent=2, ensure_ascii=False))
+try:
+    import orjson
+    JSON_BACKEND = "orjson"
+except ImportError:
+    orjson = None
+    try:
+        import msgspec
+        JSON_BACKEND = "msgspec"
+    except ImportError:
+        msgspec = None
+        JSON_BACKEND = "json"
+
+
+# Bump when a field is renamed or changes meaning, and teach _upgrade() the old layout
+SCHEMA_VERSION = 2
+
+
+def dumps_json(data: Any, indent: bool = True) -> bytes:
+    """
+    Serialize data to UTF-8 JSON with the fastest available backend.
+
+    Args:
+        data: JSON-compatible data (other values are converted with str())
+        indent: Two-space indentation, as used for the files under docs/
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if JSON_BACKEND == "orjson":
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            # Non-string keys or integers beyond 64 bits - let the standard library handle them
+            pass
+    elif JSON_BACKEND == "msgspec":
+        try:
+            encoded = msgspec.json.encode(data, enc_hook=str)
+            return msgspec.json.format(encoded, indent=2) if indent else encoded
+        except (TypeError, msgspec.EncodeError):
+            pass
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def loads_json(payload: Union[bytes, str]) -> Any:
+    """Parse JSON bytes or text with the fastest available backend."""
+    if JSON_BACKEND == "orjson":
+        return orjson.loads(payload)
+    if JSON_BACKEND == "msgspec":
+        try:
+            return msgspec.json.decode(payload)
+        except msgspec.DecodeError as e:
+            # Callers expect the ValueError raised by json / orjson
+            raise ValueError(str(e)) from e
+    return json.loads(payload)
+
+
+def _copy_json(value: Any) -> Any:
+    """Copy the dict/list structure of a JSON value (leaves are immutable and shared)."""
+    if isinstance(value, dict):
+        return {k: _copy_json(v) if isinstance(v, (dict, list)) else v for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(v) if isinstance(v, (dict, list)) else v for v in value]
+    return value
+
 
-@dataclass
+@dataclass(slots=True)
 class EmployeeData:
     """
     Data class representing an employee's information.
@@ -27,6 +107,7 @@ class EmployeeData:
     profile_url: Optional[str] = None
     image_url: Optional[str] = None
     image_local_path: Optional[str] = None
+    image_srcset: Dict[str, str] = field(default_factory=dict)  # format -> srcset of derived sizes
     
     # Professional information
     position: Optional[str] = None
@@ -59,8 +140,10 @@ class EmployeeData:
     # Scraping metadata
     scraped_at: Optional[str] = None
     profile_id: Optional[str] = None
+    schema_version: int = SCHEMA_VERSION
     
- 
+    # Keys from the source record this schema doesn't know (written back by to_dict)
+    extra_fields: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
     
     def __post_init__(self):
         """Set default values after initialization."""
@@ -68,22 +151,46 @@ class EmployeeData:
             self.scraped_at = datetime.now().isoformat()
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert the employee data to a dictionary."""
-        return asdict(self)
+        """Convert the employee data to a dictionary (same layout as dataclasses.asdict)."""
+        data = {}
+        for name in _SERIALIZED_FIELDS:
+            value = getattr(self, name)
+            data[name] = _copy_json(value) if isinstance(value, (dict, list)) else value
+        if self.extra_fields:
+            for key, value in self.extra_fields.items():
+                data.setdefault(key, _copy_json(value))
+        return data
     
     def to_json(self, indent: int = 2) -> str:
         """Convert the employee data to a JSON string."""
         return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
     
+    def to_json_bytes(self) -> bytes:
+        """Convert the employee data to indented UTF-8 JSON with the fastest available backend."""
+        return dumps_json(self.to_dict())
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'EmployeeData':
-        """Create an EmployeeData instance from a dictionary."""
-        return cls(**data)
+        """
+        Create an EmployeeData instance from a dictionary.
+        
+        Records from older schema versions are upgraded; unknown keys are kept
+        in extra_fields instead of raising TypeError.
+        """
+        data = _upgrade(data)
+        known = {}
+        extra = {}
+        for key, value in data.items():
+            if key in _INIT_FIELDS:
+                known[key] = value
+            else:
+                extra[key] = value
+        return cls(extra_fields=extra or None, **known)
     
     @classmethod
-    def from_json(cls, json_str: str) -> 'EmployeeData':
+    def from_json(cls, json_str: Union[str, bytes]) -> 'EmployeeData':
         """Create an EmployeeData instance from a JSON string."""
-        data = json.loads(json_str)
+        data = loads_json(json_str)
         return cls.from_dict(data)
     
     def is_valid(self) -> bool:
@@ -120,3 +227,82 @@ class EmployeeData:
     def __repr__(self) -> str:
         """Detailed representation of the employee data."""
         return f"EmployeeData(human_name='{self.human_name}', email='{self.email}', profile_url='{self.profile_url}')"
+
+
+_SERIALIZED_FIELDS = tuple(f.name for f in fields(EmployeeData) if f.name != 'extra_fields')
+_INIT_FIELDS = frozenset(_SERIALIZED_FIELDS)
+
+
+def _upgrade(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Bring a record written by an older schema version up to SCHEMA_VERSION."""
+    version = data.get('schema_version') or 1
+    if version >= SCHEMA_VERSION:
+        # Current, or written by a newer scraper (its extra keys are preserved as-is)
+        return data
+    # Version 1 had no schema_version key; its fields are a subset of version 2
+    return {**data, 'schema_version': SCHEMA_VERSION}
+
+
+def _benchmark(assets_dir: Optional[str] = None, repeat: int = 20):
+    """Compare the asdict-based model with this one on the published profiles and computer data."""
+    import dataclasses
+    import time
+    import tracemalloc
+    from pathlib import Path
+
+    assets = Path(assets_dir) if assets_dir else Path(__file__).resolve().parents[3] / "docs" / "assets"
+    profiles = [p.read_bytes() for p in sorted((assets / "individual_employees").glob("*.json"))]
+    computers = [p.read_bytes() for p in sorted((assets / "individual_computer_data").glob("*.json"))]
+    print(f"Loaded {len(profiles)} profiles and {len(computers)} computer records from {assets} "
+          f"(JSON backend: {JSON_BACKEND})")
+
+    # The previous model: a regular dataclass serialized with dataclasses.asdict
+    legacy_fields = []
+    for f in fields(EmployeeData):
+        if f.name != 'extra_fields':
+            legacy_fields.append((f.name, f.type, field(default=f.default, default_factory=f.default_factory)))
+    LegacyEmployeeData = dataclasses.make_dataclass("LegacyEmployeeData", legacy_fields)
+
+    def run_legacy():
+        employees = [LegacyEmployeeData(**json.loads(raw)) for raw in profiles]
+        machines = [json.loads(raw) for raw in computers]
+        encoded = [json.dumps(dataclasses.asdict(e), indent=2, ensure_ascii=False, default=str).encode("utf-8")
+                   for e in employees]
+        return employees, machines, encoded
+
+    def run_current():
+        employees = [EmployeeData.from_json(raw) for raw in profiles]
+        machines = [loads_json(raw) for raw in computers]
+        encoded = [e.to_json_bytes() for e in employees]
+        return employees, machines, encoded
+
+    results = {}
+    parsed = [json.loads(raw) for raw in profiles]
+    for label, runner, factory in (("asdict model", run_legacy, lambda d: LegacyEmployeeData(**d)),
+                                   ("slotted model", run_current, EmployeeData.from_dict)):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            runner()
+            timings.append(time.perf_counter() - started)
+        results[label] = runner()[2]
+        # Memory of the instances themselves (field values are shared with the parsed dicts)
+        tracemalloc.start()
+        employees = [factory(data) for data in parsed]
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label:>14}: best {min(timings) * 1000:.1f} ms to load and re-encode everything, "
+              f"{retained / 1024:.1f} KiB for {len(employees)} instances")
+        del employees
+
+    # Same bytes, apart from the schema_version key the new model adds to old files
+    identical = all(
+        json.loads(new) == {**json.loads(old), 'schema_version': SCHEMA_VERSION}
+        for old, new in zip(results["asdict model"], results["slotted model"])
+    )
+    print(f"Equivalent output: {identical}")
+    return identical
+
+
+if __name__ == "__main__":
+    _benchmark()
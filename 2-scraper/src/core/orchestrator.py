@@ -6,16 +6,22 @@ from ..config.settings import ScraperConfig
 from .unified_scraper import UnifiedEmployeeScraper
 
 class ScraperOrchestrator:
-    def __init__(self, config: Optional[ScraperConfig] = None, use_parallel: bool = False, max_workers: int = 1):
+    def __init__(self, config: Optional[ScraperConfig] = None, use_parallel: bool = True, max_workers: Optional[int] = None):
         self.config = config or ScraperConfig.from_env()
         self.logger = logging.getLogger(__name__)
-        # Parallel processing removed by policy
-        self.use_parallel = False
-        self.max_workers = 1
+        # Parallel profile scraping: max_workers pages share one authenticated context.
+        # max_workers=None keeps the configured MAX_CONCURRENT_PAGES.
+        self.use_parallel = use_parallel
+        if not use_parallel:
+            self.max_workers = 1
+        else:
+            self.max_workers = max(1, max_workers or self.config.MAX_CONCURRENT_PAGES)
+        self.config.MAX_CONCURRENT_PAGES = self.max_workers
 
     async def run(self) -> bool:
         """Run the scraper to collect employee data and save JSON files"""
         self.logger.info("[START] Starting scraper orchestrator")
+        self.logger.info(f"[INFO] Parallel scraping: {self.use_parallel} ({self.max_workers} page(s))")
         self.config.setup_directories()
 
         try:
@@ -5,17 +5,35 @@ that can run in different modes for different use cases.
 """
 
 import asyncio
+import hashlib
 import logging
+import re
 from typing import List, Optional, Dict, Any
 from playwright.async_api import async_playwright, Page, Browser, BrowserContext, Playwright
 from urllib.parse import urljoin, urlparse
 import json
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
 
 from .models import EmployeeData
 from ..services.auth import AutoLogin
 from ..services.image_downloader import ImageDownloader
+from ..services.image_derivatives import ImageDerivativeGenerator
+from ..services.json_writer import AtomicJsonWriter
+from ..services.debug_utilities import PerformanceMonitor
+from ..services.replay import NetworkRecorder, ReplayServer
+from ..services.project_index import ProjectNameIndex, project_names_similar
+from ..services.grid_stream import ProjectGridStreamer
+from ..services.incremental import ProfileFingerprintStore, PROFILE_UNCHANGED, PROFILE_STALE
+from ..services.checkpoint import ScrapeCheckpoint, ResumeState
+from ..services.session_cache import SessionCache
+from ..services.api_extractor import ApiProfileExtractor
+from ..services.resource_blocker import ResourceBlocker
+from ..services.readiness import ReadinessDetector, WaitTimings
+from ..services.profile_extraction import (
+    EXTRACTION_BUNDLE_JS, EXTRACT_ALL_JS, DEBUG_NAME_JS, BASIC_DATA_JS, CONTACT_DATA_JS,
+    SECTION_PARSER_JS, PROJECT_LINKS_JS, RoundTripCounter
+)
 from ..config.settings import ScraperConfig
 
 
@@ -26,6 +44,11 @@ class UnifiedEmployeeScraper:
     professional information, projects, education, licenses, and more.
     """
     
+    # Section headers tried (in order) by the text-based section parsers
+    EDUCATION_SECTION_NAMES = ["Education", "Educational Background", "Academic Background", "Degrees"]
+    PROJECT_SECTION_NAMES = ["Projects", "Project", "Work", "Portfolio", "Experience"]
+    BUNDLE_SECTION_NAMES = ["Personal Bio", "The Basics", "Memberships", "License"] + EDUCATION_SECTION_NAMES + PROJECT_SECTION_NAMES
+    
     def __init__(self, 
                  base_url: str = "https://ei.ennead.com/employees/1/all-employees",
                  download_images: bool = True,
@@ -50,22 +73,109 @@ class UnifiedEmployeeScraper:
         
         self.logger = logging.getLogger(__name__)
         
+        # Offline benchmarking: record the site's responses, or serve a recording instead of the site
+        self.replay: Optional[ReplayServer] = None
+        self.recorder: Optional[NetworkRecorder] = None
+        if getattr(self.config, 'REPLAY_DIR', None):
+            self.replay = ReplayServer(Path(self.config.REPLAY_DIR))
+            self.base_url = self.replay.base_url
+        elif getattr(self.config, 'RECORD_DIR', None):
+            self.recorder = NetworkRecorder(Path(self.config.RECORD_DIR), base_url,
+                                            allow_patterns=self.config.RESOURCE_ALLOW_PATTERNS)
+        
         # Initialize components
         if download_images:
             # Set the correct path for images to be saved in docs/assets/images
-            from pathlib import Path
             project_root = Path(__file__).parent.parent.parent.parent
             images_dir = project_root / "docs" / "assets" / "images"
-            self.image_downloader = ImageDownloader(str(images_dir))
+            self.image_downloader = ImageDownloader(str(images_dir), max_concurrent=self.config.MAX_CONCURRENT_DOWNLOADS)
         else:
             self.image_downloader = None
+        
+        # Responsive thumbnails/profile sizes (AVIF/WebP/JPEG) for the website
+        self.image_derivatives = None
+        if self.image_downloader and getattr(self.config, 'IMAGE_DERIVATIVES', True):
+            self.image_derivatives = ImageDerivativeGenerator(self.image_downloader.images_dir)
         self.auto_login = AutoLogin()
         
+        # Profile images download in the background while scraping continues
+        self.background_images = getattr(self.config, 'BACKGROUND_IMAGE_DOWNLOADS', True)
+        self.image_tasks: List[asyncio.Task] = []
+        
+        # Encrypted storage_state cache so later runs can skip the Microsoft sign-in
+        self.session_cache: Optional[SessionCache] = None
+        if getattr(self.config, 'SESSION_CACHE', False) and not self.replay:
+            self.session_cache = SessionCache(
+                Path(self.config.DEBUG_DIR) / "session_state.enc",
+                self.auto_login.get_session_secret(),
+                max_age_hours=self.config.SESSION_MAX_AGE_HOURS
+            )
+        self.using_cached_session = False
+        
         # Browser components
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self.playwright: Optional[Playwright] = None
+        # Extra pages opened by the profile worker pool (all share self.context)
+        self.worker_pages: List[Page] = []
+        
+        # Concurrency limit for profile scraping (number of pages in the pool)
+        self.max_concurrent_pages = max(1, int(getattr(self.config, 'MAX_CONCURRENT_PAGES', 1) or 1))
+        
+        # Incremental mode: only deep-scrape profiles whose directory card changed
+        self.fingerprints: Optional[ProfileFingerprintStore] = None
+        if getattr(self.config, 'INCREMENTAL', False):
+            self.fingerprints = ProfileFingerprintStore(
+                self._assets_dir() / "scrape_fingerprints.json",
+                ttl_days=self.config.INCREMENTAL_TTL_DAYS
+            ).load()
+        
+        # Individual JSON files are written off the event loop, atomically, and only when changed
+        self.json_writer = AtomicJsonWriter(
+            max_workers=getattr(self.config, 'JSON_WRITER_THREADS', 4),
+            ignore_keys=('scraped_at',)
+        )
+        
+        # Per-stage timings (p50/p95/max), exported next to the log file at the end of a run
+        self.perf = PerformanceMonitor(self.logger)
+        
+        # Checkpoint journal of the link list and finished profiles (for --resume)
+        self.checkpoint = ScrapeCheckpoint(Path(self.config.DEBUG_DIR) / "scrape_checkpoint.jsonl")
+        self.resume_state: Optional[ResumeState] = None
+        
+        # API extraction mode: map the SPA's JSON responses, DOM extraction as fallback
+        self.api_extractor: Optional[ApiProfileExtractor] = None
+        if getattr(self.config, 'EXTRACTION_MODE', 'dom') == 'api':
+            self.api_extractor = ApiProfileExtractor(base_url)
+        
+        # Resource blocking during profile extraction (DOM capture needs fully styled pages)
+        self.resource_blocker: Optional[ResourceBlocker] = None
+        if getattr(self.config, 'BLOCK_RESOURCES', False) and not getattr(self.config, 'DOM_CAPTURE', False):
+            parsed_base = urlparse(base_url)
+            self.resource_blocker = ResourceBlocker(
+                f"{parsed_base.scheme}://{parsed_base.netloc}",
+                blocked_types=self.config.BLOCKED_RESOURCE_TYPES,
+                block_third_party=self.config.BLOCK_THIRD_PARTY,
+                allow_patterns=self.config.RESOURCE_ALLOW_PATTERNS
+            )
+        
+        # Single-pass extraction: one evaluate per profile returns every section
+        self.use_extraction_bundle = getattr(self.config, 'EXTRACTION_BUNDLE', True)
+        self.validate_extraction_bundle = getattr(self.config, 'VALIDATE_EXTRACTION_BUNDLE', False)
+        self._bundle_results: Dict[Page, Dict[str, Any]] = {}
+        self.bundle_mismatches = 0
+        self.round_trips = RoundTripCounter()
+        
+        # "Show All" projects grid: walked page by page, optionally stopping at rows known from
+        # the last run (with a full walk of every profile at least every GRID_FULL_WALK_WEEKS)
+        self.grid_max_chunks = getattr(self.config, 'GRID_MAX_CHUNKS', 100)
+        self.grid_stop_after_known = getattr(self.config, 'GRID_STOP_AFTER_KNOWN', 0)
+        self.grid_full_walk_weeks = getattr(self.config, 'GRID_FULL_WALK_WEEKS', 4)
+        
+        # Readiness detectors per page; wait-time histograms are shared
+        self.wait_timings = WaitTimings()
+        self._page_readiness: Dict[Page, ReadinessDetector] = {}
         
         # Scraped data
         self.employees: List[EmployeeData] = []
@@ -123,6 +233,19 @@ class UnifiedEmployeeScraper:
         if len(text) <= 3:
             return None
         return text
+
+    # --- Output path helpers ---------------------------------------------------
+    def _assets_dir(self) -> Path:
+        """docs/assets under the project root (independent of the working directory)"""
+        if self.replay:
+            # A replayed run must never overwrite the real site data
+            return self.replay.output_dir
+        return Path(__file__).parent.parent.parent.parent / "docs" / "assets"
+
+    def _individual_file_path(self, employee_name: str) -> Path:
+        """Path of the individual JSON file for an employee name"""
+        clean_name = employee_name.replace(' ', '_').replace('/', '_').replace('\\', '_')
+        return self._assets_dir() / "individual_employees" / f"{clean_name}.json"
     
     async def __aenter__(self):
         """Async context manager entry"""
@@ -165,8 +288,13 @@ class UnifiedEmployeeScraper:
                 args=browser_args
             )
             
+            # Reuse a cached login session if there is a usable one
+            storage_state = self.session_cache.load() if self.session_cache else None
+            self.using_cached_session = storage_state is not None
+            
             # Enhanced context with realistic browser settings
             self.context = await self.browser.new_context(
+                storage_state=storage_state,
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
                 locale='en-US',
@@ -183,10 +311,8 @@ class UnifiedEmployeeScraper:
                 }
             )
             
-            self.page = await self.context.new_page()
-            
-            # Add stealth measures
-            await self.page.add_init_script("""
+            # Add stealth measures (context-wide so every pooled page gets them)
+            await self.context.add_init_script("""
                 Object.defineProperty(navigator, 'webdriver', {
                     get: () => undefined,
                 });
@@ -198,18 +324,85 @@ class UnifiedEmployeeScraper:
                 });
             """)
             
-            self.page.set_default_timeout(self.timeout)
+            # Compile the profile extraction bundle once per page load
+            if self.use_extraction_bundle:
+                await self.context.add_init_script(EXTRACTION_BUNDLE_JS)
+            
+            # Registered before the resource blocker, which falls back to this route for allowed requests
+            if self.replay:
+                await self.replay.install(self.context)
+            elif self.recorder:
+                self.recorder.install(self.context)
+            
+            self.page = await self._new_page()
             self.logger.info("[SUCCESS] Browser started with comprehensive data extraction")
             
         except Exception as e:
             self.logger.error(f"[ERROR] Failed to start browser: {e}")
             raise
     
+    def _readiness_for(self, page: Page) -> ReadinessDetector:
+        """Readiness detector for a page (created on first use, timings shared across pages)"""
+        detector = self._page_readiness.get(page)
+        if detector is None:
+            detector = ReadinessDetector(
+                page,
+                quiet_ms=self.config.READINESS_QUIET_MS,
+                timeout=self.config.READINESS_TIMEOUT,
+                timings=self.wait_timings
+            )
+            self._page_readiness[page] = detector
+        return detector
+    
+    def _forget_page(self, page: Page):
+        """Drop the per-page state of a page that was closed or replaced, so it can be freed"""
+        self._page_readiness.pop(page, None)
+        self._bundle_results.pop(page, None)
+        self.round_trips.detach(page)
+        if page in self.worker_pages:
+            self.worker_pages.remove(page)
+    
+    def _log_wait_timings(self):
+        """Log how long each kind of readiness wait took (histograms)"""
+        for name, stats in self.wait_timings.get_summary().items():
+            self.logger.info(f"[TIMING] wait '{name}': {stats['count']} waits, total {stats['total_s']}s, "
+                             f"max {stats['max_s']}s, outcomes {stats['outcomes']}, histogram {stats['histogram']}")
+    
+    def _report_stage_timings(self):
+        """Print the per-stage timing table and export it next to the log file"""
+        if not self.perf.metrics:
+            return
+        print("\n⏱️ Stage timings:")
+        print(self.perf.format_stage_table())
+        timings_path = Path(self.config.LOG_FILE).parent / "scraper_timings.json"
+        try:
+            self.perf.export_metrics(timings_path, include_details=False)
+        except Exception as e:
+            self.logger.warning(f"[WARNING] Could not export stage timings: {e}")
+    
+    async def _new_page(self) -> Page:
+        """Open a new page in the shared (authenticated) browser context"""
+        page = await self.context.new_page()
+        page.set_default_timeout(self.timeout)
+        return page
+    
     async def close_browser(self):
         """Close the browser and cleanup"""
         try:
+            # Let in-flight image downloads finish before their request context goes away
+            if self.image_tasks:
+                await self._drain_image_downloads()
+            if self.image_downloader:
+                await self.image_downloader.close()
+            self.json_writer.close()
+            for worker_page in list(self.worker_pages):
+                if not worker_page.is_closed():
+                    await worker_page.close()
+                self._forget_page(worker_page)
+            self.worker_pages = []
             if self.page:
                 await self.page.close()
+                self._forget_page(self.page)
             if self.context:
                 await self.context.close()
             if self.browser:
@@ -231,14 +424,29 @@ class UnifiedEmployeeScraper:
         try:
             # Navigate to employee directory
             self.logger.info(f"Navigating to: {self.base_url}")
-            await self.page.goto(self.base_url)
-            await self.page.wait_for_load_state('networkidle')
-            
-            # Handle authentication if needed
-            await self._handle_authentication()
-            
-            # Get all employee links
-            employee_links = await self._get_employee_links()
+            async with self.perf.track_operation('navigation.directory'):
+                await self.page.goto(self.base_url)
+                await self.page.wait_for_load_state('networkidle')
+            
+            # Handle authentication if needed (a recording is already signed in)
+            if not self.replay:
+                async with self.perf.track_operation('auth'):
+                    await self._handle_authentication()
+            
+            # Resume: reuse the link list of an interrupted run instead of re-discovering
+            if getattr(self.config, 'RESUME', False):
+                self.resume_state = self.checkpoint.load_resume_state(self.base_url)
+            
+            if self.resume_state:
+                employee_links = self.resume_state.links
+                print(f"♻️ Resuming run from {self.resume_state.started_at}: "
+                      f"{len(self.resume_state.done)} of {len(employee_links)} profiles already done")
+            else:
+                # Get all employee links
+                async with self.perf.track_operation('discovery'):
+                    employee_links = await self._get_employee_links()
+                if employee_links:
+                    self.checkpoint.start(self.base_url, employee_links)
             self.logger.info(f"Found {len(employee_links)} employees to scrape")
             
             if not employee_links:
@@ -251,78 +459,318 @@ class UnifiedEmployeeScraper:
                 employee_links = employee_links[:limit_count]
                 self.logger.info(f"[INFO] Limiting to first {limit_count} employees per --limit")
             
-            # Scrape each employee
-            self.employees = []
-            for i, (name, profile_url, image_url) in enumerate(employee_links, 1):
-                try:
-                    self.logger.info(f"Scraping employee {i}/{len(employee_links)}: {name}")
-                    
-                    # Scrape employee data with comprehensive extraction
-                    employee = await self._scrape_employee_comprehensive(profile_url, name, image_url)
-                    
-                    if employee:
-                        self.employees.append(employee)
-                        self.logger.info(f"[SUCCESS] Successfully scraped {name}")
-                    else:
-                        # Create basic employee data even if detailed scraping failed
-                        employee = EmployeeData(
-                            human_name=name,
-                            profile_url=profile_url,
-                            image_url=image_url,
-                            scraped_at=datetime.now().isoformat()
-                        )
-                        self.employees.append(employee)
-                        self.logger.warning(f"[WARNING] Failed to scrape detailed data for {name}, created basic entry")
-                    
-                    # Always save individual JSON file (regardless of scraping success)
-                    saved_path = await self._save_individual_employee(employee)
-                    
-                    if saved_path:
-                        print(f"✅ SUCCESS: {name} - JSON saved to {saved_path}")
-                        self.logger.info(f"[SUCCESS] Individual JSON saved for {name}")
-                    else:
-                        print(f"⚠️ WARNING: {name} - Failed to save JSON")
-                        self.logger.error(f"[ERROR] Failed to save individual JSON for {name}")
-                    
-                    # Delay between requests
-                    await asyncio.sleep(0.5)
-                    
-                except Exception as e:
-                    self.logger.error(f"[ERROR] Error scraping {name}: {e}")
-                    
-                    # Even if there's an exception, create basic employee data and save individual file
-                    try:
-                        employee = EmployeeData(
-                            human_name=name,
-                            profile_url=profile_url if 'profile_url' in locals() else None,
-                            image_url=image_url if 'image_url' in locals() else None,
-                            scraped_at=datetime.now().isoformat()
-                        )
-                        self.employees.append(employee)
-                        
-                        # Save individual JSON file even after exception
-                        saved_path = await self._save_individual_employee(employee)
-                        if saved_path:
-                            print(f"✅ RECOVERY: {name} - Basic JSON saved after error")
-                            self.logger.info(f"[RECOVERY] Created basic entry for {name} after error")
-                        
-                    except Exception as save_error:
-                        self.logger.error(f"[CRITICAL] Failed to create basic entry for {name}: {save_error}")
-                    
-                    continue
+            # Directory discovery is done; block what profile extraction doesn't need
+            if self.resource_blocker:
+                await self.resource_blocker.install(self.context)
+            
+            # Scrape each employee using a bounded pool of pages
+            if self.fingerprints is not None:
+                self.employees = await self._scrape_incremental(employee_links)
+            else:
+                self.employees = await self._scrape_profiles(employee_links)
+            
+            async with self.perf.track_operation('image.drain'):
+                await self._drain_image_downloads()
+            async with self.perf.track_operation('image.derivatives'):
+                await self._generate_image_derivatives()
+            
+            writer_stats = self.json_writer.stats
+            print(f"💾 Individual JSON: {writer_stats['written']} written, {writer_stats['unchanged']} unchanged, "
+                  f"{writer_stats['failed']} failed")
+            
+            if self.api_extractor:
+                stats = self.api_extractor.stats
+                print(f"📊 API extraction: {stats['direct']} direct, {stats['captured']} captured, {stats['dom_fallback']} DOM fallback")
+                self.logger.info(f"[API] Extraction summary: {stats}, endpoints: {self.api_extractor.templates}")
+            
+            self._log_wait_timings()
+            
+            round_trip_summary = self.round_trips.get_summary()
+            print(f"📊 Page round trips per profile: {round_trip_summary}")
+            self.logger.info(f"[METRIC] Page round trips per profile: {round_trip_summary}")
+            if self.validate_extraction_bundle:
+                self.logger.info(f"[VALIDATE] Profiles where the extraction bundle differed: {self.bundle_mismatches}")
+            
+            if self.resource_blocker:
+                print(f"🚫 Resource blocking: {self.resource_blocker.summary()}")
+                self.logger.info(f"[INFO] Resource blocking report: {self.resource_blocker.get_report()}")
             
             # Validate results
             if len(self.employees) == 0:
                 self.logger.error("[CRITICAL] Failed to get any employees")
                 raise Exception("Failed to get any employees - this indicates a complete scraping failure")
             
+            self.checkpoint.mark_complete()
+            if self.recorder:
+                await self.recorder.save([employee.to_dict() for employee in self.employees])
+            # Keep the cached session fresh (cookies may have been renewed during the run)
+            await self._save_session()
             self.logger.info(f"[SUCCESS] Scraping completed. Total employees: {len(self.employees)}")
+            self._report_stage_timings()
             return self.employees
             
         except Exception as e:
             self.logger.error(f"[ERROR] Error during scraping: {e}")
+            self._report_stage_timings()
             raise
     
+    async def _scrape_profiles(self, employee_links: List[tuple]) -> List[EmployeeData]:
+        """
+        Scrape profiles with a bounded pool of pages fed from an asyncio work queue.
+        
+        Every page shares the one authenticated BrowserContext, so cookies from the
+        login on the directory page apply to all workers. Results are returned in
+        directory order regardless of which worker finished first.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, link in enumerate(employee_links, 1):
+            queue.put_nowait((index, link))
+        
+        concurrency = min(self.max_concurrent_pages, len(employee_links))
+        self.logger.info(f"[INFO] Scraping {len(employee_links)} profiles with {concurrency} concurrent page(s)")
+        
+        results: Dict[int, EmployeeData] = {}
+        workers = [
+            asyncio.create_task(self._profile_worker(worker_id, queue, results, len(employee_links)))
+            for worker_id in range(concurrency)
+        ]
+        # A worker that dies must not take the other workers' results with it
+        for worker_id, outcome in enumerate(await asyncio.gather(*workers, return_exceptions=True)):
+            if isinstance(outcome, BaseException):
+                self.logger.error(f"[ERROR] Worker W{worker_id} stopped unexpectedly: {outcome}")
+        
+        return [results[index] for index in sorted(results)]
+    
+    async def _profile_worker(self, worker_id: int, queue: asyncio.Queue, results: Dict[int, EmployeeData], total: int):
+        """Drain the profile queue on a dedicated page"""
+        # Worker 0 reuses the directory page; the others open their own page with their first
+        # profile, so a page that can't be opened only fails that profile (and is retried with the next)
+        page = self.page if worker_id == 0 else None
+        
+        while True:
+            try:
+                index, (name, profile_url, image_url, title) = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            
+            # Already finished by the interrupted run we are resuming
+            resumed = self._load_resumed_employee(profile_url)
+            if resumed:
+                results[index] = resumed
+                if self.fingerprints is not None:
+                    self.fingerprints.record(
+                        profile_url,
+                        ProfileFingerprintStore.fingerprint(name, image_url, title),
+                        name,
+                        resumed.scraped_at,
+                        self.resume_state.done[profile_url]['file']
+                    )
+                self.logger.info(f"[W{worker_id}] Skipping employee {index}/{total}: {name} (done before resume)")
+                continue
+            
+            try:
+                self.logger.info(f"[W{worker_id}] Scraping employee {index}/{total}: {name}")
+                if page is None:
+                    page = await self._new_page()
+                    self.worker_pages.append(page)
+                page, employee = await self._scrape_profile_with_retry(page, worker_id, profile_url, name, image_url)
+                scraped_ok = employee is not None
+                
+                if employee:
+                    self.logger.info(f"[SUCCESS] Successfully scraped {name}")
+                else:
+                    # Create basic employee data even if detailed scraping failed
+                    employee = EmployeeData(
+                        human_name=name,
+                        profile_url=profile_url,
+                        image_url=image_url,
+                        scraped_at=datetime.now().isoformat()
+                    )
+                    self.logger.warning(f"[WARNING] Failed to scrape detailed data for {name}, created basic entry")
+                
+                results[index] = employee
+                
+                # Always save individual JSON file (regardless of scraping success)
+                saved_path = await self._save_individual_employee(employee)
+                
+                if saved_path:
+                    print(f"✅ SUCCESS: {name} - JSON saved to {saved_path}")
+                    self.logger.info(f"[SUCCESS] Individual JSON saved for {name}")
+                    self.checkpoint.mark_done(profile_url, Path(saved_path).name, 'detailed' if scraped_ok else 'basic')
+                    # Only remember fingerprints of full scrapes so basic entries are retried next run
+                    if self.fingerprints is not None and scraped_ok:
+                        self.fingerprints.record(
+                            profile_url,
+                            ProfileFingerprintStore.fingerprint(name, image_url, title),
+                            name,
+                            employee.scraped_at,
+                            Path(saved_path).name
+                        )
+                else:
+                    print(f"⚠️ WARNING: {name} - Failed to save JSON")
+                    self.logger.error(f"[ERROR] Failed to save individual JSON for {name}")
+                
+                # Delay between requests on this page
+                await asyncio.sleep(0.5)
+                
+            except Exception as e:
+                self.logger.error(f"[ERROR] Error scraping {name}: {e}")
+                
+                # Even if there's an exception, create basic employee data and save individual file
+                try:
+                    employee = EmployeeData(
+                        human_name=name,
+                        profile_url=profile_url,
+                        image_url=image_url,
+                        scraped_at=datetime.now().isoformat()
+                    )
+                    results[index] = employee
+                    
+                    saved_path = await self._save_individual_employee(employee)
+                    if saved_path:
+                        self.checkpoint.mark_done(profile_url, Path(saved_path).name, 'basic')
+                        print(f"✅ RECOVERY: {name} - Basic JSON saved after error")
+                        self.logger.info(f"[RECOVERY] Created basic entry for {name} after error")
+                    
+                except Exception as save_error:
+                    self.logger.error(f"[CRITICAL] Failed to create basic entry for {name}: {save_error}")
+    
+    async def _scrape_incremental(self, employee_links: List[tuple]) -> List[EmployeeData]:
+        """
+        Deep-scrape only new, changed or stale profiles; reuse the rest from disk.
+        
+        Returns all employees in directory order and saves the updated fingerprints.
+        """
+        to_scrape, reused = self._plan_incremental(employee_links)
+        stats = self.fingerprints.stats
+        self.logger.info(f"[INCREMENTAL] Plan: {stats.summary()}")
+        
+        scraped = await self._scrape_profiles(to_scrape) if to_scrape else []
+        scraped_by_url = {employee.profile_url: employee for employee in scraped}
+        
+        employees = []
+        for name, profile_url, image_url, title in employee_links:
+            employee = reused.get(profile_url) or scraped_by_url.get(profile_url)
+            if employee:
+                employees.append(employee)
+        
+        # Forget profiles that left the directory (only when the full directory was seen)
+        if getattr(self.config, 'LIMIT', None) is None:
+            removed = self.fingerprints.prune([link[1] for link in employee_links])
+            if removed:
+                self.logger.info(f"[INCREMENTAL] Removed {removed} fingerprints for profiles no longer listed")
+        self.fingerprints.save()
+        
+        print(f"📊 Incremental run: {stats.skipped} skipped, {stats.refreshed} refreshed, {stats.added} added")
+        self.logger.info(f"[INCREMENTAL] Done: {stats.summary()}")
+        return employees
+    
+    def _plan_incremental(self, employee_links: List[tuple]) -> tuple:
+        """
+        Split directory cards into profiles to deep-scrape and profiles to reuse.
+        
+        Returns:
+            Tuple of (links_to_scrape, {profile_url: EmployeeData reused from disk})
+        """
+        to_scrape = []
+        reused: Dict[str, EmployeeData] = {}
+        
+        for link in employee_links:
+            name, profile_url, image_url, title = link
+            fingerprint = ProfileFingerprintStore.fingerprint(name, image_url, title)
+            file_path = self._individual_file_path(name.strip())
+            status = self.fingerprints.classify(profile_url, fingerprint, existing_file=file_path)
+            
+            if status == PROFILE_UNCHANGED:
+                employee = self._load_individual_employee(file_path)
+                if employee is None:
+                    status = PROFILE_STALE
+                else:
+                    reused[profile_url] = employee
+            
+            self.fingerprints.stats.count(status)
+            if status != PROFILE_UNCHANGED:
+                self.logger.debug(f"[INCREMENTAL] {name}: {status}")
+                to_scrape.append(link)
+        
+        return to_scrape, reused
+    
+    def _load_resumed_employee(self, profile_url: str) -> Optional[EmployeeData]:
+        """Employee fully scraped by the interrupted run being resumed (basic entries are retried)"""
+        if not self.resume_state:
+            return None
+        done = self.resume_state.done.get(profile_url)
+        if not done or done['status'] != 'detailed':
+            return None
+        return self._load_individual_employee(self._assets_dir() / "individual_employees" / done['file'])
+    
+    def _previous_detailed_projects(self, name: str) -> Dict[str, Dict[str, str]]:
+        """Projects from the "Show All" grid in the previous scrape of this employee, keyed by URL"""
+        file_path = self._individual_file_path(name.strip())
+        if not self.grid_stop_after_known or not file_path.exists():
+            return {}
+        previous = self._load_individual_employee(file_path)
+        if not previous:
+            return {}
+        return {p['url']: p for p in previous.projects.values()
+                if p.get('source') == 'detailed_table' and p.get('url')}
+    
+    def _grid_full_walk_due(self, profile_url: str, today: Optional[date] = None) -> bool:
+        """
+        Whether this run walks the profile's whole grid even though it could stop early.
+
+        Profiles are spread over GRID_FULL_WALK_WEEKS buckets by URL and one bucket gets a
+        full walk each ISO week, so projects deleted on the site or changed below the
+        usual stop point are picked up within that many weekly runs.
+        """
+        if self.grid_full_walk_weeks <= 1:
+            return True
+        week = (today or date.today()).isocalendar()[1]
+        bucket = int(hashlib.sha1(profile_url.encode('utf-8')).hexdigest(), 16) % self.grid_full_walk_weeks
+        return week % self.grid_full_walk_weeks == bucket
+    
+    def _load_individual_employee(self, file_path: Path) -> Optional[EmployeeData]:
+        """Load a previously saved individual JSON file, or None if unreadable"""
+        try:
+            return EmployeeData.from_json(file_path.read_bytes())
+        except Exception as e:
+            self.logger.warning(f"[INCREMENTAL] Could not reuse {file_path.name}: {e}")
+            return None
+    
+    async def _scrape_profile_with_retry(self, page: Page, worker_id: int, profile_url: str, name: str, image_url: str) -> tuple:
+        """
+        Scrape one profile on the worker's page, retrying on failure.
+        
+        Returns:
+            Tuple of (page, employee). The page may be a replacement if the
+            original one crashed or was closed; employee is None if all attempts failed.
+        """
+        max_attempts = max(1, int(getattr(self.config, 'MAX_RETRIES', 1) or 1))
+        retry_delay = getattr(self.config, 'RETRY_DELAY', 2)
+        
+        for attempt in range(1, max_attempts + 1):
+            if page.is_closed():
+                self.logger.warning(f"[W{worker_id}] Page was closed, opening a replacement")
+                self._forget_page(page)
+                page = await self._new_page()
+                self.worker_pages.append(page)
+            
+            self.round_trips.attach(page)
+            self.round_trips.reset(page)
+            async with self.perf.track_operation('profile'):
+                employee = await self._scrape_employee_comprehensive(profile_url, name, image_url, page=page)
+            round_trips = self.round_trips.finish_profile(page)
+            self._bundle_results.pop(page, None)
+            self.logger.info(f"    [METRIC] {round_trips} page round trips for {name} (attempt {attempt})")
+            if employee:
+                return page, employee
+            
+            if attempt < max_attempts:
+                self.logger.warning(f"[W{worker_id}] Attempt {attempt}/{max_attempts} failed for {name}, retrying in {retry_delay}s")
+                await asyncio.sleep(retry_delay * attempt)
+        
+        return page, None
+    
     async def _handle_authentication(self):
         """Handle authentication if required"""
         current_url = self.page.url
@@ -337,6 +785,13 @@ class UnifiedEmployeeScraper:
         is_login_page = any(indicator in page_title.lower() or indicator in current_url.lower() 
                           for indicator in login_indicators)
         
+        if is_login_page and self.using_cached_session:
+            self.logger.info("[SESSION] Cached session was rejected, falling back to full login")
+            self.session_cache.clear()
+            self.using_cached_session = False
+        elif self.using_cached_session:
+            self.logger.info("[SESSION] Cached session is valid, login skipped")
+        
         if is_login_page:
             self.logger.info(f"[INFO] Website requires authentication - attempting auto-login")
             
@@ -347,6 +802,7 @@ class UnifiedEmployeeScraper:
                     self.logger.info("[SUCCESS] Automatic login successful")
                     await self.page.goto(self.base_url)
                     await self.page.wait_for_load_state('networkidle')
+                    await self._save_session()
                 else:
                     self.logger.error("[ERROR] Automatic login failed")
                     raise Exception("Authentication required - automatic login failed")
@@ -354,15 +810,27 @@ class UnifiedEmployeeScraper:
                 self.logger.error("[ERROR] No credentials available for authentication")
                 raise Exception("Authentication required - no credentials available")
     
+    async def _save_session(self):
+        """Write the context's cookies/localStorage to the encrypted session cache"""
+        if not self.session_cache or not self.session_cache.enabled:
+            return
+        try:
+            self.session_cache.save(await self.context.storage_state())
+        except Exception as e:
+            self.logger.warning(f"[SESSION] Could not save session cache: {e}")
+    
     async def _get_employee_links(self) -> List[tuple]:
-        """Get all employee profile links from the directory page"""
+        """
+        Get all employee cards from the directory page.
+        
+        Returns:
+            List of (name, profile_url, image_url, title) tuples
+        """
         try:
-            # Wait for page to fully load (SPA content)
-            self.logger.info("[INFO] Waiting for dynamic content to load...")
-            await self.page.wait_for_load_state("networkidle", timeout=30000)
-            await asyncio.sleep(3)  # Additional wait for dynamic content
+            readiness = self._readiness_for(self.page)
             
-            # Wait for employee cards to load
+            # Wait for employee cards to load (SPA content)
+            self.logger.info("[INFO] Waiting for dynamic content to load...")
             try:
                 await self.page.wait_for_selector(self.selectors['employee_cards'], timeout=30000)
             except Exception as e:
@@ -371,10 +839,11 @@ class UnifiedEmployeeScraper:
                 if hasattr(self, 'config') and self.config.DEBUG_MODE:
                     await self._capture_debug_info("selector_failed")
                 raise
+            await readiness.wait_for_settle(self.selectors['employee_cards'], label='directory_initial')
             
             # Scroll to load all employees (infinite scroll)
             self.logger.info("[INFO] Scrolling to load all employees...")
-            await self._scroll_to_load_all_employees()
+            await self._scroll_to_load_all_employees(readiness)
             
             # Extract employee links
             employee_links = await self.page.evaluate(f"""
@@ -386,13 +855,15 @@ class UnifiedEmployeeScraper:
                         const nameElement = card.querySelector('{self.selectors['employee_name']}');
                         const linkElement = card.querySelector('{self.selectors['profile_link']}');
                         const imageElement = card.querySelector('{self.selectors['profile_image']}');
+                        const titleElement = card.querySelector('{self.selectors['employee_title']}');
                         
                         if (nameElement && linkElement) {{
                             const name = nameElement.textContent.trim();
                             const profileUrl = linkElement.href;
                             const imageUrl = imageElement ? imageElement.src : '';
+                            const title = titleElement ? titleElement.textContent.trim() : '';
                             
-                            links.push([name, profileUrl, imageUrl]);
+                            links.push([name, profileUrl, imageUrl, title]);
                         }}
                     }});
                     
@@ -407,15 +878,65 @@ class UnifiedEmployeeScraper:
             raise
     
     
-    async def _scrape_employee_comprehensive(self, profile_url: str, name: str, image_url: str) -> Optional[EmployeeData]:
+    async def _scrape_employee_comprehensive(self, profile_url: str, name: str, image_url: str, page: Optional[Page] = None) -> Optional[EmployeeData]:
         """Scrape comprehensive employee data with all available information"""
+        page = page or self.page
         try:
-            await self.page.goto(profile_url)
-            await self.page.wait_for_load_state('networkidle')
+            # API mode: once the profile endpoints are known, skip rendering entirely
+            if self.api_extractor and self.api_extractor.templates:
+                async with self.perf.track_operation('extract.api'):
+                    employee = await self._scrape_employee_from_api(profile_url, name, image_url, page)
+                if employee:
+                    return employee
+            
+            capture = self.api_extractor.watch(page) if self.api_extractor else None
+            async with self.perf.track_operation('navigation.profile'):
+                await page.goto(profile_url)
+                await self._readiness_for(page).wait_for_settle(label='profile_load')
+            
+            if capture:
+                responses = await capture.collect()
+                employee = self._employee_from_api_responses(responses, profile_url, name, image_url)
+                if employee:
+                    self.api_extractor.learn(profile_url, responses)
+                    self.api_extractor.stats['captured'] += 1
+                    await self._attach_profile_image(employee, name, page)
+                    self._print_extracted_data(employee, name)
+                    return employee
+                self.api_extractor.stats['dom_fallback'] += 1
+                self.logger.info(f"    [API] No usable profile JSON for {name}, using DOM extraction")
+            
+            # Wait for the page content to load - wait for profile content to appear
+            render_wait = self.perf.start_operation('wait.profile_render')
+            render_error = None
+            try:
+                # Wait for the main profile content to load
+                await page.wait_for_selector('h1:has-text("Personal Bio"), h1:has-text("Education"), h1:has-text("Projects")', timeout=15000)
+                self.logger.info("    Profile content loaded")
+                
+                # Wait for dynamic content to finish rendering (XHRs and DOM quiet)
+                await self._readiness_for(page).wait_for_settle(label='profile_render')
+                
+                # Sections have rendered by now; just report whether education is present
+                if await page.query_selector('[data-kagridname="employeeDegrees"]'):
+                    self.logger.info("    Education section loaded")
+                else:
+                    self.logger.info("    Education section not found")
+                    
+            except Exception as e:
+                render_error = str(e)
+                self.logger.info(f"    Profile content loading timeout: {e}")
+                # Continue anyway - we'll try to extract what we can
+            finally:
+                # Timeouts are the slow cases the timing report is for
+                self.perf.end_operation(render_wait, success=render_error is None, error_message=render_error)
+            
+            # Single pass: every section of the profile in one evaluate
+            bundle = await self._run_extraction_bundle(page) if self.use_extraction_bundle else None
             
             # Debug: Check if we're actually on the profile page
-            current_url = self.page.url
-            page_title = await self.page.title()
+            current_url = page.url
+            page_title = bundle['title'] if bundle else await page.title()
             self.logger.info(f"    Current URL after navigation: {current_url}")
             self.logger.info(f"    Page title: {page_title}")
             
@@ -423,79 +944,23 @@ class UnifiedEmployeeScraper:
             if hasattr(self, 'config') and self.config.DEBUG_MODE:
                 # Wait for the actual profile content to be visible
                 try:
-                    await self.page.wait_for_selector('h1:has-text("Personal Bio"), h1:has-text("Education"), h1:has-text("Projects")', timeout=10000)
+                    await page.wait_for_selector('h1:has-text("Personal Bio"), h1:has-text("Education"), h1:has-text("Projects")', timeout=10000)
                     self.logger.info("    Profile content is visible, capturing DOM...")
                     await asyncio.sleep(2)  # Additional wait for full rendering
-                    await self._capture_debug_info(f"profile_page_{name.replace(' ', '_')}")
+                    await self._capture_debug_info(f"profile_page_{name.replace(' ', '_')}", page=page)
                 except Exception as e:
                     self.logger.warning(f"    Could not wait for profile content: {e}")
                     # Capture anyway
-                await self._capture_debug_info(f"profile_page_{name.replace(' ', '_')}")
+                await self._capture_debug_info(f"profile_page_{name.replace(' ', '_')}", page=page)
             
             # Debug: Check what name is being extracted
-            debug_name = await self.page.evaluate("""
-                () => {
-                    const h1 = document.querySelector('h1');
-                    const entityHeader = document.querySelector('h1[class*="EntityHeader"], h1[class*="entityHeader"], h1[class*="header"], h1[class*="Header"]');
-                    const allH1s = document.querySelectorAll('h1');
-                    return {
-                        firstH1: h1?.textContent?.trim() || 'none',
-                        entityHeader: entityHeader?.textContent?.trim() || 'none',
-                        allH1s: Array.from(allH1s).map(h => h.textContent?.trim()).filter(t => t)
-                    };
-                }
-            """)
+            async with self.perf.track_operation('extract.debug_name'):
+                debug_name = bundle['debugName'] if bundle else await page.evaluate(DEBUG_NAME_JS)
             self.logger.info(f"    Debug name extraction: {debug_name}")
             
             # Extract basic employee data inline
-            basic_data = await self.page.evaluate(f"""
-                () => {{
-                    const data = {{}};
-                    
-                    // Basic information - use more specific selectors for employee name
-                    data.human_name = document.querySelector('h1[class*="EntityHeader"], h1[class*="entityHeader"], h1[class*="header"], h1[class*="Header"], h1:not([class*="section"])')?.textContent?.trim() || 
-                                     document.querySelector('h1')?.textContent?.trim() || '';
-                    data.email = document.querySelector('a[href^="mailto:"]')?.href?.replace('mailto:', '') || '';
-                    data.phone = document.querySelector('a[href^="tel:"]')?.href?.replace('tel:', '') || '';
-                    
-                    // Position and department - be more specific to avoid picking up the name
-                    // Look for position/title elements that are NOT the main name
-                    const positionSelectors = [
-                        '.EntityHeader__NormalLine-sc-1yar8fm-0:not(:first-child)',
-                        '.position:not(:first-child)',
-                        '.title:not(:first-child)',
-                        '.job-title:not(:first-child)',
-                        '.role:not(:first-child)',
-                        '[data-kafieldname*="title"]',
-                        '[data-kafieldname*="position"]'
-                    ];
-                    
-                    let position = '';
-                    for (const selector of positionSelectors) {{
-                        const el = document.querySelector(selector);
-                        if (el && el.textContent?.trim() && el.textContent.trim() !== data.human_name) {{
-                            position = el.textContent.trim();
-                            break;
-                        }}
-                    }}
-                    data.position = position;
-                    
-                    data.department = document.querySelector('.department, .team, .division, .group')?.textContent?.trim() || '';
-                    
-                    // Bio - use the correct class for bio content
-                    const bioEl = document.querySelector('.EntityFields__InfoFieldValue-sc-129sxys-5, .bio-content, .about-content, .description-content, .employee-bio-content, [data-bio]');
-                    data.bio = bioEl ? bioEl.textContent?.trim() : null;
-                    
-                    // Office location
-                    data.office_location = document.querySelector('.location, .office, .address')?.textContent?.trim() || '';
-                    
-                    // Profile image
-                    const img = document.querySelector('{self.selectors['profile_image']}');
-                    data.image_url = img ? img.src : '';
-                    
-                    return data;
-                }}
-            """)
+            async with self.perf.track_operation('extract.basic'):
+                basic_data = bundle['basic'] if bundle else await page.evaluate(BASIC_DATA_JS, self.selectors['profile_image'])
             
             # Create EmployeeData object with basic data
             employee = EmployeeData(
@@ -515,54 +980,26 @@ class UnifiedEmployeeScraper:
                 employee.human_name = name.strip()
                 self.logger.info(f"    Using directory name: {name}")
             
-            # Wait for the page content to load - wait for profile content to appear
-            try:
-                # Wait for the main profile content to load
-                await self.page.wait_for_selector('h1:has-text("Personal Bio"), h1:has-text("Education"), h1:has-text("Projects")', timeout=15000)
-                self.logger.info("    Profile content loaded")
-                
-                # Additional wait for dynamic content to fully render
-                await asyncio.sleep(3)
-                
-                # Try to wait for specific sections
-                try:
-                    await self.page.wait_for_selector('[data-kagridname="employeeDegrees"]', timeout=5000)
-                    self.logger.info("    Education section loaded")
-                except:
-                    self.logger.info("    Education section not found")
-                    
-            except Exception as e:
-                self.logger.info(f"    Profile content loading timeout: {e}")
-                # Continue anyway - we'll try to extract what we can
-            
             # Extract comprehensive data using text-based parsing
             self.logger.info("    Starting comprehensive data extraction using text-based parsing...")
             
             # Extract basic contact information using JavaScript (still reliable)
-            basic_contact_data = await self.page.evaluate("""
-                () => {
-                    const data = {};
-                    data.mobile = document.querySelector('a[href^="tel:"]')?.href?.replace('tel:', '') || '';
-                    data.teams_url = document.querySelector('a[href*="teams.microsoft.com"]')?.href || '';
-                    data.linkedin_url = document.querySelector('a[href*="linkedin.com"]')?.href || '';
-                    data.website_url = document.querySelector('a[href*="http"]:not([href*="ennead.com"])')?.href || '';
-                    return data;
-                }
-            """)
+            async with self.perf.track_operation('extract.contact'):
+                basic_contact_data = bundle['contact'] if bundle else await page.evaluate(CONTACT_DATA_JS)
             
             # Initialize comprehensive_data with basic contact info
             comprehensive_data = basic_contact_data
             
             # Extract Personal Bio using text-based parsing
             self.logger.info("    Extracting Personal Bio using text-based parser...")
-            bio_data = await self._parse_section_by_text("Personal Bio")
+            bio_data = await self._parse_section_by_text("Personal Bio", page=page)
             if bio_data and 'value' in bio_data:
                 employee.bio = self._sanitize_bio(bio_data['value'])
                 self.logger.info(f"    Found Personal Bio: {len(employee.bio)} characters")
             
             # Extract Years with Firm using text-based parsing
             self.logger.info("    Extracting Years with Firm using text-based parser...")
-            years_data = await self._parse_section_by_text("The Basics")
+            years_data = await self._parse_section_by_text("The Basics", page=page)
             if years_data:
                 self.logger.info(f"    Years data keys: {list(years_data.keys())}")
                 
@@ -571,7 +1008,6 @@ class UnifiedEmployeeScraper:
                     if 'years' in key.lower() or 'firm' in key.lower():
                         try:
                             # Handle concatenated data like "Years With Firm3"
-                            import re
                             if isinstance(value, str):
                                 # Extract number from concatenated string
                                 number_match = re.search(r'(\d+)', str(value))
@@ -588,7 +1024,6 @@ class UnifiedEmployeeScraper:
                 
                 # Also check if there's a direct value
                 if 'value' in years_data and 'Years With Firm' in years_data['value']:
-                    import re
                     years_match = re.search(r'Years With Firm\s*(\d+)', years_data['value'])
                     if years_match:
                         employee.years_with_firm = int(years_match.group(1))
@@ -606,7 +1041,7 @@ class UnifiedEmployeeScraper:
             
             # Extract Memberships using text-based parsing
             self.logger.info("    Extracting Memberships using text-based parser...")
-            memberships_data = await self._parse_section_by_text("Memberships")
+            memberships_data = await self._parse_section_by_text("Memberships", page=page)
             if memberships_data:
                 if 'value' in memberships_data:
                     # Simple text format - split by common separators
@@ -634,14 +1069,17 @@ class UnifiedEmployeeScraper:
                 employee.website_url = comprehensive_data['website_url']
             # Extract education and licenses using the new text-based parser
             self.logger.info("    Extracting education data using text-based parser...")
-            employee.education = await self._extract_education_data()
+            async with self.perf.track_operation('extract.education'):
+                employee.education = await self._extract_education_data(page=page)
             
             self.logger.info("    Extracting licenses data using text-based parser...")
-            employee.licenses = await self._extract_licenses_data()
+            async with self.perf.track_operation('extract.licenses'):
+                employee.licenses = await self._extract_licenses_data(page=page)
             
             # Extract projects using text-based parser
             self.logger.info("    Extracting projects data using text-based parser...")
-            employee.projects = await self._extract_projects_data()
+            async with self.perf.track_operation('extract.projects'):
+                employee.projects = await self._extract_projects_data(page=page)
             
             # Fallback to old method if new parser didn't find anything
             if not employee.education and comprehensive_data.get('education'):
@@ -661,149 +1099,133 @@ class UnifiedEmployeeScraper:
             
             # Handle "Show All" projects button if found
             self.logger.info(f"    Looking for 'Show All' projects button for {name}...")
+            show_all_operation = self.perf.start_operation('extract.show_all_projects')
+            show_all_error = None
+            try:
             
-            # Debug: Check what buttons/links are available on the page
-            if hasattr(self, 'config') and self.config.DEBUG_MODE:
-                available_buttons = await self.page.evaluate("""
-                    () => {
-                        const buttons = [];
-                        const allButtons = document.querySelectorAll('button, a, [role="button"]');
-                        allButtons.forEach((btn, index) => {
-                            const text = btn.textContent?.trim() || '';
-                            const classes = btn.className || '';
-                            const href = btn.href || '';
-                            if (text.toLowerCase().includes('show') || classes.toLowerCase().includes('show') || classes.toLowerCase().includes('pill')) {
-                                buttons.push({
-                                    index: index,
-                                    tag: btn.tagName,
-                                    text: text,
-                                    classes: classes,
-                                    href: href
-                                });
-                            }
-                        });
-                        return buttons;
-                    }
-                """)
-                self.logger.info(f"    Available Show/Pill buttons for {name}: {available_buttons}")
-            
-            # Try multiple selectors for the Show All button
-            show_all_selectors = [
-                '.RoundedBox-sc-1nzfcbz-0.PillBox-sc-p125c4-0.fQdvmA.driLso.pill',  # Original specific selector
-                'button:has-text("Show All")',  # More generic text-based selector
-                'a:has-text("Show All")',       # Link-based selector
-                '[class*="pill"]:has-text("Show All")',  # Class-based selector
-                'button[class*="Show"]',        # Button with "Show" in class
-                'a[class*="Show"]',             # Link with "Show" in class
-                'button:has-text("Show")',      # Any button with "Show" text
-                'a:has-text("Show")'            # Any link with "Show" text
-            ]
-            
-            show_all_button = None
-            working_selector = None
-            
-            for selector in show_all_selectors:
-                try:
-                    show_all_button = await self.page.query_selector(selector)
-                    if show_all_button:
-                        button_text = await show_all_button.text_content()
-                        self.logger.info(f"    Found button with selector '{selector}': '{button_text}'")
-                        if button_text and 'Show All' in button_text:
-                            working_selector = selector
-                            break
-                        else:
-                            show_all_button = None
-                except Exception as e:
-                    self.logger.debug(f"    Selector '{selector}' failed: {e}")
-                    continue
-            
-            if show_all_button and working_selector:
-                try:
-                    self.logger.info(f"    Found 'Show All' projects button for {name} using selector: {working_selector}")
-                    self.logger.info(f"    Button text: '{await show_all_button.text_content()}'")
-                    
-                    # Click the "Show All" button
-                    await show_all_button.click()
-                    self.logger.info(f"    Clicked 'Show All' button for {name}")
-                    
-                    # Wait for the detailed project table to load
-                    try:
-                        await self.page.wait_for_selector('table, .project, .projects, .k-grid', state='visible', timeout=10000)
-                        self.logger.info(f"    Project table loaded for {name}")
-                    except Exception as e:
-                        self.logger.warning(f"    Project table not found after clicking Show All for {name}: {e}")
-                        # Continue anyway - we might still find projects
-                    
-                    # Extract projects from the detailed table
-                    detailed_projects = await self.page.evaluate("""
+                # Debug: Check what buttons/links are available on the page
+                if hasattr(self, 'config') and self.config.DEBUG_MODE:
+                    available_buttons = await page.evaluate("""
                         () => {
-                            const projects = {};
-                            const tableCells = document.querySelectorAll('.tableViewStyles__StyledCell-sc-nfq3ae-1.hZvVqM.styledTableCell');
-                            
-                            tableCells.forEach(cell => {
-                                const projectLink = cell.querySelector('a[href*="/project/"]');
-                                if (projectLink) {
-                                    const name = projectLink.textContent?.trim();
-                                    const url = projectLink.href;
-                                    if (name && url && name.length > 1) {
-                                        const projectKey = `proj_${Object.keys(projects).length + 1}`;
-                                        projects[projectKey] = {
-                                            'name': name,
-                                            'description': '',
-                                            'role': '',
-                                            'year': '',
-                                            'client': '',
-                                            'number': '',
-                                            'url': url,
-                                            'source': 'detailed_table'
-                                        };
-                                    }
+                            const buttons = [];
+                            const allButtons = document.querySelectorAll('button, a, [role="button"]');
+                            allButtons.forEach((btn, index) => {
+                                const text = btn.textContent?.trim() || '';
+                                const classes = btn.className || '';
+                                const href = btn.href || '';
+                                if (text.toLowerCase().includes('show') || classes.toLowerCase().includes('show') || classes.toLowerCase().includes('pill')) {
+                                    buttons.push({
+                                        index: index,
+                                        tag: btn.tagName,
+                                        text: text,
+                                        classes: classes,
+                                        href: href
+                                    });
                                 }
                             });
-                            
-                            return projects;
+                            return buttons;
                         }
                     """)
+                    self.logger.info(f"    Available Show/Pill buttons for {name}: {available_buttons}")
+            
+                # Try multiple selectors for the Show All button
+                show_all_selectors = [
+                    '.RoundedBox-sc-1nzfcbz-0.PillBox-sc-p125c4-0.fQdvmA.driLso.pill',  # Original specific selector
+                    'button:has-text("Show All")',  # More generic text-based selector
+                    'a:has-text("Show All")',       # Link-based selector
+                    '[class*="pill"]:has-text("Show All")',  # Class-based selector
+                    'button[class*="Show"]',        # Button with "Show" in class
+                    'a[class*="Show"]',             # Link with "Show" in class
+                    'button:has-text("Show")',      # Any button with "Show" text
+                    'a:has-text("Show")'            # Any link with "Show" text
+                ]
+            
+                show_all_button = None
+                working_selector = None
+            
+                for selector in show_all_selectors:
+                    try:
+                        show_all_button = await page.query_selector(selector)
+                        if show_all_button:
+                            button_text = await show_all_button.text_content()
+                            self.logger.info(f"    Found button with selector '{selector}': '{button_text}'")
+                            if button_text and 'Show All' in button_text:
+                                working_selector = selector
+                                break
+                            else:
+                                show_all_button = None
+                    except Exception as e:
+                        self.logger.debug(f"    Selector '{selector}' failed: {e}")
+                        continue
+            
+                if show_all_button and working_selector:
+                    try:
+                        self.logger.info(f"    Found 'Show All' projects button for {name} using selector: {working_selector}")
+                        self.logger.info(f"    Button text: '{await show_all_button.text_content()}'")
+                    
+                        # Click the "Show All" button
+                        await show_all_button.click()
+                        self.logger.info(f"    Clicked 'Show All' button for {name}")
                     
-                    # Add detailed projects to existing projects (avoid duplicates)
-                    for project_key, detailed_project in detailed_projects.items():
-                        # Check if we already have this project by URL
-                        existing_project = next((p for p in employee.projects.values() if p['url'] == detailed_project['url']), None)
-                        if not existing_project:
-                            employee.projects[project_key] = detailed_project
+                        # Wait for the detailed project table to load
+                        try:
+                            await page.wait_for_selector('table, .project, .projects, .k-grid', state='visible', timeout=10000)
+                            self.logger.info(f"    Project table loaded for {name}")
+                        except Exception as e:
+                            self.logger.warning(f"    Project table not found after clicking Show All for {name}: {e}")
+                            # Continue anyway - we might still find projects
                     
-                    self.logger.info(f"    Found {len(detailed_projects)} additional projects from detailed table")
+                        # Stream the grid page by page (or scroll window by window) until it ends
+                        # or reaches projects already known from the previous scrape
+                        previous = self._previous_detailed_projects(name)
+                        if previous and self._grid_full_walk_due(profile_url):
+                            self.logger.info(f"    [GRID] Periodic full walk of the projects grid for {name}")
+                            previous = {}
+                        grid_streamer = ProjectGridStreamer(max_chunks=self.grid_max_chunks,
+                                                            stop_after_known=self.grid_stop_after_known)
+                        detailed_projects = {}
+                        async for rows in grid_streamer.stream(page, self._readiness_for(page), known_urls=list(previous)):
+                            for row in rows:
+                                detailed_projects[f"proj_{len(detailed_projects) + 1}"] = {
+                                    'name': row['name'],
+                                    'description': '',
+                                    'role': '',
+                                    'year': '',
+                                    'client': '',
+                                    'number': '',
+                                    'url': row['url'],
+                                    'source': 'detailed_table'
+                                }
+                        if grid_streamer.stopped_early:
+                            # The rows that followed the stop point last time are taken as unchanged;
+                            # earlier previous rows that weren't streamed again are gone from the site
+                            streamed_urls = {p['url'] for p in detailed_projects.values()}
+                            for url, project in list(previous.items())[grid_streamer.resume_position:]:
+                                if url not in streamed_urls:
+                                    detailed_projects[f"proj_{len(detailed_projects) + 1}"] = project
                     
-                    # Avoid go_back; stay on page and continue
+                        # Add detailed projects to existing projects (avoid duplicates)
+                        existing_urls = {p['url'] for p in employee.projects.values()}
+                        for project_key, detailed_project in detailed_projects.items():
+                            # Check if we already have this project by URL
+                            if detailed_project['url'] not in existing_urls:
+                                employee.projects[project_key] = detailed_project
                     
-                except Exception as e:
-                    self.logger.warning(f"    Failed to extract detailed projects for {name}: {e}")
-            else:
-                self.logger.info(f"    No 'Show All' button found for {name}")
+                        self.logger.info(f"    Found {len(detailed_projects)} additional projects from detailed table")
+                    
+                        # Avoid go_back; stay on page and continue
+                    
+                    except Exception as e:
+                        show_all_error = str(e)
+                        self.logger.warning(f"    Failed to extract detailed projects for {name}: {e}")
+                else:
+                    self.logger.info(f"    No 'Show All' button found for {name}")
+            finally:
+                self.perf.end_operation(show_all_operation, success=show_all_error is None, error_message=show_all_error)
             
             # Download the actual profile image using the extracted image URL
-            if self.download_images and self.image_downloader and employee.image_url:
-                try:
-                    local_path = await self.image_downloader.download_image(
-                        employee.image_url, 
-                        name,
-                        self.page  # Pass page for authenticated requests
-                    )
-                    if local_path:
-                        employee.image_local_path = local_path
-                        self.logger.info(f"Downloaded profile image for {name}: {local_path}")
-                    else:
-                        # Fallback to screenshot if download fails
-                        local_path = await self.image_downloader.capture_preview_image(
-                            self.page, 
-                            name,
-                            image_selector='img[src*="/api/image/"]:not([src*="favicon"]):not([src*="logo"]):not([src*="icon"])'
-                        )
-                        if local_path:
-                            employee.image_local_path = local_path
-                            self.logger.info(f"Captured preview image for {name}: {local_path}")
-                except Exception as e:
-                    self.logger.error(f"Failed to download image for {name}: {e}")
+            async with self.perf.track_operation('image.capture'):
+                await self._attach_profile_image(employee, name, page)
             
             # Print detailed extracted data in blue after comprehensive extraction
             self._print_extracted_data(employee, name)
@@ -814,6 +1236,183 @@ class UnifiedEmployeeScraper:
             self.logger.error(f"[ERROR] Error scraping comprehensive profile {profile_url}: {e}")
             return None
     
+    async def _run_extraction_bundle(self, page: Page) -> Optional[Dict[str, Any]]:
+        """
+        Extract every profile section in one evaluate using the injected bundle.
+        
+        Returns None (per-section extraction is used instead) if the bundle is
+        missing or fails on this page.
+        """
+        self._bundle_results.pop(page, None)
+        try:
+            async with self.perf.track_operation('extract.bundle'):
+                bundle = await page.evaluate(EXTRACT_ALL_JS, {
+                    'sections': self.BUNDLE_SECTION_NAMES,
+                    'profileImageSelector': self.selectors['profile_image']
+                })
+        except Exception as e:
+            self.logger.warning(f"    Extraction bundle failed, using per-section extraction: {e}")
+            return None
+        
+        if self.validate_extraction_bundle:
+            await self._validate_extraction_bundle(page, bundle)
+        self._bundle_results[page] = bundle
+        return bundle
+    
+    async def _validate_extraction_bundle(self, page: Page, bundle: Dict[str, Any]):
+        """Compare the bundle result with the per-section evaluates on the same page state"""
+        counted = self.round_trips.counts.get(page)
+        expected = {
+            'title': await page.title(),
+            'debugName': await page.evaluate(DEBUG_NAME_JS),
+            'basic': await page.evaluate(BASIC_DATA_JS, self.selectors['profile_image']),
+            'contact': await page.evaluate(CONTACT_DATA_JS),
+            'sections': {name: await page.evaluate(SECTION_PARSER_JS, name) for name in self.BUNDLE_SECTION_NAMES},
+            'projectLinks': await page.evaluate(PROJECT_LINKS_JS),
+        }
+        # Validation round trips are not part of the per-profile metric
+        if counted is not None:
+            self.round_trips.counts[page] = counted
+        
+        mismatched = [key for key in expected if expected[key] != bundle.get(key)]
+        if 'sections' in mismatched:
+            mismatched.remove('sections')
+            mismatched += [f"section '{name}'" for name in self.BUNDLE_SECTION_NAMES
+                           if expected['sections'][name] != bundle['sections'].get(name)]
+        if mismatched:
+            self.bundle_mismatches += 1
+            self.logger.warning(f"    [VALIDATE] Extraction bundle differs from per-section results: {mismatched}")
+        else:
+            self.logger.info("    [VALIDATE] Extraction bundle matches per-section results")
+    
+    async def _scrape_employee_from_api(self, profile_url: str, name: str, image_url: str, page: Page) -> Optional[EmployeeData]:
+        """Fetch a profile straight from the learned JSON endpoints (no page rendering)"""
+        responses = await self.api_extractor.fetch(self.context.request, profile_url)
+        employee = self._employee_from_api_responses(responses, profile_url, name, image_url)
+        if not employee:
+            self.logger.info(f"    [API] Direct fetch gave no usable data for {name}, loading the page")
+            return None
+        
+        self.api_extractor.stats['direct'] += 1
+        await self._attach_profile_image(employee, name, page, allow_preview=False)
+        self._print_extracted_data(employee, name)
+        return employee
+    
+    def _employee_from_api_responses(self, responses: List[tuple], profile_url: str, name: str, image_url: str) -> Optional[EmployeeData]:
+        """Map API payloads to EmployeeData with the same normalization as the DOM path"""
+        employee = self.api_extractor.to_employee(responses, profile_url, name, image_url)
+        if employee:
+            employee.position = self._normalize_position(employee.position)
+            employee.bio = self._sanitize_bio(employee.bio)
+        return employee
+    
+    async def _attach_profile_image(self, employee: EmployeeData, name: str, page: Page, allow_preview: bool = True):
+        """
+        Download the profile image and set image_local_path.
+        
+        With background downloads the expected path is set right away and the
+        download is queued (see _drain_image_downloads). Otherwise the image is
+        downloaded inline, falling back to a screenshot of the rendered profile
+        when allow_preview is set (not possible when the profile was fetched from
+        the API without rendering).
+        """
+        if self.background_images and self.download_images and self.image_downloader and employee.image_url:
+            employee.image_local_path = self.image_downloader.expected_path(employee.image_url, name)
+            if self.image_derivatives:
+                # Variants from the previous run; refreshed by _generate_image_derivatives
+                employee.image_srcset = self.image_derivatives.srcset(Path(employee.image_local_path).name)
+            self.image_tasks.append(asyncio.create_task(self._download_profile_image(employee, name)))
+            return
+        
+        if self.download_images and self.image_downloader and employee.image_url:
+            try:
+                local_path = await self.image_downloader.download_image(
+                    employee.image_url, 
+                    name,
+                    page  # Pass page for authenticated requests
+                )
+                if local_path:
+                    employee.image_local_path = local_path
+                    self.logger.info(f"Downloaded profile image for {name}: {local_path}")
+                elif allow_preview:
+                    # Fallback to screenshot if download fails
+                    local_path = await self.image_downloader.capture_preview_image(
+                        page, 
+                        name,
+                        image_selector='img[src*="/api/image/"]:not([src*="favicon"]):not([src*="logo"]):not([src*="icon"])'
+                    )
+                    if local_path:
+                        employee.image_local_path = local_path
+                        self.logger.info(f"Captured preview image for {name}: {local_path}")
+            except Exception as e:
+                self.logger.error(f"Failed to download image for {name}: {e}")
+    
+    async def _download_profile_image(self, employee: EmployeeData, name: str) -> tuple:
+        """
+        Background image download for one employee.
+        
+        Returns:
+            Tuple of (employee, changed) where changed means image_local_path differs
+            from the path that was written to the individual JSON
+        """
+        expected = employee.image_local_path
+        async with self.perf.track_operation('image.download'):
+            local_path = await self.image_downloader.download_image(employee.image_url, name, request=self.context.request)
+        if local_path is None:
+            # Keep the copy from a previous run if there is one
+            previous = self._assets_dir().parent / expected
+            employee.image_local_path = expected if previous.exists() else None
+        else:
+            employee.image_local_path = local_path
+        return employee, employee.image_local_path != expected
+    
+    async def _drain_image_downloads(self):
+        """Wait for queued image downloads, fix up JSON files whose image path changed"""
+        if not self.image_tasks:
+            return
+        self.logger.info(f"[INFO] Waiting for {len(self.image_tasks)} image downloads to finish...")
+        results = await asyncio.gather(*self.image_tasks, return_exceptions=True)
+        self.image_tasks = []
+        
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error(f"[ERROR] Image download task failed: {result}")
+                continue
+            employee, changed = result
+            if changed:
+                await self._save_individual_employee(employee)
+        
+        self.image_downloader.save_manifest()
+        stats = self.image_downloader.stats
+        print(f"🖼️ Images: {stats['downloaded']} downloaded, {stats['not_modified']} not modified, "
+              f"{stats['unchanged']} unchanged, {stats['deduplicated']} deduplicated, {stats['failed']} failed")
+        self.logger.info(f"[INFO] Image pipeline stats: {stats}")
+    
+    async def _generate_image_derivatives(self):
+        """Build responsive image variants and store their srcset map on each employee"""
+        if not self.image_derivatives or not self.image_derivatives.enabled:
+            return
+        
+        sources = {}
+        for employee in self.employees:
+            if employee.image_local_path:
+                source_name = Path(employee.image_local_path).name
+                sources[source_name] = self.image_downloader.manifest.get(source_name, {}).get("sha256")
+        if not sources:
+            return
+        
+        await self.image_derivatives.generate(sources)
+        
+        for employee in self.employees:
+            srcset = self.image_derivatives.srcset(Path(employee.image_local_path).name) if employee.image_local_path else {}
+            if srcset != employee.image_srcset:
+                employee.image_srcset = srcset
+                await self._save_individual_employee(employee)
+        
+        stats = self.image_derivatives.stats
+        print(f"🖼️ Image derivatives: {stats['generated']} generated, {stats['skipped']} unchanged, {stats['failed']} failed")
+        self.logger.info(f"[INFO] Image derivative stats: {stats}")
+    
     def _print_extracted_data(self, employee: EmployeeData, name: str):
         """Print detailed extracted data in blue color"""
         print(f"\n🔵 DETAILED EXTRACTED DATA FOR {name.upper()}:")
@@ -892,23 +1491,16 @@ class UnifiedEmployeeScraper:
     # Removed office location normalization; use raw data only
     
     async def _save_individual_employee(self, employee: EmployeeData) -> str:
-        """Save individual employee as JSON file immediately"""
+        """
+        Save individual employee as JSON file immediately.
+        
+        The file is written atomically from the writer thread pool and left
+        untouched when nothing but scraped_at changed.
+        
+        Returns:
+            Path of the employee's JSON file, or "" if it was not saved
+        """
         try:
-            from pathlib import Path
-            import json
-            
-            # Set output paths - always use docs folder relative to project root
-            project_root = Path(__file__).parent.parent.parent.parent
-            output_path = project_root / "docs" / "assets"
-            individual_employees_dir = output_path / "individual_employees"
-            individual_employees_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Debug: Log the directory structure
-            self.logger.info(f"[DEBUG] Project root: {project_root}")
-            self.logger.info(f"[DEBUG] Output path: {output_path}")
-            self.logger.info(f"[DEBUG] Individual employees dir: {individual_employees_dir}")
-            self.logger.info(f"[DEBUG] Directory exists: {individual_employees_dir.exists()}")
-            
             # Create filename from employee name
             employee_name = employee.human_name or "unknown"
             
@@ -918,94 +1510,72 @@ class UnifiedEmployeeScraper:
                 self.logger.warning(f"[SKIP] Skipping invalid employee name: {employee_name}")
                 return ""
             
-            clean_name = employee_name.replace(' ', '_').replace('/', '_').replace('\\', '_')
-            filename = f"{clean_name}.json"
-            file_path = individual_employees_dir / filename
+            file_path = self._individual_file_path(employee_name)
             
             # Save the employee data
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(employee.to_dict(), f, indent=2, ensure_ascii=False, default=str)
-            
-            self.logger.info(f"[SAVED] Individual JSON: {filename}")
+            async with self.perf.track_operation('save.individual_json'):
+                written = await self.json_writer.write(file_path, employee.to_dict())
+            if written:
+                self.logger.info(f"[SAVED] Individual JSON: {file_path.name}")
+            else:
+                self.logger.info(f"[UNCHANGED] Individual JSON: {file_path.name}")
             return str(file_path)
             
         except Exception as e:
             self.logger.error(f"[ERROR] Failed to save individual JSON for {employee.human_name}: {e}")
             return ""
     
-    async def _scroll_to_load_all_employees(self):
-        """Scroll down to load all employees via infinite scroll with overlap"""
+    async def _scroll_to_load_all_employees(self, readiness: ReadinessDetector):
+        """
+        Scroll down to load all employees via infinite scroll with overlap.
+        
+        After each scroll, waits until the card count changes, or until XHRs and
+        DOM mutations have gone quiet without a change (nothing left to load).
+        """
+        cards_selector = self.selectors['employee_cards']
         try:
-            previous_count = 0
             scroll_attempts = 0
-            max_scroll_attempts = 30  # Increased to allow more thorough scrolling
+            max_scroll_attempts = 30
             no_new_content_count = 0  # Track consecutive attempts with no new content
             max_no_new_content = 3  # Stop after 3 consecutive attempts with no new content
+            current_count = await self.page.evaluate(
+                "(selector) => document.querySelectorAll(selector).length", cards_selector
+            )
             
             while scroll_attempts < max_scroll_attempts:
-                # Count current employees
-                current_count = await self.page.evaluate(f"""
-                    () => {{
-                        return document.querySelectorAll('{self.selectors['employee_cards']}').length;
-                    }}
-                """)
-                
                 self.logger.info(f"[INFO] Found {current_count} employees so far...")
                 
-                # If no new employees loaded, increment counter
-                if current_count == previous_count and scroll_attempts > 0:
+                # Scroll with overlap - scroll to 80% of current height instead of 100%
+                # (retries after a miss go all the way to the bottom)
+                current_height = await self.page.evaluate("document.body.scrollHeight")
+                fraction = 0.8 if no_new_content_count == 0 else 1.0
+                scroll_position = int(current_height * fraction)
+                self.logger.info(f"[INFO] Scrolling to position {scroll_position} ({int(fraction * 100)}% of {current_height})")
+                await self.page.evaluate(f"window.scrollTo(0, {scroll_position})")
+                scroll_attempts += 1
+                
+                new_count = await readiness.wait_for_count_change(cards_selector, current_count, label='directory_scroll')
+                if new_count is None:
                     no_new_content_count += 1
                     self.logger.info(f"[INFO] No new employees loaded after scroll {scroll_attempts}. Count: {no_new_content_count}/{max_no_new_content}")
-                    
-                    # If we've had no new content for several attempts, we're done
                     if no_new_content_count >= max_no_new_content:
                         self.logger.info(f"[INFO] No new employees loaded for {max_no_new_content} consecutive attempts. Total: {current_count}")
-                    break
+                        break
                 else:
-                    # Reset counter if we found new content
+                    # New cards arrived; let the batch finish rendering before the next scroll
                     no_new_content_count = 0
-                
-                # Scroll with overlap - scroll to 80% of current height instead of 100%
-                current_height = await self.page.evaluate("document.body.scrollHeight")
-                scroll_position = int(current_height * 0.8)  # Scroll to 80% of current height
-                
-                self.logger.info(f"[INFO] Scrolling to position {scroll_position} (80% of {current_height})")
-                await self.page.evaluate(f"window.scrollTo(0, {scroll_position})")
-                
-                # Wait for content to load with longer delays
-                await asyncio.sleep(3)  # Increased from 2 to 3 seconds
-                
-                # Wait for network to be idle
-                try:
-                    await self.page.wait_for_load_state("networkidle", timeout=15000)  # Increased timeout
-                except Exception as e:
-                    self.logger.info(f"[INFO] Network idle timeout, continuing...")
-                
-                # Additional wait to ensure all content is loaded
-                await asyncio.sleep(2)
-                
-                # Verify that we actually scrolled and content loaded
-                new_height = await self.page.evaluate("document.body.scrollHeight")
-                if new_height > current_height:
-                    self.logger.info(f"[INFO] Page height increased from {current_height} to {new_height}")
-                else:
-                    self.logger.info(f"[INFO] Page height unchanged at {current_height}")
-                
-                previous_count = current_count
-                scroll_attempts += 1
+                    current_count = new_count
+                    await readiness.wait_for_settle(cards_selector, label='directory_batch_render')
             
             # Final scroll to bottom to ensure we get everything
             self.logger.info(f"[INFO] Performing final scroll to bottom...")
             await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(3)
-            await self.page.wait_for_load_state("networkidle", timeout=10000)
-            
-            # Get final count
-            final_count = await self.page.evaluate(f"""
-                () => {{
-                    return document.querySelectorAll('{self.selectors['employee_cards']}').length;
-                }}
-            """)
+            final_count = await readiness.wait_for_count_change(cards_selector, current_count, label='directory_final')
+            if final_count is not None:
+                await readiness.wait_for_settle(cards_selector, label='directory_batch_render')
+            final_count = await self.page.evaluate(
+                "(selector) => document.querySelectorAll(selector).length", cards_selector
+            )
             
             self.logger.info(f"[SUCCESS] Finished scrolling. Total employees found: {final_count}")
             
@@ -1013,8 +1583,9 @@ class UnifiedEmployeeScraper:
             self.logger.warning(f"[WARNING] Error during scrolling: {e}")
             # Continue anyway - we'll work with whatever employees we found
     
-    async def _capture_debug_info(self, reason: str):
+    async def _capture_debug_info(self, reason: str, page: Optional[Page] = None):
         """Capture debug information when selectors fail"""
+        page = page or self.page
         try:
             # Create debug directory
             debug_dir = Path(__file__).parent.parent.parent.parent / "debug" / "dom_captures"
@@ -1028,11 +1599,11 @@ class UnifiedEmployeeScraper:
             html_file = debug_dir / f"debug_{reason}_{timestamp}.html"
             
             # Get the full HTML content after JavaScript has rendered
-            html_content = await self.page.content()
+            html_content = await page.content()
             
             # Try to get a more readable version by evaluating the DOM structure
             try:
-                readable_dom = await self.page.evaluate("""
+                readable_dom = await page.evaluate("""
                     () => {
                         // Get the main content area
                         const mainContent = document.querySelector('#page-content, [class*="profile"], [class*="Profile"], [class*="employee"], [class*="Employee"], [class*="content"], [class*="Content"], [class*="main"], [class*="Main"]');
@@ -1065,20 +1636,21 @@ class UnifiedEmployeeScraper:
             
             # Also capture a screenshot
             screenshot_file = debug_dir / f"debug_{reason}_{timestamp}.png"
-            await self.page.screenshot(path=str(screenshot_file))
+            await page.screenshot(path=str(screenshot_file))
             self.logger.info(f"[DEBUG] Captured screenshot to {screenshot_file}")
             
             # Analyze what's actually on the page
-            await self._analyze_page_structure(debug_dir, timestamp)
+            await self._analyze_page_structure(debug_dir, timestamp, page=page)
             
         except Exception as e:
             self.logger.error(f"[ERROR] Failed to capture debug info: {e}")
     
-    async def _analyze_page_structure(self, debug_dir: Path, timestamp: str):
+    async def _analyze_page_structure(self, debug_dir: Path, timestamp: str, page: Optional[Page] = None):
         """Analyze the actual page structure to find correct selectors"""
+        page = page or self.page
         try:
             # Get all elements with common patterns
-            analysis = await self.page.evaluate("""
+            analysis = await page.evaluate("""
                 () => {
                     const results = {
                         allElements: [],
@@ -1164,168 +1736,29 @@ class UnifiedEmployeeScraper:
         except Exception as e:
             self.logger.error(f"[ERROR] Failed to analyze page structure: {e}")
     
-    async def _parse_section_by_text(self, section_name: str) -> Dict[str, Any]:
+    async def _parse_section_by_text(self, section_name: str, page: Optional[Page] = None) -> Dict[str, Any]:
         """
         Parse a section by finding its header text, then extracting data below it.
         Handles both simple values and table structures.
         
         Args:
             section_name: The text to look for in headers (e.g., "Education", "Contact Info")
+            page: Page to parse (defaults to the scraper's main page)
             
         Returns:
             Dict containing the parsed data:
             - For simple sections: {'value': 'extracted_text'}
             - For table sections: {'row_key': {'header1': 'value1', 'header2': 'value2'}}
         """
+        page = page or self.page
         try:
-            # Find the section header by text
-            section_data = await self.page.evaluate(f"""
-                () => {{
-                    const sectionName = '{section_name}';
-                    const results = {{
-                        found: false,
-                        sectionType: 'none',
-                        data: {{}},
-                        rawText: ''
-                    }};
-                    
-                    // Look for section headers (h1, h2, h3, h4, h5, h6, or elements with common header classes)
-                    const headerSelectors = [
-                        'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
-                        '[class*="header"]', '[class*="title"]', '[class*="section"]',
-                        '[class*="block"]', '[class*="field"]'
-                    ];
-                    
-                    let sectionHeader = null;
-                    let sectionContainer = null;
-                    
-                    // Try to find the section header
-                    for (const selector of headerSelectors) {{
-                        const headers = document.querySelectorAll(selector);
-                        for (const header of headers) {{
-                            const text = header.textContent?.trim().toLowerCase() || '';
-                            if (text.includes(sectionName.toLowerCase())) {{
-                                sectionHeader = header;
-                                sectionContainer = header.closest('.EntityFields, .section, .block, .field, .container, div');
-                                break;
-                            }}
-                        }}
-                        if (sectionHeader) break;
-                    }}
-                    
-                    if (!sectionHeader) {{
-                        return results;
-                    }}
-                    
-                    results.found = true;
-                    results.rawText = sectionContainer ? sectionContainer.textContent : '';
-                    
-                    // Determine if this is a table or simple section
-                    const tableElements = sectionContainer ? sectionContainer.querySelectorAll('table, [class*="table"], [class*="grid"], [class*="Table"], [class*="Grid"]') : [];
-                    const rowElements = sectionContainer ? sectionContainer.querySelectorAll('tr, [class*="row"], [class*="Row"], [class*="tr"], [class*="Tr"]') : [];
-                    
-                    if (tableElements.length > 0 || rowElements.length > 0) {{
-                        // This is a table section
-                        results.sectionType = 'table';
-                        
-                        // Try to extract table data
-                        const table = tableElements[0] || sectionContainer;
-                        const rows = table.querySelectorAll('tr, [class*="row"], [class*="Row"], [class*="tr"], [class*="Tr"]');
-                        
-                        if (rows.length > 0) {{
-                            // Extract headers from first row
-                            const firstRow = rows[0];
-                            const headers = [];
-                            const headerCells = firstRow.querySelectorAll('th, td, [class*="cell"], [class*="Cell"], [class*="header"], [class*="Header"], [class*="th"], [class*="Th"], [class*="td"], [class*="Td"]');
-                            
-                            headerCells.forEach(cell => {{
-                                const text = cell.textContent?.trim();
-                                if (text) headers.push(text);
-                            }});
-                            
-                            // If no headers found, try to infer from data rows
-                            if (headers.length === 0 && rows.length > 1) {{
-                                const dataRow = rows[1];
-                                const dataCells = dataRow.querySelectorAll('td, [class*="cell"], [class*="Cell"], [class*="td"], [class*="Td"]');
-                                headers.length = dataCells.length;
-                                headers.fill('column');
-                                headers.forEach((_, i) => headers[i] = `column_${{i + 1}}`);
-                            }}
-                            
-                            // Extract data rows
-                            for (let i = 1; i < rows.length; i++) {{
-                                const row = rows[i];
-                                const cells = row.querySelectorAll('td, [class*="cell"], [class*="Cell"], [class*="td"], [class*="Td"]');
-                                const rowData = {{}};
-                                let rowKey = '';
-                                
-                                cells.forEach((cell, cellIndex) => {{
-                                    const text = cell.textContent?.trim();
-                                    if (text) {{
-                                        const header = headers[cellIndex] || `column_${{cellIndex + 1}}`;
-                                        rowData[header] = text;
-                                        
-                                        // Use first column as row key
-                                        if (cellIndex === 0) {{
-                                            rowKey = text;
-                                        }}
-                                    }}
-                                }});
-                                
-                                if (rowKey && Object.keys(rowData).length > 0) {{
-                                    results.data[rowKey] = rowData;
-                                }}
-                            }}
-                        }} else {{
-                            // No clear table structure, try to parse as key-value pairs
-                            const fieldElements = sectionContainer.querySelectorAll('[class*="field"], [class*="Field"], [data-kafieldname], [class*="value"], [class*="Value"], [class*="text"], [class*="Text"]');
-                            fieldElements.forEach(field => {{
-                                const text = field.textContent?.trim();
-                                if (text && text.length > 1) {{
-                                    // Try to split on common separators
-                                    const parts = text.split(/[:\\-\\|]/);
-                                    if (parts.length >= 2) {{
-                                        const key = parts[0].trim();
-                                        const value = parts.slice(1).join(':').trim();
-                                        if (key && value) {{
-                                            results.data[key] = value;
-                                        }}
-                                    }} else {{
-                                        // Single value, use as key
-                                        results.data[text] = text;
-                                    }}
-                                }}
-                            }});
-                        }}
-                    }} else {{
-                        // This is a simple section
-                        results.sectionType = 'simple';
-                        
-                        // Extract simple text content
-                        const textElements = sectionContainer.querySelectorAll('p, span, div, [class*="value"], [class*="Value"], [class*="text"], [class*="Text"], [class*="content"], [class*="Content"]');
-                        const texts = [];
-                        
-                        textElements.forEach(el => {{
-                            const text = el.textContent?.trim();
-                            if (text && text.length > 1 && !text.includes(sectionName)) {{
-                                texts.push(text);
-                            }}
-                        }});
-                        
-                        if (texts.length > 0) {{
-                            results.data['value'] = texts.join(' ').trim();
-                        }} else {{
-                            // Fallback: use raw text content
-                            const rawText = sectionContainer.textContent?.trim() || '';
-                            if (rawText && !rawText.includes(sectionName)) {{
-                                results.data['value'] = rawText;
-                            }}
-                        }}
-                    }}
-                    
-                    return results;
-                }}
-            """)
+            # Find the section header by text (already parsed if the bundle ran on this page)
+            bundle = self._bundle_results.get(page)
+            async with self.perf.track_operation(f"extract.section.{section_name.lower().replace(' ', '_')}"):
+                if bundle and section_name in bundle['sections']:
+                    section_data = bundle['sections'][section_name]
+                else:
+                    section_data = await page.evaluate(SECTION_PARSER_JS, section_name)
             
             self.logger.info(f"    Section '{section_name}' parsing result: found={section_data['found']}, type={section_data['sectionType']}, data_keys={list(section_data['data'].keys())}")
             
@@ -1335,15 +1768,16 @@ class UnifiedEmployeeScraper:
             self.logger.error(f"    Error parsing section '{section_name}': {e}")
             return {}
     
-    async def _extract_education_data(self) -> List[Dict[str, str]]:
+    async def _extract_education_data(self, page: Optional[Page] = None) -> List[Dict[str, str]]:
         """Extract education data using text-based section parsing"""
+        page = page or self.page
         try:
             # Try multiple section names for education
-            education_section_names = ["Education", "Educational Background", "Academic Background", "Degrees"]
+            education_section_names = self.EDUCATION_SECTION_NAMES
             education_data = {}
             
             for section_name in education_section_names:
-                education_data = await self._parse_section_by_text(section_name)
+                education_data = await self._parse_section_by_text(section_name, page=page)
                 if education_data:
                     self.logger.info(f"    Found education section: {section_name}")
                     break
@@ -1508,10 +1942,11 @@ class UnifiedEmployeeScraper:
             self.logger.error(f"    Error extracting education data: {e}")
             return []
     
-    async def _extract_licenses_data(self) -> List[Dict[str, str]]:
+    async def _extract_licenses_data(self, page: Optional[Page] = None) -> List[Dict[str, str]]:
         """Extract licenses data using text-based section parsing"""
+        page = page or self.page
         try:
-            licenses_data = await self._parse_section_by_text("License")
+            licenses_data = await self._parse_section_by_text("License", page=page)
             
             if not licenses_data:
                 return []
@@ -1544,18 +1979,19 @@ class UnifiedEmployeeScraper:
             self.logger.error(f"    Error extracting licenses data: {e}")
             return []
     
-    async def _extract_projects_data(self) -> Dict[str, Dict[str, str]]:
+    async def _extract_projects_data(self, page: Optional[Page] = None) -> Dict[str, Dict[str, str]]:
         """Extract projects data using text-based parsing and merge with detailed table data"""
+        page = page or self.page
         try:
             self.logger.info("    Extracting projects data using text-based parser...")
             
             # Try different section names for projects
-            section_names = ["Projects", "Project", "Work", "Portfolio", "Experience"]
+            section_names = self.PROJECT_SECTION_NAMES
             projects_data = None
             section_found = None
             
             for section_name in section_names:
-                projects_data = await self._parse_section_by_text(section_name)
+                projects_data = await self._parse_section_by_text(section_name, page=page)
                 # Check if we got the structured result or raw data
                 if projects_data and 'found' in projects_data:
                     # Structured result from _parse_section_by_text
@@ -1587,49 +2023,38 @@ class UnifiedEmployeeScraper:
             # to avoid clicking the "Show All" button twice and changing page state
             
             # Add project links directly from the page
-            project_links = await self.page.evaluate("""
-                () => {
-                    const projectLinks = [];
-                    // Look for project links anywhere on the page (more robust)
-                    const allLinks = document.querySelectorAll('a[href*="/project/"]');
-                    allLinks.forEach(link => {
-                        const href = link.getAttribute('href');
-                        const text = link.textContent?.trim();
-                        if (href && text && text.length > 3) {
-                            projectLinks.push({
-                                url: href.startsWith('http') ? href : 'https://ei.ennead.com' + href,
-                                name: text,
-                                project_number: href.split('/').pop() || ''
-                            });
-                        }
-                    });
-                    return projectLinks;
-                }
-            """)
+            bundle = self._bundle_results.get(page)
+            if bundle:
+                project_links = bundle['projectLinks']
+            else:
+                project_links = await page.evaluate(PROJECT_LINKS_JS)
             
             self.logger.info(f"    Found {len(project_links)} project links directly from page")
             
-            # Try to match project links with existing projects
+            # Try to match project links with existing projects (indexed, not pairwise)
+            name_index = ProjectNameIndex()
+            for proj_key, proj_data in text_projects.items():
+                name_index.set(proj_key, proj_data['name'])
+            
             for link in project_links:
                 link_name = link.get('name', '')
                 link_url = link.get('url', '')
                 link_number = link.get('project_number', '')
                 
                 # Try to find a matching project in our dict
-                matched = False
-                for proj_key, proj_data in text_projects.items():
-                    if self._are_projects_similar(proj_data['name'], link_name):
-                        # Update with URL and number if we found a match
-                        if not proj_data['url']:
-                            proj_data['url'] = link_url
-                        if not proj_data['number']:
-                            proj_data['number'] = link_number
-                        matched = True
-                        break
+                matched_key = name_index.find(link_name)
+                if matched_key:
+                    proj_data = text_projects[matched_key]
+                    # Update with URL and number if we found a match
+                    if not proj_data['url']:
+                        proj_data['url'] = link_url
+                    if not proj_data['number']:
+                        proj_data['number'] = link_number
                 
                 # If no match found, add as new project
-                if not matched and link_name:
+                if not matched_key and link_name:
                     project_counter = len(text_projects) + 1
+                    name_index.set(f"proj_{project_counter}", link_name)
                     text_projects[f"proj_{project_counter}"] = {
                         'name': link_name,
                         'description': '',
@@ -1759,11 +2184,12 @@ class UnifiedEmployeeScraper:
         
         return projects_dict
     
-    async def _extract_detailed_table_projects(self):
+    async def _extract_detailed_table_projects(self, page: Optional[Page] = None):
         """Extract projects from detailed table (Show All page)"""
+        page = page or self.page
         try:
             # Look for 'Show All' button and click it
-            show_all_button = await self.page.query_selector('a:has-text("Show All")')
+            show_all_button = await page.query_selector('a:has-text("Show All")')
             if not show_all_button:
                 self.logger.info("    No 'Show All' button found for detailed projects")
                 return {}
@@ -1773,14 +2199,14 @@ class UnifiedEmployeeScraper:
             
             # Wait for the detailed table to load
             try:
-                await self.page.wait_for_selector('table, .project, .projects, .k-grid', timeout=10000)
+                await page.wait_for_selector('table, .project, .projects, .k-grid', timeout=10000)
                 self.logger.info("    Detailed projects table loaded")
             except Exception as e:
                 self.logger.warning(f"    Project table not found after clicking Show All: {e}")
                 return {}
             
             # Extract projects from the detailed table
-            detailed_projects = await self.page.evaluate("""
+            detailed_projects = await page.evaluate("""
                 () => {
                     const projects = [];
                     
@@ -1867,45 +2293,46 @@ class UnifiedEmployeeScraper:
         
         return cleaned_name
     
-    async def _merge_and_deduplicate_projects(self, text_projects, detailed_projects):
+    async def _merge_and_deduplicate_projects(self, text_projects, detailed_projects, page: Optional[Page] = None):
         """Merge text-based and detailed table projects, removing duplicates"""
+        page = page or self.page
         merged_projects = {}
+        name_index = ProjectNameIndex()
         project_counter = 1
         
         # First, add all text-based projects
         for proj_key, proj_data in text_projects.items():
             merged_projects[f"proj_{project_counter}"] = proj_data
+            name_index.set(f"proj_{project_counter}", proj_data['name'])
             project_counter += 1
         
         # Then add detailed table projects, checking for duplicates
         for proj_key, proj_data in detailed_projects.items():
             # Check if this project already exists (by name similarity)
-            is_duplicate = False
-            for existing_key, existing_data in merged_projects.items():
-                if self._are_projects_similar(proj_data['name'], existing_data['name']):
-                    # Update existing project with more complete data
-                    if not existing_data['url'] and proj_data['url']:
-                        existing_data['url'] = proj_data['url']
-                    if not existing_data['number'] and proj_data['number']:
-                        existing_data['number'] = proj_data['number']
-                    if not existing_data['description'] and proj_data['description']:
-                        existing_data['description'] = proj_data['description']
-                    if not existing_data['role'] and proj_data['role']:
-                        existing_data['role'] = proj_data['role']
-                    if not existing_data['year'] and proj_data['year']:
-                        existing_data['year'] = proj_data['year']
-                    if not existing_data['client'] and proj_data['client']:
-                        existing_data['client'] = proj_data['client']
-                    existing_data['source'] = 'merged'
-                    is_duplicate = True
-                    break
-            
-            if not is_duplicate:
+            existing_key = name_index.find(proj_data['name'])
+            if existing_key:
+                existing_data = merged_projects[existing_key]
+                # Update existing project with more complete data
+                if not existing_data['url'] and proj_data['url']:
+                    existing_data['url'] = proj_data['url']
+                if not existing_data['number'] and proj_data['number']:
+                    existing_data['number'] = proj_data['number']
+                if not existing_data['description'] and proj_data['description']:
+                    existing_data['description'] = proj_data['description']
+                if not existing_data['role'] and proj_data['role']:
+                    existing_data['role'] = proj_data['role']
+                if not existing_data['year'] and proj_data['year']:
+                    existing_data['year'] = proj_data['year']
+                if not existing_data['client'] and proj_data['client']:
+                    existing_data['client'] = proj_data['client']
+                existing_data['source'] = 'merged'
+            else:
                 merged_projects[f"proj_{project_counter}"] = proj_data
+                name_index.set(f"proj_{project_counter}", proj_data['name'])
                 project_counter += 1
         
         # Also try to get project links directly from the page
-        project_links = await self.page.evaluate("""
+        project_links = await page.evaluate("""
             () => {
                 const projectLinks = [];
                 // Look for project links anywhere on the page (more robust)
@@ -1934,19 +2361,18 @@ class UnifiedEmployeeScraper:
             link_number = link.get('project_number', '')
             
             # Try to find a matching project in our dict
-            matched = False
-            for proj_key, proj_data in merged_projects.items():
-                if self._are_projects_similar(proj_data['name'], link_name):
-                    # Update with URL and number if we found a match
-                    if not proj_data['url']:
-                        proj_data['url'] = link_url
-                    if not proj_data['number']:
-                        proj_data['number'] = link_number
-                    matched = True
-                    break
+            matched_key = name_index.find(link_name)
+            if matched_key:
+                proj_data = merged_projects[matched_key]
+                # Update with URL and number if we found a match
+                if not proj_data['url']:
+                    proj_data['url'] = link_url
+                if not proj_data['number']:
+                    proj_data['number'] = link_number
             
             # If no match found, add as new project
-            if not matched and link_name:
+            if not matched_key and link_name:
+                name_index.set(f"proj_{project_counter}", link_name)
                 merged_projects[f"proj_{project_counter}"] = {
                     'name': link_name,
                     'description': '',
@@ -1963,54 +2389,23 @@ class UnifiedEmployeeScraper:
     
     def _are_projects_similar(self, name1, name2):
         """Check if two project names are similar (to detect duplicates)"""
-        if not name1 or not name2:
-            return False
-        
-        # Normalize names for comparison
-        norm1 = name1.lower().strip()
-        norm2 = name2.lower().strip()
-        
-        # Exact match
-        if norm1 == norm2:
-            return True
-        
-        # One name contains the other
-        if norm1 in norm2 or norm2 in norm1:
-            return True
-        
-        # Check for significant word overlap
-        words1 = set(norm1.split())
-        words2 = set(norm2.split())
-        
-        # Remove common words that don't help with matching
-        common_words = {'the', 'a', 'an', 'and', 'or', 'of', 'in', 'on', 'at', 'to', 'for', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before', 'after', 'above', 'below', 'between', 'among', 'project', 'building', 'center', 'museum', 'school', 'university', 'hospital', 'library', 'campus', 'development', 'design', 'study', 'plan', 'master', 'complex', 'facility', 'institute', 'office', 'park', 'tower', 'hall', 'theater', 'theatre', 'arena', 'stadium', 'gallery'}
-        
-        words1 = words1 - common_words
-        words2 = words2 - common_words
-        
-        if not words1 or not words2:
-            return False
-        
-        # Calculate overlap
-        overlap = len(words1.intersection(words2))
-        total_words = len(words1.union(words2))
-        
-        # If more than 50% of words overlap, consider them similar
-        return overlap / total_words > 0.5
+        return project_names_similar(name1, name2)
     
-    async def _extract_section_data(self, section_name: str, field_mapping: Dict[str, str] = None) -> Dict[str, Any]:
+    async def _extract_section_data(self, section_name: str, field_mapping: Dict[str, str] = None, page: Optional[Page] = None) -> Dict[str, Any]:
         """
         Extract data from any section using text-based parsing.
         
         Args:
             section_name: The section header text to look for
             field_mapping: Optional mapping of field names (e.g., {'column_1': 'institution', 'column_2': 'degree'})
+            page: Page to parse (defaults to the scraper's main page)
             
         Returns:
             Dict containing the parsed data
         """
+        page = page or self.page
         try:
-            section_data = await self._parse_section_by_text(section_name)
+            section_data = await self._parse_section_by_text(section_name, page=page)
             
             if not section_data:
                 return {}
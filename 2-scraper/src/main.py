@@ -25,6 +25,27 @@ Usage Examples:
     # Debug with explicit DOM capturing
     python -m src.main --debug --debug-dom
     
+    # Scrape profiles on 8 concurrent pages (default: MAX_CONCURRENT_PAGES)
+    python -m src.main --workers 8
+    
+    # Only deep-scrape new/changed profiles (and those older than --ttl-days)
+    python -m src.main --incremental --ttl-days 28
+    
+    # Continue an interrupted run (skips directory discovery and finished profiles)
+    python -m src.main --resume
+    
+    # Extract profiles from the site's JSON API (falls back to DOM parsing)
+    python -m src.main --api
+    
+    # Load every resource type on profile pages (resource blocking off)
+    python -m src.main --no-block
+    
+    # Check the single-pass extraction bundle against per-section extraction
+    python -m src.main --limit 20 --validate-bundle
+    
+    # Record the site's responses for offline benchmarking (see src/benchmark.py)
+    python -m src.main --limit 25 --record debug/recordings/sample
+    
     # Other options
     python -m src.main --headless=false --no-images
     python -m src.main --setup-credentials
@@ -234,7 +255,16 @@ async def main():
     # Essentials retained
     parser.add_argument("--timeout", type=int, default=15000, help="Page load timeout in milliseconds")
     parser.add_argument("--base-url", type=str, default="https://ei.ennead.com/employees/1/all-employees", help="Base URL of the employee directory")
-    # Parallel processing removed - only sequential processing supported for stability
+    parser.add_argument("--workers", type=int, default=None, help="Number of concurrent profile pages (1 = sequential)")
+    parser.add_argument("--incremental", action="store_true", help="Skip profiles whose directory card is unchanged since the last run")
+    parser.add_argument("--no-session-cache", action="store_true", help="Always sign in instead of reusing the cached browser session")
+    parser.add_argument("--resume", action="store_true", help="Continue an interrupted run from its checkpoint journal in debug/")
+    parser.add_argument("--api", action="store_true", help="Extract profiles from the site's JSON API responses (DOM fallback)")
+    parser.add_argument("--no-block", action="store_true", help="Don't block fonts/media/third-party requests on profile pages")
+    parser.add_argument("--no-bundle", action="store_true", help="Extract each profile section with its own evaluate call")
+    parser.add_argument("--validate-bundle", action="store_true", help="Compare the single-pass extraction bundle with per-section results")
+    parser.add_argument("--record", type=str, default=None, help="Record network responses and results to this directory for src.benchmark")
+    parser.add_argument("--ttl-days", type=int, default=None, help="In incremental mode, refresh profiles older than this many days")
     
     args = parser.parse_args()
     
@@ -255,6 +285,23 @@ async def main():
         pass
     config.LIMIT = args.limit
     config.DOM_CAPTURE = args.dom
+    config.INCREMENTAL = args.incremental or config.INCREMENTAL
+    if args.ttl_days is not None:
+        config.INCREMENTAL_TTL_DAYS = args.ttl_days
+    if args.api:
+        config.EXTRACTION_MODE = "api"
+    if args.resume:
+        config.RESUME = True
+    if args.no_session_cache:
+        config.SESSION_CACHE = False
+    if args.no_block:
+        config.BLOCK_RESOURCES = False
+    if args.no_bundle:
+        config.EXTRACTION_BUNDLE = False
+    if args.validate_bundle:
+        config.VALIDATE_EXTRACTION_BUNDLE = True
+    if args.record:
+        config.RECORD_DIR = args.record
     
     # Setup directories and logging
     config.setup_directories()
@@ -282,8 +329,8 @@ async def main():
         logger.info("DOM capture enabled")
     
     try:
-        # Sequential processing only
-        orchestrator = ScraperOrchestrator(config, use_parallel=False, max_workers=1)
+        workers = args.workers or config.MAX_CONCURRENT_PAGES
+        orchestrator = ScraperOrchestrator(config, use_parallel=workers > 1, max_workers=workers)
         success = await run_without_timeout(orchestrator, config)
         
         if not success:
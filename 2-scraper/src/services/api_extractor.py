@@ -0,0 +1,288 @@
+"""
+JSON API extraction for employee profiles.
+
+The employee directory is an SPA that loads profile data from same-origin
+XHR endpoints. This module captures those JSON responses while a profile page
+loads, learns which endpoints carry the profile (their URL contains the
+profile GUID), and then calls them directly with the browser context's session
+cookies so later profiles can be extracted without rendering the page at all.
+
+Mapping is alias-based because the endpoint schema is not documented; the
+DOM extractors in UnifiedEmployeeScraper remain the fallback whenever the
+payloads do not yield a usable profile.
+"""
+import asyncio
+import logging
+import re
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from playwright.async_api import APIRequestContext, Page, Response
+
+from ..core.models import EmployeeData
+
+
+GUID_PATTERN = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+
+# Normalized payload keys (lowercase, alphanumerics only) for scalar profile fields
+FIELD_ALIASES = {
+    'email': ('email', 'emailaddress', 'workemail', 'mail'),
+    'phone': ('phone', 'workphone', 'officephone', 'businessphone', 'phonenumber', 'telephone'),
+    'mobile': ('mobile', 'mobilephone', 'cellphone', 'cell'),
+    'position': ('jobtitle', 'positiontitle', 'position', 'title'),
+    'department': ('department', 'departmentname', 'studio'),
+    'bio': ('personalbio', 'bio', 'biography', 'aboutme', 'about'),
+    'office_location': ('officelocation', 'officename', 'office', 'location'),
+    'years_with_firm': ('yearswithfirm', 'yearsatfirm', 'yearsofservice'),
+    'linkedin_url': ('linkedinurl', 'linkedin'),
+    'website_url': ('websiteurl', 'website'),
+}
+
+# Keys that identify list items of each repeating section
+EDUCATION_KEYS = ('institution', 'school', 'university', 'college')
+LICENSE_KEYS = ('license', 'licensename', 'licensetype', 'registration')
+PROJECT_KEYS = ('projectname', 'projectid', 'projectnumber')
+MEMBERSHIP_KEYS = ('memberships', 'membership', 'affiliations')
+# Keys that identify the person a record describes
+RECORD_ID_KEYS = ('id', 'guid', 'employeeid', 'profileid', 'personid', 'userid')
+RECORD_NAME_KEYS = ('name', 'fullname', 'displayname', 'employeename', 'humanname')
+
+
+def _norm(key: str) -> str:
+    return re.sub(r'[^a-z0-9]', '', str(key).lower())
+
+
+def _first(item: Dict[str, Any], aliases: Tuple[str, ...]) -> str:
+    """First non-empty scalar value among aliased keys of a dict."""
+    normalized = {_norm(k): v for k, v in item.items()}
+    for alias in aliases:
+        value = normalized.get(alias)
+        if value not in (None, '') and not isinstance(value, (dict, list)):
+            return str(value).strip()
+    return ''
+
+
+def _walk_dicts(payload: Any) -> Iterator[Dict[str, Any]]:
+    """Breadth-first walk over every dict in a JSON payload (top-level records first)."""
+    queue = [payload]
+    while queue:
+        node = queue.pop(0)
+        if isinstance(node, dict):
+            yield node
+            queue.extend(node.values())
+        elif isinstance(node, list):
+            queue.extend(node)
+
+
+def _same_name(a: str, b: str) -> bool:
+    return ' '.join(a.lower().split()) == ' '.join(b.lower().split())
+
+
+def _profile_record(payload: Any, profile_id: str, name: str) -> Optional[Dict[str, Any]]:
+    """
+    The record of a payload that describes the scraped profile.
+
+    Used for responses whose URL does not embed the profile id (lists, the
+    signed-in user's own calls, ...): only a dict whose id is the profile GUID,
+    or whose name is the profile's name, is about this person.
+    """
+    for item in _walk_dicts(payload):
+        if profile_id and _first(item, RECORD_ID_KEYS).lower() == profile_id:
+            return item
+        if name and _same_name(_first(item, RECORD_NAME_KEYS), name):
+            return item
+    return None
+
+
+class ProfileApiCapture:
+    """Collects same-origin JSON responses on a page until detached."""
+
+    def __init__(self, page: Page, origin: str):
+        self.page = page
+        self.origin = origin
+        self.responses: List[Tuple[str, Any]] = []
+        self._pending: List[asyncio.Task] = []
+        self.page.on("response", self._on_response)
+
+    def _on_response(self, response: Response):
+        url = response.url
+        if not url.startswith(self.origin) or "/api/image/" in url:
+            return
+        if "json" not in (response.headers.get("content-type") or ""):
+            return
+        self._pending.append(asyncio.create_task(self._read(response)))
+
+    async def _read(self, response: Response):
+        try:
+            self.responses.append((response.url, await response.json()))
+        except Exception:
+            # Bodies of redirected/aborted responses are not available
+            pass
+
+    async def collect(self) -> List[Tuple[str, Any]]:
+        """Detach from the page and return the (url, payload) pairs captured so far."""
+        self.page.remove_listener("response", self._on_response)
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        return self.responses
+
+
+class ApiProfileExtractor:
+    """
+    Learns the profile endpoints of the SPA and maps their JSON onto EmployeeData.
+    """
+
+    def __init__(self, base_url: str):
+        """
+        Initialize the extractor.
+
+        Args:
+            base_url: Any URL on the directory site (used for its origin)
+        """
+        parsed = urlparse(base_url)
+        self.origin = f"{parsed.scheme}://{parsed.netloc}"
+        self.logger = logging.getLogger(__name__)
+        # Endpoint URL templates containing "{profile_id}"
+        self.templates: List[str] = []
+        self.stats = {'direct': 0, 'captured': 0, 'dom_fallback': 0}
+
+    @staticmethod
+    def profile_id(profile_url: str) -> Optional[str]:
+        """GUID of a profile URL such as /employee/<GUID>/<slug>."""
+        match = GUID_PATTERN.search(profile_url or "")
+        return match.group(0) if match else None
+
+    def watch(self, page: Page) -> ProfileApiCapture:
+        """Start capturing JSON responses on a page (call before goto)."""
+        return ProfileApiCapture(page, self.origin)
+
+    def learn(self, profile_url: str, responses: List[Tuple[str, Any]]):
+        """Remember endpoints whose URL embeds the profile id."""
+        profile_id = self.profile_id(profile_url)
+        if not profile_id:
+            return
+        for url, _payload in responses:
+            if profile_id.lower() not in url.lower():
+                continue
+            template = re.sub(re.escape(profile_id), "{profile_id}", url, flags=re.IGNORECASE)
+            if template not in self.templates:
+                self.templates.append(template)
+                self.logger.info(f"[API] Learned profile endpoint: {template}")
+
+    async def fetch(self, request: APIRequestContext, profile_url: str) -> List[Tuple[str, Any]]:
+        """Call the learned endpoints directly with the context's session cookies."""
+        profile_id = self.profile_id(profile_url)
+        if not profile_id or not self.templates:
+            return []
+        responses = []
+        for template in self.templates:
+            url = template.replace("{profile_id}", profile_id)
+            try:
+                response = await request.get(url)
+                if response.ok:
+                    responses.append((url, await response.json()))
+                else:
+                    self.logger.debug(f"[API] {url} returned HTTP {response.status}")
+            except Exception as e:
+                self.logger.debug(f"[API] Request to {url} failed: {e}")
+        return responses
+
+    def to_employee(self, responses: List[Tuple[str, Any]], profile_url: str, name: str,
+                    image_url: str) -> Optional[EmployeeData]:
+        """
+        Map captured payloads onto EmployeeData.
+
+        Only payloads served for this profile (the URL contains its GUID) are
+        mapped, plus the record of any other payload whose id or name is this
+        profile's; everything else captured on the page (the signed-in user's own
+        calls, directory lists, other people) is ignored.
+
+        Returns:
+            EmployeeData, or None when no payload is about the profile or they do not
+            describe it well enough (no email and no position), so the caller falls back to DOM
+        """
+        profile_id = (self.profile_id(profile_url) or "").lower()
+        payloads = [p for url, p in responses if profile_id and profile_id in url.lower()]
+        for url, payload in responses:
+            if not (profile_id and profile_id in url.lower()):
+                record = _profile_record(payload, profile_id, (name or '').strip())
+                if record is not None:
+                    payloads.append(record)
+        if not payloads:
+            return None
+
+        fields: Dict[str, str] = {}
+        education, licenses, memberships = [], [], []
+        projects: Dict[str, Dict[str, str]] = {}
+
+        for payload in payloads:
+            for item in _walk_dicts(payload):
+                keys = {_norm(k) for k in item}
+                if keys & set(EDUCATION_KEYS):
+                    education.append({
+                        'institution': _first(item, EDUCATION_KEYS),
+                        'degree': _first(item, ('degree', 'degreetype', 'degreename')),
+                        'specialty': _first(item, ('specialty', 'major', 'fieldofstudy', 'discipline')),
+                    })
+                    continue
+                if keys & set(LICENSE_KEYS):
+                    licenses.append({
+                        'license': _first(item, LICENSE_KEYS),
+                        'state': _first(item, ('state', 'jurisdiction')),
+                        'number': _first(item, ('licensenumber', 'number')),
+                        'earned': _first(item, ('earned', 'dateearned', 'year')),
+                    })
+                    continue
+                if keys & set(PROJECT_KEYS):
+                    project_name = _first(item, ('projectname', 'name', 'title'))
+                    if project_name:
+                        projects[f"proj_{len(projects) + 1}"] = {
+                            'name': project_name,
+                            'description': _first(item, ('description',)),
+                            'role': _first(item, ('role', 'projectrole')),
+                            'year': _first(item, ('year',)),
+                            'client': _first(item, ('client', 'clientname')),
+                            'number': _first(item, ('projectnumber', 'number')),
+                            'url': _first(item, ('url', 'projecturl')),
+                            'source': 'api'
+                        }
+                    continue
+                for key, value in item.items():
+                    if _norm(key) in MEMBERSHIP_KEYS and isinstance(value, list):
+                        memberships.extend(
+                            str(m if not isinstance(m, dict) else _first(m, ('name', 'title'))).strip()
+                            for m in value
+                        )
+                for field_name, aliases in FIELD_ALIASES.items():
+                    if field_name not in fields:
+                        value = _first(item, aliases)
+                        if value:
+                            fields[field_name] = value
+
+        if not fields.get('email') and not fields.get('position'):
+            return None
+
+        years = re.search(r'\d+', fields.get('years_with_firm', ''))
+        email = fields.get('email')
+        return EmployeeData(
+            human_name=(name or '').strip() or fields.get('human_name'),
+            email=email,
+            bio=fields.get('bio'),
+            phone=fields.get('phone'),
+            mobile=fields.get('mobile') or fields.get('phone'),
+            office_location=fields.get('office_location', ''),
+            profile_url=profile_url,
+            image_url=image_url,
+            position=fields.get('position'),
+            department=fields.get('department', ''),
+            years_with_firm=int(years.group(0)) if years else None,
+            memberships=[m for m in memberships if m],
+            education=education,
+            licenses=licenses,
+            projects=projects,
+            teams_url=f"https://teams.microsoft.com/l/chat/0/0?users={email}" if email else None,
+            linkedin_url=fields.get('linkedin_url'),
+            website_url=fields.get('website_url'),
+            scraped_at=datetime.now().isoformat()
+        )
@@ -212,6 +212,32 @@ class AutoLogin:
             self.logger.error(f"Error creating credentials file: {e}")
             return False
     
+    def get_session_secret(self) -> Optional[str]:
+        """
+        Key material for encrypting the cached browser session.
+        
+        Uses SCRAPER_SESSION_KEY if set, otherwise the stored credentials
+        (environment or credentials.json). Never prompts for credentials.
+        
+        Returns:
+            Secret string or None if nothing is available
+        """
+        session_key = os.getenv('SCRAPER_SESSION_KEY')
+        if session_key:
+            return session_key
+        
+        email = os.getenv('SCRAPER_EMAIL')
+        password = os.getenv('SCRAPER_PASSWORD')
+        if not (email and password) and self.credentials_file.exists():
+            try:
+                with open(self.credentials_file, 'r') as f:
+                    stored = json.load(f)
+                email, password = stored.get('email'), stored.get('password')
+            except Exception as e:
+                self.logger.warning(f"Could not read credentials file for session key: {e}")
+        
+        return f"{email}:{password}" if email and password else None
+    
     def get_credentials(self) -> Optional[Dict[str, str]]:
         """
         Get the loaded credentials.
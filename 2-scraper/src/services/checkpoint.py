@@ -0,0 +1,115 @@
+"""
+Scrape checkpoint journal for crash recovery.
+
+An append-only JSONL file records the directory link list once discovery
+finishes and one line per completed profile. After a crash (auth expiry,
+runner timeout) ``--resume`` reloads the link list instead of repeating the
+infinite-scroll discovery, and profiles already written to disk are reused.
+"""
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+@dataclass
+class ResumeState:
+    """What an interrupted run left behind."""
+    started_at: str
+    links: List[tuple]
+    done: Dict[str, Dict[str, str]] = field(default_factory=dict)
+
+
+class ScrapeCheckpoint:
+    """
+    Append-only journal of one scrape run.
+
+    Record types (one JSON object per line):
+        {"type": "run", "started_at", "base_url"}
+        {"type": "links", "links": [[name, profile_url, image_url, title], ...]}
+        {"type": "done", "profile_url", "file", "status"}
+        {"type": "complete", "finished_at"}
+    """
+
+    def __init__(self, journal_path: Path):
+        """
+        Initialize the checkpoint journal.
+
+        Args:
+            journal_path: JSONL file (kept under debug/)
+        """
+        self.journal_path = Path(journal_path)
+        self.logger = logging.getLogger(__name__)
+
+    def _append(self, record: Dict):
+        # Flush and fsync each line so a killed runner leaves a readable journal
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with open(self.journal_path, "a+b") as f:
+            # Start on a fresh line if the previous process died mid-write
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = "\n" + line
+            f.write(line.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def start(self, base_url: str, links: List[tuple]):
+        """Begin a new journal with the freshly discovered link list."""
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        self.journal_path.write_text("", encoding="utf-8")
+        self._append({"type": "run", "started_at": datetime.now().isoformat(), "base_url": base_url})
+        self._append({"type": "links", "links": [list(link) for link in links]})
+        self.logger.info(f"[CHECKPOINT] Journal started with {len(links)} links: {self.journal_path}")
+
+    def mark_done(self, profile_url: str, file_name: str, status: str):
+        """Record a profile whose JSON file has been written ("detailed" or "basic")."""
+        self._append({"type": "done", "profile_url": profile_url, "file": file_name, "status": status})
+
+    def mark_complete(self):
+        """Close the journal; a completed run is never resumed."""
+        self._append({"type": "complete", "finished_at": datetime.now().isoformat()})
+
+    def load_resume_state(self, base_url: str) -> Optional[ResumeState]:
+        """
+        Read an interrupted run from the journal.
+
+        Returns:
+            ResumeState, or None if there is nothing to resume (no journal, the run
+            completed, it was for another directory URL, or discovery never finished)
+        """
+        if not self.journal_path.exists():
+            self.logger.info("[CHECKPOINT] No journal found, starting a fresh run")
+            return None
+
+        run, links, done, complete = None, None, {}, False
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A line torn by a crash - skip it, the others are intact
+                    continue
+                record_type = record.get("type")
+                if record_type == "run":
+                    run = record
+                elif record_type == "links":
+                    links = [tuple(link) for link in record.get("links", [])]
+                elif record_type == "done":
+                    done[record["profile_url"]] = {"file": record.get("file", ""), "status": record.get("status", "")}
+                elif record_type == "complete":
+                    complete = True
+
+        if complete or run is None or links is None:
+            self.logger.info("[CHECKPOINT] Previous run completed or never finished discovery, starting fresh")
+            return None
+        if run.get("base_url") != base_url:
+            self.logger.info(f"[CHECKPOINT] Journal is for {run.get('base_url')}, not {base_url}; starting fresh")
+            return None
+
+        self.logger.info(f"[CHECKPOINT] Resuming run from {run['started_at']}: "
+                         f"{len(done)}/{len(links)} profiles already done")
+        return ResumeState(started_at=run["started_at"], links=links, done=done)
@@ -7,8 +7,10 @@ including performance monitoring, content analysis, and error diagnostics.
 """
 
 import asyncio
+import itertools
 import json
 import logging
+import math
 import time
 import traceback
 from datetime import datetime
@@ -54,15 +56,18 @@ class PerformanceMonitor:
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(__name__)
         self.metrics: List[PerformanceMetric] = []
-        self.active_operations: Dict[str, float] = {}
+        # operation_id -> (operation name, wall-clock start, perf_counter start)
+        self.active_operations: Dict[str, Tuple[str, float, float]] = {}
         self.contexts: Dict[str, DebugContext] = {}
+        # Unique per monitor, so concurrent operations started in the same millisecond don't collide
+        self._operation_ids = itertools.count(1)
     
     def start_operation(self, operation: str, context_id: Optional[str] = None) -> str:
         """Start tracking an operation."""
-        operation_id = f"{operation}_{int(time.time() * 1000)}"
+        operation_id = f"{operation}_{next(self._operation_ids)}"
         start_time = time.time()
         
-        self.active_operations[operation_id] = start_time
+        self.active_operations[operation_id] = (operation, start_time, time.perf_counter())
         
         if context_id and context_id in self.contexts:
             self.contexts[context_id].performance_metrics.append(
@@ -85,12 +90,13 @@ class PerformanceMonitor:
             self.logger.warning(f"Operation {operation_id} not found in active operations")
             return
         
-        start_time = self.active_operations.pop(operation_id)
+        # The name is stored, not parsed from the ID: names may contain underscores
+        operation, start_time, perf_start = self.active_operations.pop(operation_id)
         end_time = time.time()
-        duration = end_time - start_time
+        duration = time.perf_counter() - perf_start
         
         metric = PerformanceMetric(
-            operation=operation_id.split('_')[0],
+            operation=operation,
             start_time=start_time,
             end_time=end_time,
             duration=duration,
@@ -102,7 +108,7 @@ class PerformanceMonitor:
         self.metrics.append(metric)
         
         status = "SUCCESS" if success else "FAILED"
-        self.logger.info(f"Operation {metric.operation}: {status} in {duration:.3f}s")
+        self.logger.debug(f"Operation {metric.operation}: {status} in {duration:.3f}s")
         
         if not success and error_message:
             self.logger.error(f"Operation {metric.operation} failed: {error_message}")
@@ -146,14 +152,67 @@ class PerformanceMonitor:
             "recent_errors": [m.error_message for m in failed_metrics[-5:] if m.error_message]
         }
     
-    def export_metrics(self, file_path: Path):
-        """Export performance metrics to JSON file."""
+    @staticmethod
+    def _percentile(sorted_durations: List[float], percent: float) -> float:
+        """Nearest-rank percentile of an ascending list."""
+        rank = max(1, math.ceil(percent / 100 * len(sorted_durations)))
+        return sorted_durations[rank - 1]
+    
+    def get_stage_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-operation count, failures and p50/p95/max/total durations (seconds)."""
+        durations: Dict[str, List[float]] = {}
+        failures: Dict[str, int] = {}
+        for metric in self.metrics:
+            durations.setdefault(metric.operation, []).append(metric.duration)
+            if not metric.success:
+                failures[metric.operation] = failures.get(metric.operation, 0) + 1
+        
+        stats = {}
+        for operation, values in durations.items():
+            values.sort()
+            stats[operation] = {
+                "count": len(values),
+                "failed": failures.get(operation, 0),
+                "p50": round(self._percentile(values, 50), 4),
+                "p95": round(self._percentile(values, 95), 4),
+                "max": round(values[-1], 4),
+                "total": round(sum(values), 4),
+            }
+        return stats
+    
+    def format_stage_table(self) -> str:
+        """Stage statistics as a fixed-width table, slowest total first."""
+        stats = self.get_stage_statistics()
+        if not stats:
+            return "No performance data available"
+        
+        width = max(len("Stage"), *(len(name) for name in stats))
+        lines = [
+            f"{'Stage':<{width}}  {'Count':>6}  {'Failed':>6}  {'p50 (s)':>8}  {'p95 (s)':>8}  {'Max (s)':>8}  {'Total (s)':>10}",
+            "-" * (width + 58),
+        ]
+        for name, row in sorted(stats.items(), key=lambda item: item[1]["total"], reverse=True):
+            lines.append(f"{name:<{width}}  {row['count']:>6}  {row['failed']:>6}  {row['p50']:>8.3f}  "
+                         f"{row['p95']:>8.3f}  {row['max']:>8.3f}  {row['total']:>10.2f}")
+        return "\n".join(lines)
+    
+    def export_metrics(self, file_path: Path, include_details: bool = True):
+        """
+        Export performance metrics to JSON file.
+        
+        Args:
+            file_path: Output JSON file
+            include_details: Also write every individual metric (large for full runs)
+        """
         data = {
             "timestamp": datetime.now().isoformat(),
             "performance_summary": self.get_performance_summary(),
-            "detailed_metrics": [asdict(metric) for metric in self.metrics]
+            "stage_statistics": self.get_stage_statistics(),
         }
+        if include_details:
+            data["detailed_metrics"] = [asdict(metric) for metric in self.metrics]
         
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
         with open(file_path, 'w') as f:
             json.dump(data, f, indent=2)
         
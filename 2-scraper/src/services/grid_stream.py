@@ -0,0 +1,179 @@
+"""
+Streaming extraction of the "Show All" projects grid.
+
+For staff with hundreds of projects the Kendo grid (``.k-grid``) either
+paginates or virtualizes its rows, so a single snapshot of the rendered table
+misses data. ``ProjectGridStreamer`` walks the grid one page or one scroll
+window at a time and yields the rows that appeared in each chunk.
+
+Optionally it stops early once it reaches a run of rows already known from the
+previous scrape, in the same consecutive order as then, so that the rest of the
+previous list can be carried over. That assumes the grid lists the most recent
+projects first, which is not confirmed for the site, so it is off by default.
+"""
+import logging
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Set
+
+from playwright.async_api import Page
+
+from .readiness import ReadinessDetector
+
+
+# Rows currently rendered plus how the grid can be advanced
+GRID_CHUNK_JS = """
+() => {
+    const grid = document.querySelector('.k-grid');
+    const scope = grid || document;
+    // Kendo rows, or the styled table (one cell per project link) when there is no grid
+    const rows = grid
+        ? Array.from(grid.querySelectorAll('tr.k-master-row, .k-grid-content tr, tbody tr'))
+        : Array.from(document.querySelectorAll('.styledTableCell'));
+    const seen = new Set();
+    const items = [];
+    rows.forEach(row => {
+        const link = row.querySelector('a[href*="/project/"]');
+        if (!link) return;
+        const name = link.textContent?.trim();
+        const url = link.href;
+        if (!name || name.length <= 1 || seen.has(url)) return;
+        seen.add(url);
+        items.push({name: name, url: url});
+    });
+
+    const next = scope.querySelector(
+        '.k-pager-nav[title*="next" i], .k-pager-nav[aria-label*="next" i], .k-pager-nav .k-i-arrow-e, .k-pager-nav .k-i-arrow-60-right'
+    );
+    const nextButton = next ? next.closest('.k-pager-nav') || next : null;
+    const nextEnabled = !!nextButton && !nextButton.matches('.k-state-disabled, .k-disabled, [aria-disabled="true"]');
+
+    const scroller = scope.querySelector('.k-virtual-content, .k-grid-content');
+    const canScroll = !!scroller && scroller.scrollTop + scroller.clientHeight < scroller.scrollHeight - 2;
+
+    return {rows: items, firstUrl: items.length ? items[0].url : null, nextEnabled: nextEnabled, canScroll: canScroll};
+}
+"""
+
+GRID_NEXT_PAGE_JS = """
+() => {
+    const scope = document.querySelector('.k-grid') || document;
+    const next = scope.querySelector(
+        '.k-pager-nav[title*="next" i], .k-pager-nav[aria-label*="next" i], .k-pager-nav .k-i-arrow-e, .k-pager-nav .k-i-arrow-60-right'
+    );
+    const button = next ? next.closest('.k-pager-nav') || next : null;
+    if (button) button.click();
+    return !!button;
+}
+"""
+
+GRID_SCROLL_JS = """
+() => {
+    const scope = document.querySelector('.k-grid') || document;
+    const scroller = scope.querySelector('.k-virtual-content, .k-grid-content');
+    if (!scroller) return false;
+    scroller.scrollTop += Math.max(scroller.clientHeight - 40, 40);
+    return true;
+}
+"""
+
+# True once the first rendered project differs from the previous page's
+GRID_PAGE_CHANGED_JS = """
+(previousFirstUrl) => {
+    const scope = document.querySelector('.k-grid') || document;
+    const link = scope.querySelector('tr a[href*="/project/"], .styledTableCell a[href*="/project/"]');
+    return !!link && link.href !== previousFirstUrl;
+}
+"""
+
+
+class ProjectGridStreamer:
+    """
+    Walks a paginated or virtualized projects grid in chunks.
+    """
+
+    def __init__(self, max_chunks: int = 100, stop_after_known: int = 0, page_timeout: int = 10000):
+        """
+        Initialize the streamer.
+
+        Args:
+            max_chunks: Upper bound on pages/scroll windows visited per grid
+            stop_after_known: Stop after this many rows that follow each other in the
+                previous scrape too (0 walks the whole grid)
+            page_timeout: Milliseconds to wait for the next page to render
+        """
+        self.max_chunks = max_chunks
+        self.stop_after_known = stop_after_known
+        self.page_timeout = page_timeout
+        self.logger = logging.getLogger(__name__)
+        self.stopped_early = False
+        # Position in the previous list after the rows the walk stopped on
+        self.resume_position = 0
+        self.chunks = 0
+
+    async def stream(self, page: Page, readiness: ReadinessDetector,
+                     known_urls: Optional[Sequence[str]] = None) -> AsyncIterator[List[Dict[str, str]]]:
+        """
+        Yield the new rows ({name, url}) of each page / scroll window of the grid.
+
+        Args:
+            page: Profile page with the "Show All" grid open
+            readiness: Detector used to wait for virtual-scroll windows to render
+            known_urls: Project URLs from the previous scrape of this profile, in grid order
+        """
+        known_positions = {url: position for position, url in enumerate(known_urls or ())}
+        seen: Set[str] = set()
+        known_run = 0
+        last_position = -1
+        empty_chunks = 0
+        self.stopped_early = False
+        self.resume_position = 0
+        self.chunks = 0
+
+        while self.chunks < self.max_chunks:
+            chunk = await page.evaluate(GRID_CHUNK_JS)
+            self.chunks += 1
+
+            new_rows = [row for row in chunk['rows'] if row['url'] not in seen]
+            for row in new_rows:
+                seen.add(row['url'])
+            if new_rows:
+                empty_chunks = 0
+                yield new_rows
+            else:
+                # A window that renders nothing new three times in a row won't start to
+                empty_chunks += 1
+                if empty_chunks >= 3:
+                    return
+
+            if self.stop_after_known and known_positions:
+                for row in new_rows:
+                    position = known_positions.get(row['url'])
+                    if position is None:
+                        known_run = 0
+                    elif known_run and position == last_position + 1:
+                        known_run += 1
+                    else:
+                        # Known, but not where the previous scrape had it: the run starts over
+                        known_run = 1
+                    last_position = -1 if position is None else position
+                    if known_run >= self.stop_after_known:
+                        self.stopped_early = True
+                        self.resume_position = last_position + 1
+                        self.logger.info(f"    [GRID] Reached {known_run} known projects after {len(seen)} rows, "
+                                         f"stopping early")
+                        return
+
+            if chunk['nextEnabled']:
+                await page.evaluate(GRID_NEXT_PAGE_JS)
+                try:
+                    await page.wait_for_function(GRID_PAGE_CHANGED_JS, arg=chunk['firstUrl'],
+                                                 timeout=self.page_timeout)
+                except Exception as e:
+                    self.logger.warning(f"    [GRID] Next page did not render: {e}")
+                    return
+            elif chunk['canScroll']:
+                await page.evaluate(GRID_SCROLL_JS)
+                await readiness.wait_for_settle(label='grid_scroll')
+            else:
+                return
+
+        self.logger.warning(f"    [GRID] Stopped after {self.max_chunks} chunks ({len(seen)} rows)")
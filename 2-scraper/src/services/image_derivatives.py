@@ -0,0 +1,185 @@
+"""
+Responsive image derivatives for the website.
+
+Turns each downloaded profile image into a grid thumbnail and a profile-size
+image in AVIF and WebP (when the installed Pillow supports them) plus a JPEG
+fallback. Rendering runs in a process pool, and a manifest of source hashes
+lets unchanged images be skipped on later runs. The result for each image is a
+``srcset`` map (format -> srcset string) stored next to image_local_path.
+
+Requires the optional ``Pillow`` package; without it the stage is skipped.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import quote
+
+try:
+    from PIL import Image, features
+except ImportError:  # pragma: no cover - optional dependency
+    Image = None
+    features = None
+
+
+# Target widths in CSS pixels: the directory grid shows 120px circles
+DERIVATIVE_SIZES = {"thumb": 120, "profile": 240}
+
+# Preferred first; formats the Pillow build can't encode are dropped
+DERIVATIVE_FORMATS = ["avif", "webp", "jpeg"]
+FORMAT_EXTENSIONS = {"avif": "avif", "webp": "webp", "jpeg": "jpg"}
+FORMAT_QUALITY = {"avif": 50, "webp": 75, "jpeg": 80}
+
+DERIVED_DIR_NAME = "derived"
+
+
+def _render_derivatives(source_path: str, out_dir: str, stem: str, widths: List[int],
+                        formats: List[str]) -> Dict[str, Dict[str, str]]:
+    """
+    Render every width/format of one image (runs in a worker process).
+
+    Returns:
+        {format: {width: filename}}
+    """
+    outputs: Dict[str, Dict[str, str]] = {}
+    with Image.open(source_path) as source:
+        source = source.convert("RGB")
+        for width in widths:
+            resized = source.copy()
+            resized.thumbnail((width, width), Image.LANCZOS)
+            for fmt in formats:
+                filename = f"{stem}_{width}.{FORMAT_EXTENSIONS[fmt]}"
+                target = Path(out_dir) / filename
+                tmp_target = target.with_name(filename + ".tmp")
+                resized.save(tmp_target, format=fmt.upper(), quality=FORMAT_QUALITY[fmt])
+                os.replace(tmp_target, target)
+                outputs.setdefault(fmt, {})[str(width)] = filename
+    return outputs
+
+
+class ImageDerivativeGenerator:
+    """
+    Generates thumbnail/profile derivatives and their srcset maps.
+    """
+
+    def __init__(self, images_dir: Path, max_workers: Optional[int] = None):
+        """
+        Initialize the generator.
+
+        Args:
+            images_dir: docs/assets/images (derivatives go to its derived/ folder)
+            max_workers: Process pool size (defaults to the CPU count)
+        """
+        self.images_dir = Path(images_dir)
+        self.derived_dir = self.images_dir / DERIVED_DIR_NAME
+        self.manifest_path = self.derived_dir / "derivatives_manifest.json"
+        self.max_workers = max_workers
+        self.logger = logging.getLogger(__name__)
+        self.stats = {"generated": 0, "skipped": 0, "failed": 0}
+
+        self.formats: List[str] = []
+        if Image is None:
+            self.logger.info("Pillow is not installed, image derivatives disabled")
+        else:
+            self.formats = [fmt for fmt in DERIVATIVE_FORMATS if fmt == "jpeg" or features.check(fmt)]
+        self.widths = sorted(set(DERIVATIVE_SIZES.values()))
+        self.manifest: Dict[str, Dict] = self._load_manifest()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.formats)
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f).get("images", {})
+        except Exception as e:
+            self.logger.warning(f"Could not read derivatives manifest, regenerating all: {e}")
+            return {}
+
+    def _save_manifest(self):
+        data = {"version": 1, "widths": self.widths, "images": dict(sorted(self.manifest.items()))}
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.manifest_path)
+
+    @staticmethod
+    def _stem(source_name: str) -> str:
+        # Derived names go into srcset, where spaces separate URL and descriptor
+        return Path(source_name).stem.replace(" ", "_")
+
+    def _is_current(self, source_name: str, source_hash: str) -> bool:
+        entry = self.manifest.get(source_name)
+        if not entry or entry.get("sha256") != source_hash or entry.get("widths") != self.widths:
+            return False
+        if sorted(entry.get("outputs", {})) != sorted(self.formats):
+            return False
+        return all((self.derived_dir / name).exists()
+                   for by_width in entry["outputs"].values() for name in by_width.values())
+
+    async def generate(self, sources: Dict[str, Optional[str]]):
+        """
+        Bring derivatives up to date for a set of source images.
+
+        Args:
+            sources: {source filename in images_dir: sha256 from the image manifest, or None}
+        """
+        if not self.enabled:
+            return
+        self.derived_dir.mkdir(parents=True, exist_ok=True)
+
+        todo = {}
+        for source_name, source_hash in sources.items():
+            source_path = self.images_dir / source_name
+            if not source_path.exists():
+                continue
+            source_hash = source_hash or hashlib.sha256(source_path.read_bytes()).hexdigest()
+            if self._is_current(source_name, source_hash):
+                self.stats["skipped"] += 1
+            else:
+                todo[source_name] = source_hash
+
+        if todo:
+            self.logger.info(f"[INFO] Generating derivatives for {len(todo)} images ({', '.join(self.formats)})")
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = {
+                    source_name: loop.run_in_executor(
+                        pool, _render_derivatives, str(self.images_dir / source_name),
+                        str(self.derived_dir), self._stem(source_name), self.widths, self.formats
+                    )
+                    for source_name in todo
+                }
+                results = await asyncio.gather(*futures.values(), return_exceptions=True)
+            for source_name, result in zip(futures, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"[ERROR] Failed to generate derivatives for {source_name}: {result}")
+                    self.stats["failed"] += 1
+                    continue
+                self.manifest[source_name] = {"sha256": todo[source_name], "widths": self.widths, "outputs": result}
+                self.stats["generated"] += 1
+
+        self._save_manifest()
+
+    def srcset(self, source_name: str) -> Dict[str, str]:
+        """
+        srcset strings for a source image, keyed by format (empty if none).
+
+        Example: {"webp": "assets/images/derived/Jane_Doe_profile_120.webp 120w, ..."}
+        """
+        entry = self.manifest.get(source_name)
+        if not entry:
+            return {}
+        prefix = f"assets/images/{DERIVED_DIR_NAME}/"
+        return {
+            fmt: ", ".join(f"{prefix}{quote(name)} {width}w"
+                           for width, name in sorted(by_width.items(), key=lambda item: int(item[0])))
+            for fmt, by_width in entry.get("outputs", {}).items()
+        }
@@ -2,10 +2,13 @@
 Image downloader utility for employee profile images.
 """
 import os
+import json
+import hashlib
 import aiohttp
 import asyncio
+import tempfile
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Tuple
 from urllib.parse import urlparse, unquote
 import logging
 from playwright.async_api import Page
@@ -16,12 +19,13 @@ class ImageDownloader:
     Handles downloading and saving employee profile images.
     """
     
-    def __init__(self, download_dir: str = "assets/images"):
+    def __init__(self, download_dir: str = "assets/images", max_concurrent: int = 5):
         """
         Initialize the image downloader.
         
         Args:
             download_dir: Directory to save downloaded images
+            max_concurrent: Maximum number of downloads in flight
         """
         self.download_dir = Path(download_dir)
         self.download_dir.mkdir(exist_ok=True)
@@ -30,6 +34,16 @@ class ImageDownloader:
         # Use the download_dir directly for images
         self.images_dir = self.download_dir
         self.images_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Bounded concurrency and one pooled session shared by all downloads
+        self.max_concurrent = max_concurrent
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Manifest of validators and content hashes (committed with the images)
+        self.manifest_path = self.images_dir / "image_manifest.json"
+        self.manifest: Dict[str, Dict[str, Any]] = self._load_manifest()
+        self.stats = {"downloaded": 0, "not_modified": 0, "unchanged": 0, "deduplicated": 0, "failed": 0}
     
     def _get_filename_from_url(self, url: str, employee_name: str = None) -> str:
         """
@@ -142,14 +156,106 @@ class ImageDownloader:
             self.logger.error(f"Failed to capture preview image for {employee_name}: {e}")
             return None
     
-    async def download_image(self, url: str, employee_name: str = None, page=None) -> Optional[str]:
+    def expected_path(self, url: str, employee_name: str = None) -> str:
+        """Web path the image for this URL/employee will be saved under."""
+        return f"assets/images/{self._get_filename_from_url(url, employee_name)}"
+    
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Load the image manifest (filename -> url, validators and content hash)."""
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get("images", {})
+        except Exception as e:
+            self.logger.warning(f"Could not read image manifest, starting a new one: {e}")
+            return {}
+    
+    def save_manifest(self):
+        """Write the image manifest (sorted, so unchanged runs produce no git diff)."""
+        data = {"version": 1, "images": dict(sorted(self.manifest.items()))}
+        self._write_atomic(self.manifest_path, json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8'))
+    
+    def _write_atomic(self, path: Path, data: bytes):
+        """Replace a file in one step (a unique temp file, so concurrent downloads can't collide)."""
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            # mkstemp creates 0600 files; keep the usual permissions for the site
+            os.chmod(tmp_name, 0o644)
+            os.replace(tmp_name, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+            raise
+    
+    def _remove_own_copy(self, filename: str):
+        """Delete an employee's own image file once they point at another copy (unless others point at it)."""
+        file_path = self.images_dir / filename
+        if not file_path.exists():
+            return
+        if any(entry.get("dedup_of") == filename for entry in self.manifest.values()):
+            return
+        file_path.unlink()
+        self.logger.info(f"Removed {filename}, superseded by an identical stored image")
+    
+    def _hash_file(self, file_path: Path) -> Optional[str]:
+        try:
+            return hashlib.sha256(file_path.read_bytes()).hexdigest()
+        except OSError:
+            return None
+    
+    def _find_duplicate(self, content_hash: str, filename: str) -> Optional[str]:
+        """Another stored image with identical content (e.g. the default avatar)."""
+        for other_name, entry in self.manifest.items():
+            if (other_name != filename and entry.get("sha256") == content_hash
+                    and not entry.get("dedup_of") and (self.images_dir / other_name).exists()):
+                return other_name
+        return None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Shared, connection-pooled aiohttp session (created on first use)."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrent)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+    
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+    
+    async def _fetch(self, url: str, headers: Dict[str, str], page=None, request=None) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        GET through the authenticated browser context if available, else the shared session.
+
+        Returns:
+            (status, headers with lowercase names, body; empty unless status is 200)
+        """
+        request = request or (page.request if page else None)
+        if request:
+            response = await request.get(url, headers=headers)
+            body = await response.body() if response.status == 200 else b""
+            return response.status, response.headers, body
+        async with self._get_session().get(url, headers=headers) as response:
+            body = await response.read() if response.status == 200 else b""
+            # Lowercase keys like Playwright's, which download_image relies on
+            return response.status, {k.lower(): v for k, v in response.headers.items()}, body
+    
+    async def download_image(self, url: str, employee_name: str = None, page=None, request=None) -> Optional[str]:
         """
         Download an image from URL and save it locally.
         
+        Sends If-None-Match/If-Modified-Since for images fetched before, skips
+        rewriting files whose content hash is unchanged, and points employees with
+        identical images at the one stored copy.
+        
         Args:
             url: Image URL to download
             employee_name: Employee name for filename generation
             page: Playwright page object for authenticated requests (optional)
+            request: Playwright APIRequestContext for authenticated requests (optional)
             
         Returns:
             Local file path if successful, None otherwise
@@ -158,72 +264,74 @@ class ImageDownloader:
             self.logger.warning("No URL provided for image download")
             return None
         
+        filename = self._get_filename_from_url(url, employee_name)
+        file_path = self.images_dir / filename
+        entry = self.manifest.get(filename, {})
+        
+        # Seed the manifest for images downloaded before it existed
+        if file_path.exists() and not entry.get("sha256"):
+            entry = {"url": url, "sha256": self._hash_file(file_path)}
+        
+        # Deduplicated entries keep their validators; the stored copy is the other file
+        stored_path = self.images_dir / (entry.get("dedup_of") or filename)
+        headers = {}
+        if stored_path.exists() and entry.get("url") == url:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        
         try:
-            filename = self._get_filename_from_url(url, employee_name)
-            file_path = self.images_dir / filename
-            
-            # Skip if file already exists
-            if file_path.exists():
-                self.logger.info(f"Image already exists: {file_path}")
-                # Return relative web path from docs root for GitHub Pages
-                return f"assets/images/{filename}"
-            
-            # Use authenticated browser session if available
-            if page:
-                try:
-                    # Use Playwright's request context which includes authentication
-                    response = await page.request.get(url)
-                    if response.status == 200:
-                        # Get content type to determine extension
-                        content_type = response.headers.get('content-type', '')
-                        if 'image' not in content_type:
-                            self.logger.warning(f"URL does not point to an image: {url}")
-                            return None
-                        
-                        # Read image data
-                        image_data = await response.body()
-                        
-                        # Save image
-                        with open(file_path, 'wb') as f:
-                            f.write(image_data)
-                        
-                        self.logger.info(f"Downloaded image: {file_path}")
-                        # Return relative web path from docs root for GitHub Pages
-                        return f"assets/images/{filename}"
-                    else:
-                        self.logger.error(f"Failed to download image: {url} (Status: {response.status})")
-                        return None
-                except Exception as e:
-                    self.logger.error(f"Error downloading image with browser session {url}: {str(e)}")
-                    return None
-            else:
-                # Fallback to aiohttp (will likely fail for authenticated URLs)
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url) as response:
-                        if response.status == 200:
-                            # Get content type to determine extension
-                            content_type = response.headers.get('content-type', '')
-                            if 'image' not in content_type:
-                                self.logger.warning(f"URL does not point to an image: {url}")
-                                return None
-                            
-                            # Read image data
-                            image_data = await response.read()
-                            
-                            # Save image
-                            with open(file_path, 'wb') as f:
-                                f.write(image_data)
-                            
-                            self.logger.info(f"Downloaded image: {file_path}")
-                            # Return relative web path from docs root for GitHub Pages
-                            return f"assets/images/{filename}"
-                        else:
-                            self.logger.error(f"Failed to download image: {url} (Status: {response.status})")
-                            return None
-                        
+            async with self._semaphore:
+                status, response_headers, image_data = await self._fetch(url, headers, page, request)
         except Exception as e:
             self.logger.error(f"Error downloading image {url}: {str(e)}")
+            self.stats["failed"] += 1
+            return None
+        
+        if status == 304:
+            self.stats["not_modified"] += 1
+            self.logger.debug(f"Image not modified: {file_path}")
+            return f"assets/images/{entry.get('dedup_of') or filename}"
+        if status != 200:
+            self.logger.error(f"Failed to download image: {url} (Status: {status})")
+            self.stats["failed"] += 1
+            return None
+        if 'image' not in response_headers.get('content-type', ''):
+            self.logger.warning(f"URL does not point to an image: {url}")
+            self.stats["failed"] += 1
             return None
+        
+        content_hash = hashlib.sha256(image_data).hexdigest()
+        entry.update({
+            "url": url,
+            "etag": response_headers.get("etag"),
+            "last_modified": response_headers.get("last-modified"),
+            "sha256": content_hash,
+            "size": len(image_data),
+        })
+        entry.pop("dedup_of", None)
+        
+        stored_name = filename
+        if file_path.exists() and self._hash_file(file_path) == content_hash:
+            # Same bytes as on disk - don't touch the file (no git churn)
+            self.stats["unchanged"] += 1
+        else:
+            duplicate = self._find_duplicate(content_hash, filename)
+            if duplicate:
+                entry["dedup_of"] = duplicate
+                stored_name = duplicate
+                self.stats["deduplicated"] += 1
+                self.logger.info(f"Image for {employee_name} is identical to {duplicate}, reusing it")
+                self._remove_own_copy(filename)
+            else:
+                self._write_atomic(file_path, image_data)
+                self.stats["downloaded"] += 1
+                self.logger.info(f"Downloaded image: {file_path}")
+        
+        self.manifest[filename] = entry
+        # Return relative web path from docs root for GitHub Pages
+        return f"assets/images/{stored_name}"
     
     def get_image_info(self, file_path: str) -> dict:
         """
@@ -260,7 +368,7 @@ class ImageDownloader:
         total_size = 0
         
         for file_path in self.images_dir.glob("*"):
-            if file_path.is_file():
+            if file_path.is_file() and file_path != self.manifest_path:
                 total_files += 1
                 total_size += file_path.stat().st_size
         
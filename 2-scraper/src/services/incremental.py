@@ -0,0 +1,148 @@
+"""
+Incremental scraping support.
+
+Keeps a fingerprint of every profile's directory card (name, title, image src)
+together with the time the profile was last deep-scraped, so a weekly run only
+visits profiles that are new, changed, or older than a TTL.
+"""
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+# Classification results for a directory card
+PROFILE_ADDED = "added"
+PROFILE_CHANGED = "changed"
+PROFILE_STALE = "stale"
+PROFILE_UNCHANGED = "unchanged"
+
+
+@dataclass
+class IncrementalStats:
+    """Counters reported at the end of an incremental run."""
+    skipped: int = 0
+    refreshed: int = 0
+    added: int = 0
+    refreshed_reasons: Dict[str, int] = field(default_factory=dict)
+
+    def count(self, status: str):
+        """Count one profile by its classification."""
+        if status == PROFILE_UNCHANGED:
+            self.skipped += 1
+        elif status == PROFILE_ADDED:
+            self.added += 1
+        else:
+            self.refreshed += 1
+            self.refreshed_reasons[status] = self.refreshed_reasons.get(status, 0) + 1
+
+    def summary(self) -> str:
+        """One-line summary for logs."""
+        reasons = ", ".join(f"{k}={v}" for k, v in sorted(self.refreshed_reasons.items()))
+        reasons = f" ({reasons})" if reasons else ""
+        return f"skipped={self.skipped}, refreshed={self.refreshed}{reasons}, added={self.added}"
+
+
+class ProfileFingerprintStore:
+    """
+    Persistent map of profile URL -> listing-card fingerprint and last scrape time.
+
+    The manifest is a small JSON file committed next to the individual employee
+    files so the next scheduled run can decide what to skip.
+    """
+
+    VERSION = 1
+
+    def __init__(self, manifest_path: Path, ttl_days: int = 28):
+        """
+        Initialize the fingerprint store.
+
+        Args:
+            manifest_path: JSON file holding the fingerprints
+            ttl_days: Profiles scraped longer ago than this are refreshed anyway
+        """
+        self.manifest_path = Path(manifest_path)
+        self.ttl = timedelta(days=ttl_days)
+        self.logger = logging.getLogger(__name__)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.stats = IncrementalStats()
+
+    @staticmethod
+    def fingerprint(name: str, image_url: str, title: str) -> str:
+        """Hash the listing-card data that signals a profile change."""
+        card = json.dumps([(name or "").strip(), (title or "").strip(), image_url or ""], ensure_ascii=False)
+        return hashlib.sha1(card.encode("utf-8")).hexdigest()
+
+    def load(self) -> "ProfileFingerprintStore":
+        """Load the manifest if present (a missing or corrupt file means a full run)."""
+        if not self.manifest_path.exists():
+            self.logger.info(f"[INCREMENTAL] No fingerprint manifest at {self.manifest_path}, all profiles count as new")
+            return self
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.entries = data.get("profiles", {})
+            self.logger.info(f"[INCREMENTAL] Loaded {len(self.entries)} profile fingerprints")
+        except Exception as e:
+            self.logger.warning(f"[INCREMENTAL] Could not read fingerprint manifest, ignoring it: {e}")
+            self.entries = {}
+        return self
+
+    def save(self):
+        """Write the manifest back to disk."""
+        data = {
+            "version": self.VERSION,
+            "updated_at": datetime.now().isoformat(),
+            "profiles": dict(sorted(self.entries.items())),
+        }
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.manifest_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        self.logger.info(f"[INCREMENTAL] Saved {len(self.entries)} profile fingerprints to {self.manifest_path}")
+
+    def classify(self, profile_url: str, fingerprint: str, existing_file: Optional[Path] = None,
+                 now: Optional[datetime] = None) -> str:
+        """
+        Decide whether a profile needs a deep scrape.
+
+        Args:
+            profile_url: Profile URL from the directory card
+            fingerprint: Current card fingerprint
+            existing_file: Individual JSON file the skipped profile would be reused from
+            now: Reference time (defaults to now)
+
+        Returns:
+            One of PROFILE_ADDED, PROFILE_CHANGED, PROFILE_STALE, PROFILE_UNCHANGED
+        """
+        entry = self.entries.get(profile_url)
+        if not entry or (existing_file is not None and not existing_file.exists()):
+            return PROFILE_ADDED
+        if entry.get("fingerprint") != fingerprint:
+            return PROFILE_CHANGED
+        try:
+            scraped_at = datetime.fromisoformat(entry.get("scraped_at") or "")
+        except (TypeError, ValueError):
+            return PROFILE_STALE
+        if (now or datetime.now()) - scraped_at > self.ttl:
+            return PROFILE_STALE
+        return PROFILE_UNCHANGED
+
+    def record(self, profile_url: str, fingerprint: str, name: str, scraped_at: str, file_name: str):
+        """Remember a successful deep scrape."""
+        self.entries[profile_url] = {
+            "name": name,
+            "fingerprint": fingerprint,
+            "scraped_at": scraped_at,
+            "file": file_name,
+        }
+
+    def prune(self, live_profile_urls: List[str]) -> int:
+        """Drop fingerprints for profiles no longer in the directory."""
+        live = set(live_profile_urls)
+        stale_urls = [url for url in self.entries if url not in live]
+        for url in stale_urls:
+            del self.entries[url]
+        return len(stale_urls)
@@ -0,0 +1,104 @@
+"""
+Atomic, change-aware JSON writer for the individual employee files.
+
+Serialization and file I/O run in a small thread pool so profile workers never
+block the event loop on disk. Each file is written to a temporary sibling and
+renamed over the target, so a killed process leaves either the old or the new
+file, never a truncated one. Writes whose content matches what is already on
+disk are skipped, which keeps git diffs (and GitHub Pages rebuilds) limited to
+employees that actually changed.
+"""
+import asyncio
+import logging
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable
+
+from ..core.models import dumps_json, loads_json
+
+
+class AtomicJsonWriter:
+    """
+    Thread-pool backed writer that replaces JSON files atomically.
+    """
+
+    def __init__(self, max_workers: int = 4, ignore_keys: Iterable[str] = ()):
+        """
+        Initialize the writer.
+
+        Args:
+            max_workers: Threads used for serialization and disk I/O
+            ignore_keys: Top-level keys that alone don't count as a change
+                (e.g. scraped_at, which differs on every scrape)
+        """
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="json-writer")
+        self.ignore_keys = frozenset(ignore_keys)
+        self.logger = logging.getLogger(__name__)
+        self.stats = {"written": 0, "unchanged": 0, "failed": 0}
+
+    def _without_ignored(self, data: Any) -> Any:
+        if isinstance(data, dict) and self.ignore_keys:
+            return {k: v for k, v in data.items() if k not in self.ignore_keys}
+        return data
+
+    def _is_unchanged(self, path: Path, payload: bytes, data: Any) -> bool:
+        try:
+            existing = path.read_bytes()
+        except FileNotFoundError:
+            return False
+        if existing == payload:
+            return True
+        if not self.ignore_keys:
+            return False
+        try:
+            return self._without_ignored(loads_json(existing)) == self._without_ignored(
+                loads_json(payload))
+        except ValueError:
+            # Corrupt file on disk - overwrite it
+            return False
+
+    def _write_sync(self, path: Path, data: Any) -> bool:
+        payload = dumps_json(data)
+        if self._is_unchanged(path, payload, data):
+            return False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            # mkstemp creates 0600 files; keep the usual permissions for the site
+            os.chmod(tmp_name, 0o644)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except FileNotFoundError:
+                pass
+            raise
+        return True
+
+    async def write(self, path: Path, data: Dict[str, Any]) -> bool:
+        """
+        Write data to path as indented JSON, atomically.
+
+        Returns:
+            True if the file was written, False if its content was unchanged
+
+        Raises:
+            OSError / TypeError from serialization or disk I/O (counted as failed)
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            written = await loop.run_in_executor(self.executor, self._write_sync, Path(path), data)
+        except Exception:
+            self.stats["failed"] += 1
+            raise
+        self.stats["written" if written else "unchanged"] += 1
+        return written
+
+    def close(self):
+        """Wait for queued writes and stop the thread pool."""
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,347 @@
+"""
+In-page extraction scripts for employee profile pages.
+
+Each extractor is a JavaScript function expression that can be evaluated on
+its own (one CDP round trip per call). EXTRACTION_BUNDLE_JS composes all of
+them into ``window.__employeeExtractor``; it is registered once per browser
+context as an init script, so every profile page has it compiled and
+``extractAll`` returns every section in a single round trip.
+"""
+import functools
+from typing import Any, Dict, List
+
+from playwright.async_api import Page
+
+
+# Candidate name headers (logged to debug name extraction)
+DEBUG_NAME_JS = """
+() => {
+    const h1 = document.querySelector('h1');
+    const entityHeader = document.querySelector('h1[class*="EntityHeader"], h1[class*="entityHeader"], h1[class*="header"], h1[class*="Header"]');
+    const allH1s = document.querySelectorAll('h1');
+    return {
+        firstH1: h1?.textContent?.trim() || 'none',
+        entityHeader: entityHeader?.textContent?.trim() || 'none',
+        allH1s: Array.from(allH1s).map(h => h.textContent?.trim()).filter(t => t)
+    };
+}
+"""
+
+# Name, contact, position, bio, office and photo; takes the profile image selector
+BASIC_DATA_JS = """
+(profileImageSelector) => {
+    const data = {};
+
+    // Basic information - use more specific selectors for employee name
+    data.human_name = document.querySelector('h1[class*="EntityHeader"], h1[class*="entityHeader"], h1[class*="header"], h1[class*="Header"], h1:not([class*="section"])')?.textContent?.trim() || 
+                     document.querySelector('h1')?.textContent?.trim() || '';
+    data.email = document.querySelector('a[href^="mailto:"]')?.href?.replace('mailto:', '') || '';
+    data.phone = document.querySelector('a[href^="tel:"]')?.href?.replace('tel:', '') || '';
+
+    // Position and department - be more specific to avoid picking up the name
+    // Look for position/title elements that are NOT the main name
+    const positionSelectors = [
+        '.EntityHeader__NormalLine-sc-1yar8fm-0:not(:first-child)',
+        '.position:not(:first-child)',
+        '.title:not(:first-child)',
+        '.job-title:not(:first-child)',
+        '.role:not(:first-child)',
+        '[data-kafieldname*="title"]',
+        '[data-kafieldname*="position"]'
+    ];
+
+    let position = '';
+    for (const selector of positionSelectors) {
+        const el = document.querySelector(selector);
+        if (el && el.textContent?.trim() && el.textContent.trim() !== data.human_name) {
+            position = el.textContent.trim();
+            break;
+        }
+    }
+    data.position = position;
+
+    data.department = document.querySelector('.department, .team, .division, .group')?.textContent?.trim() || '';
+
+    // Bio - use the correct class for bio content
+    const bioEl = document.querySelector('.EntityFields__InfoFieldValue-sc-129sxys-5, .bio-content, .about-content, .description-content, .employee-bio-content, [data-bio]');
+    data.bio = bioEl ? bioEl.textContent?.trim() : null;
+
+    // Office location
+    data.office_location = document.querySelector('.location, .office, .address')?.textContent?.trim() || '';
+
+    // Profile image
+    const img = document.querySelector(profileImageSelector);
+    data.image_url = img ? img.src : '';
+
+    return data;
+}
+"""
+
+# Mobile, Teams, LinkedIn and website links
+CONTACT_DATA_JS = """
+() => {
+    const data = {};
+    data.mobile = document.querySelector('a[href^="tel:"]')?.href?.replace('tel:', '') || '';
+    data.teams_url = document.querySelector('a[href*="teams.microsoft.com"]')?.href || '';
+    data.linkedin_url = document.querySelector('a[href*="linkedin.com"]')?.href || '';
+    data.website_url = document.querySelector('a[href*="http"]:not([href*="ennead.com"])')?.href || '';
+    return data;
+}
+"""
+
+# Finds a section by header text and parses it as a table or simple text;
+# takes the section name and returns {found, sectionType, data, rawText}
+SECTION_PARSER_JS = """
+(sectionName) => {
+    const results = {
+        found: false,
+        sectionType: 'none',
+        data: {},
+        rawText: ''
+    };
+
+    // Look for section headers (h1, h2, h3, h4, h5, h6, or elements with common header classes)
+    const headerSelectors = [
+        'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+        '[class*="header"]', '[class*="title"]', '[class*="section"]',
+        '[class*="block"]', '[class*="field"]'
+    ];
+
+    let sectionHeader = null;
+    let sectionContainer = null;
+
+    // Try to find the section header
+    for (const selector of headerSelectors) {
+        const headers = document.querySelectorAll(selector);
+        for (const header of headers) {
+            const text = header.textContent?.trim().toLowerCase() || '';
+            if (text.includes(sectionName.toLowerCase())) {
+                sectionHeader = header;
+                sectionContainer = header.closest('.EntityFields, .section, .block, .field, .container, div');
+                break;
+            }
+        }
+        if (sectionHeader) break;
+    }
+
+    if (!sectionHeader) {
+        return results;
+    }
+
+    results.found = true;
+    results.rawText = sectionContainer ? sectionContainer.textContent : '';
+
+    // Determine if this is a table or simple section
+    const tableElements = sectionContainer ? sectionContainer.querySelectorAll('table, [class*="table"], [class*="grid"], [class*="Table"], [class*="Grid"]') : [];
+    const rowElements = sectionContainer ? sectionContainer.querySelectorAll('tr, [class*="row"], [class*="Row"], [class*="tr"], [class*="Tr"]') : [];
+
+    if (tableElements.length > 0 || rowElements.length > 0) {
+        // This is a table section
+        results.sectionType = 'table';
+
+        // Try to extract table data
+        const table = tableElements[0] || sectionContainer;
+        const rows = table.querySelectorAll('tr, [class*="row"], [class*="Row"], [class*="tr"], [class*="Tr"]');
+
+        if (rows.length > 0) {
+            // Extract headers from first row
+            const firstRow = rows[0];
+            const headers = [];
+            const headerCells = firstRow.querySelectorAll('th, td, [class*="cell"], [class*="Cell"], [class*="header"], [class*="Header"], [class*="th"], [class*="Th"], [class*="td"], [class*="Td"]');
+
+            headerCells.forEach(cell => {
+                const text = cell.textContent?.trim();
+                if (text) headers.push(text);
+            });
+
+            // If no headers found, try to infer from data rows
+            if (headers.length === 0 && rows.length > 1) {
+                const dataRow = rows[1];
+                const dataCells = dataRow.querySelectorAll('td, [class*="cell"], [class*="Cell"], [class*="td"], [class*="Td"]');
+                headers.length = dataCells.length;
+                headers.fill('column');
+                headers.forEach((_, i) => headers[i] = `column_${i + 1}`);
+            }
+
+            // Extract data rows
+            for (let i = 1; i < rows.length; i++) {
+                const row = rows[i];
+                const cells = row.querySelectorAll('td, [class*="cell"], [class*="Cell"], [class*="td"], [class*="Td"]');
+                const rowData = {};
+                let rowKey = '';
+
+                cells.forEach((cell, cellIndex) => {
+                    const text = cell.textContent?.trim();
+                    if (text) {
+                        const header = headers[cellIndex] || `column_${cellIndex + 1}`;
+                        rowData[header] = text;
+
+                        // Use first column as row key
+                        if (cellIndex === 0) {
+                            rowKey = text;
+                        }
+                    }
+                });
+
+                if (rowKey && Object.keys(rowData).length > 0) {
+                    results.data[rowKey] = rowData;
+                }
+            }
+        } else {
+            // No clear table structure, try to parse as key-value pairs
+            const fieldElements = sectionContainer.querySelectorAll('[class*="field"], [class*="Field"], [data-kafieldname], [class*="value"], [class*="Value"], [class*="text"], [class*="Text"]');
+            fieldElements.forEach(field => {
+                const text = field.textContent?.trim();
+                if (text && text.length > 1) {
+                    // Try to split on common separators
+                    const parts = text.split(/[:\\-\\|]/);
+                    if (parts.length >= 2) {
+                        const key = parts[0].trim();
+                        const value = parts.slice(1).join(':').trim();
+                        if (key && value) {
+                            results.data[key] = value;
+                        }
+                    } else {
+                        // Single value, use as key
+                        results.data[text] = text;
+                    }
+                }
+            });
+        }
+    } else {
+        // This is a simple section
+        results.sectionType = 'simple';
+
+        // Extract simple text content
+        const textElements = sectionContainer.querySelectorAll('p, span, div, [class*="value"], [class*="Value"], [class*="text"], [class*="Text"], [class*="content"], [class*="Content"]');
+        const texts = [];
+
+        textElements.forEach(el => {
+            const text = el.textContent?.trim();
+            if (text && text.length > 1 && !text.includes(sectionName)) {
+                texts.push(text);
+            }
+        });
+
+        if (texts.length > 0) {
+            results.data['value'] = texts.join(' ').trim();
+        } else {
+            // Fallback: use raw text content
+            const rawText = sectionContainer.textContent?.trim() || '';
+            if (rawText && !rawText.includes(sectionName)) {
+                results.data['value'] = rawText;
+            }
+        }
+    }
+
+    return results;
+}
+"""
+
+# Every /project/ link on the page
+PROJECT_LINKS_JS = """
+() => {
+    const projectLinks = [];
+    // Look for project links anywhere on the page (more robust)
+    const allLinks = document.querySelectorAll('a[href*="/project/"]');
+    allLinks.forEach(link => {
+        const href = link.getAttribute('href');
+        const text = link.textContent?.trim();
+        if (href && text && text.length > 3) {
+            projectLinks.push({
+                url: href.startsWith('http') ? href : 'https://ei.ennead.com' + href,
+                name: text,
+                project_number: href.split('/').pop() || ''
+            });
+        }
+    });
+    return projectLinks;
+}
+"""
+
+EXTRACTION_BUNDLE_JS = f"""
+window.__employeeExtractor = {{
+    debugName: {DEBUG_NAME_JS},
+    basicData: {BASIC_DATA_JS},
+    contactData: {CONTACT_DATA_JS},
+    parseSection: {SECTION_PARSER_JS},
+    projectLinks: {PROJECT_LINKS_JS},
+    extractAll(options) {{
+        const sections = {{}};
+        for (const name of options.sections) {{
+            sections[name] = this.parseSection(name);
+        }}
+        return {{
+            title: document.title,
+            debugName: this.debugName(),
+            basic: this.basicData(options.profileImageSelector),
+            contact: this.contactData(),
+            sections: sections,
+            projectLinks: this.projectLinks()
+        }};
+    }}
+}};
+"""
+
+# Evaluated per profile once the bundle is installed
+EXTRACT_ALL_JS = "(options) => window.__employeeExtractor.extractAll(options)"
+
+
+class RoundTripCounter:
+    """
+    Counts page-level protocol round trips (evaluate, selector queries, waits).
+
+    Wraps the methods on the page instance, so every extractor that receives the
+    page is counted without changes; element-handle calls are not included.
+    Each wrapper keeps the original method as ``__wrapped__`` for calls that are
+    not extraction work (readiness polling uses it).
+    """
+
+    COUNTED_METHODS = (
+        'goto', 'evaluate', 'query_selector', 'query_selector_all',
+        'wait_for_selector', 'title', 'content', 'screenshot',
+    )
+
+    def __init__(self):
+        self.counts: Dict[Page, int] = {}
+        self.per_profile: List[int] = []
+
+    def attach(self, page: Page):
+        """Start counting calls on a page (idempotent)."""
+        if page in self.counts:
+            return
+        self.counts[page] = 0
+        for method_name in self.COUNTED_METHODS:
+            setattr(page, method_name, self._wrap(page, getattr(page, method_name)))
+
+    def _wrap(self, page: Page, method):
+        @functools.wraps(method)
+        async def counted(*args, **kwargs):
+            self.counts[page] += 1
+            return await method(*args, **kwargs)
+        return counted
+
+    def reset(self, page: Page):
+        self.counts[page] = 0
+
+    def detach(self, page: Page):
+        """Forget a closed or replaced page."""
+        self.counts.pop(page, None)
+
+    def finish_profile(self, page: Page) -> int:
+        """Record and return the round trips of the profile just scraped on a page."""
+        count = self.counts.get(page, 0)
+        self.per_profile.append(count)
+        self.counts[page] = 0
+        return count
+
+    def get_summary(self) -> Dict[str, Any]:
+        if not self.per_profile:
+            return {'profiles': 0}
+        ordered = sorted(self.per_profile)
+        return {
+            'profiles': len(ordered),
+            'mean': round(sum(ordered) / len(ordered), 1),
+            'p50': ordered[len(ordered) // 2],
+            'max': ordered[-1],
+        }
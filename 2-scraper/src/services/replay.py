@@ -0,0 +1,223 @@
+"""
+Offline record/replay of the directory site for benchmarking.
+
+``NetworkRecorder`` saves every first-party response a scrape receives
+(profile page HTML, the SPA's scripts and JSON) plus the resulting employee
+records into a recording directory. ``ReplayServer`` later serves those
+responses to Playwright with ``route.fulfill`` so the full extraction pipeline
+runs without the intranet, deterministically, and its output can be compared
+with the recorded run (see ``src/benchmark.py``).
+
+Recordings contain employee data and session-bound responses: keep them under
+debug/ and never commit them.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from playwright.async_api import BrowserContext, Response, Route
+
+
+RECORDING_FILE = "recording.json"
+BODIES_DIR = "bodies"
+
+# Fields that legitimately differ between a live run and its replay
+VOLATILE_FIELDS = ("scraped_at", "image_local_path", "image_srcset")
+
+# Response headers that don't describe the stored (already decoded) body
+DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "set-cookie"}
+
+
+def _request_key(method: str, url: str, post_data: Optional[str]) -> str:
+    """Key identifying a request: method, URL and a hash of the body (for POSTs)."""
+    body_hash = hashlib.sha1(post_data.encode("utf-8")).hexdigest()[:12] if post_data else ""
+    return f"{method} {url} {body_hash}".rstrip()
+
+
+def comparable_records(employees: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Employee dicts keyed by profile URL with VOLATILE_FIELDS removed."""
+    return {
+        employee.get("profile_url") or employee.get("human_name"): {
+            key: value for key, value in employee.items() if key not in VOLATILE_FIELDS
+        }
+        for employee in employees
+    }
+
+
+class NetworkRecorder:
+    """
+    Records first-party responses of a browser context to a directory.
+    """
+
+    def __init__(self, recording_dir: Path, base_url: str, allow_patterns: Iterable[str] = ('/api/image/',)):
+        """
+        Initialize the recorder.
+
+        Args:
+            recording_dir: Directory for recording.json and the bodies/ store
+            base_url: Directory URL; responses from its host are recorded
+            allow_patterns: URL substrings recorded even from other hosts
+        """
+        self.recording_dir = Path(recording_dir)
+        self.bodies_dir = self.recording_dir / BODIES_DIR
+        self.base_url = base_url
+        self.origin_host = urlparse(base_url).netloc
+        self.allow_patterns = tuple(allow_patterns)
+        self.logger = logging.getLogger(__name__)
+
+        self.entries: List[Dict[str, Any]] = []
+        self._pending: set = set()
+
+    def install(self, context: BrowserContext):
+        """Start recording responses of the context."""
+        self.bodies_dir.mkdir(parents=True, exist_ok=True)
+        context.on("response", self._on_response)
+        self.logger.info(f"[RECORD] Recording network responses to {self.recording_dir}")
+
+    def _should_record(self, response: Response) -> bool:
+        # Redirects are skipped so replay serves the final response at the original URL
+        # (which also leaves the sign-in hops out of the recording)
+        if 300 <= response.status < 400:
+            return False
+        url = response.url
+        return urlparse(url).netloc == self.origin_host or any(p in url for p in self.allow_patterns)
+
+    def _on_response(self, response: Response):
+        if self._should_record(response):
+            task = asyncio.ensure_future(self._capture(response))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def _capture(self, response: Response):
+        request = response.request
+        try:
+            body = await response.body()
+        except Exception as e:
+            # Body no longer available (page navigated away)
+            self.logger.debug(f"[RECORD] No body for {response.url}: {e}")
+            return
+
+        digest = hashlib.sha256(body).hexdigest()
+        body_path = self.bodies_dir / digest
+        if not body_path.exists():
+            body_path.write_bytes(body)
+
+        self.entries.append({
+            "key": _request_key(request.method, request.url, request.post_data),
+            "url": request.url,
+            "resource_type": request.resource_type,
+            "status": response.status,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() not in DROPPED_HEADERS},
+            "body": digest,
+        })
+
+    async def save(self, employees: List[Dict[str, Any]]):
+        """Write recording.json with the captured responses and the run's employee records."""
+        if self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+        data = {
+            "version": 1,
+            "base_url": self.base_url,
+            "recorded_at": datetime.now().isoformat(),
+            "entries": self.entries,
+            "employees": employees,
+        }
+        tmp_path = self.recording_dir / (RECORDING_FILE + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, self.recording_dir / RECORDING_FILE)
+        self.logger.info(f"[RECORD] Saved {len(self.entries)} responses and {len(employees)} employees "
+                         f"to {self.recording_dir}")
+
+
+class ReplayServer:
+    """
+    Serves a recording to a browser context in place of the live site.
+    """
+
+    def __init__(self, recording_dir: Path):
+        """
+        Load a recording.
+
+        Args:
+            recording_dir: Directory written by NetworkRecorder
+        """
+        self.recording_dir = Path(recording_dir)
+        self.logger = logging.getLogger(__name__)
+        with open(self.recording_dir / RECORDING_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self.base_url: str = data["base_url"]
+        self.recorded_at: str = data.get("recorded_at", "")
+        self.expected_employees: List[Dict[str, Any]] = data.get("employees", [])
+
+        # Responses to the same request are served in recorded order (the last one repeats)
+        self.index: Dict[str, List[Dict[str, Any]]] = {}
+        for entry in data.get("entries", []):
+            self.index.setdefault(entry["key"], []).append(entry)
+        self._cursors: Counter = Counter()
+        self._bodies: Dict[str, bytes] = {}
+
+        self.served = 0
+        self.misses: Counter = Counter()
+
+    @property
+    def output_dir(self) -> Path:
+        """Where a replayed run writes its files (never the real docs/ tree)."""
+        return self.recording_dir / "replay_output"
+
+    def _body(self, digest: str) -> bytes:
+        body = self._bodies.get(digest)
+        if body is None:
+            body = (self.recording_dir / BODIES_DIR / digest).read_bytes()
+            self._bodies[digest] = body
+        return body
+
+    async def install(self, context: BrowserContext):
+        """Route every request of the context to the recording (unknown requests are aborted)."""
+        await context.route("**/*", self._handle_route)
+        self.logger.info(f"[REPLAY] Serving {sum(len(v) for v in self.index.values())} recorded responses "
+                         f"from {self.recording_dir} (recorded {self.recorded_at})")
+
+    def _next_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        entries = self.index.get(key)
+        if not entries:
+            return None
+        position = min(self._cursors[key], len(entries) - 1)
+        self._cursors[key] += 1
+        return entries[position]
+
+    async def _handle_route(self, route: Route):
+        request = route.request
+        entry = self._next_entry(_request_key(request.method, request.url, request.post_data))
+        try:
+            if entry is None:
+                self.misses[request.resource_type] += 1
+                self.logger.debug(f"[REPLAY] Not in recording: {request.method} {request.url}")
+                await route.abort()
+                return
+            self.served += 1
+            await route.fulfill(status=entry["status"], headers=entry["headers"], body=self._body(entry["body"]))
+        except Exception as e:
+            # Page was closed while the request was in flight
+            self.logger.debug(f"[REPLAY] Route handling failed for {request.url}: {e}")
+
+    def compare(self, employees: List[Dict[str, Any]]) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Compare replayed employee records with the recorded ones (ignoring VOLATILE_FIELDS).
+
+        Returns:
+            (missing, unexpected, different) profile keys
+        """
+        expected = comparable_records(self.expected_employees)
+        actual = comparable_records(employees)
+        missing = sorted(set(expected) - set(actual))
+        unexpected = sorted(set(actual) - set(expected))
+        different = sorted(key for key in set(expected) & set(actual) if expected[key] != actual[key])
+        return missing, unexpected, different
@@ -0,0 +1,152 @@
+"""
+Resource blocking for profile extraction.
+
+Routes every request of a browser context through a small policy: resource
+types the extractors never read (fonts, media, images other than profile
+photos) are aborted, and third-party hosts are aborted or stubbed. Stylesheets
+are loaded by default, wherever they are hosted: the Kendo theme gives the
+projects grid its fixed-height scrolling pane, which the grid walk and the
+visibility waits depend on. Counts and byte totals are kept so each run can
+report what was saved.
+"""
+import logging
+from collections import Counter
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+from playwright.async_api import BrowserContext, Response, Route
+
+
+# Typical transfer sizes used to estimate bytes saved by aborted requests
+# (an aborted request never reports its real size)
+ESTIMATED_SIZES = {
+    'image': 60_000,
+    'media': 500_000,
+    'font': 40_000,
+    'stylesheet': 30_000,
+    'script': 80_000,
+}
+DEFAULT_ESTIMATED_SIZE = 5_000
+
+# Hosts that must keep working even though they are third-party (sign-in redirects)
+DEFAULT_ALLOWED_HOSTS = (
+    'login.microsoftonline.com',
+    'login.live.com',
+    'aadcdn.msauth.net',
+    'aadcdn.msftauth.net',
+)
+
+
+class ResourceBlocker:
+    """
+    Context-wide request router that blocks non-essential resources.
+    """
+
+    def __init__(self, origin: str,
+                 blocked_types: Iterable[str] = ('image', 'media', 'font'),
+                 block_third_party: bool = True,
+                 allow_patterns: Iterable[str] = ('/api/image/',),
+                 allowed_hosts: Iterable[str] = DEFAULT_ALLOWED_HOSTS):
+        """
+        Initialize the blocker.
+
+        Args:
+            origin: Scheme and host of the directory site (first-party)
+            blocked_types: Playwright resource types to abort (with "stylesheet" also
+                third-party stylesheets; without it every stylesheet loads)
+            block_third_party: Abort/stub requests to hosts other than the origin
+            allow_patterns: URL substrings that are always allowed (profile images)
+            allowed_hosts: Third-party hosts that are always allowed
+        """
+        self.origin_host = urlparse(origin).netloc
+        self.blocked_types = set(blocked_types)
+        self.block_third_party = block_third_party
+        self.allow_patterns = tuple(allow_patterns)
+        self.allowed_hosts = set(allowed_hosts)
+        self.logger = logging.getLogger(__name__)
+
+        self.blocked: Counter = Counter()
+        self.stubbed: Counter = Counter()
+        self.blocked_hosts: Counter = Counter()
+        self.allowed_requests = 0
+        self.allowed_bytes = 0
+        self.estimated_bytes_saved = 0
+        self.context: Optional[BrowserContext] = None
+
+    async def install(self, context: BrowserContext):
+        """Start routing every request of the context through the policy."""
+        self.context = context
+        await context.route("**/*", self._handle_route)
+        context.on("response", self._on_response)
+        self.logger.info(f"[INFO] Resource blocking enabled: types={sorted(self.blocked_types)}, "
+                         f"third_party={'blocked' if self.block_third_party else 'allowed'}")
+
+    async def uninstall(self):
+        """Stop routing (e.g. before capturing debug screenshots)."""
+        if self.context:
+            await self.context.unroute("**/*", self._handle_route)
+            self.context.remove_listener("response", self._on_response)
+            self.context = None
+
+    def _decide(self, url: str, resource_type: str) -> str:
+        """Return "allow", "abort" or "stub" for a request."""
+        if any(pattern in url for pattern in self.allow_patterns):
+            return "allow"
+        host = urlparse(url).netloc
+        if resource_type == 'stylesheet' and 'stylesheet' not in self.blocked_types:
+            # Page layout (and the grid's scroll container) depends on the theme CSS
+            return "allow"
+        if self.block_third_party and host and host != self.origin_host and host not in self.allowed_hosts:
+            # Stub third-party scripts so pages waiting on them don't error out
+            return "stub" if resource_type == 'script' else "abort"
+        if resource_type in self.blocked_types:
+            return "abort"
+        return "allow"
+
+    async def _handle_route(self, route: Route):
+        request = route.request
+        decision = self._decide(request.url, request.resource_type)
+        try:
+            if decision == "allow":
+                # Fall back rather than continue, so an earlier route (replay) can serve it
+                await route.fallback()
+                return
+            self.estimated_bytes_saved += ESTIMATED_SIZES.get(request.resource_type, DEFAULT_ESTIMATED_SIZE)
+            host = urlparse(request.url).netloc
+            if host != self.origin_host:
+                self.blocked_hosts[host] += 1
+            if decision == "stub":
+                self.stubbed[request.resource_type] += 1
+                await route.fulfill(status=200, content_type="application/javascript", body="")
+            else:
+                self.blocked[request.resource_type] += 1
+                await route.abort()
+        except Exception as e:
+            # Page was closed while the request was in flight
+            self.logger.debug(f"Route handling failed for {request.url}: {e}")
+
+    def _on_response(self, response: Response):
+        self.allowed_requests += 1
+        try:
+            self.allowed_bytes += int(response.headers.get("content-length") or 0)
+        except ValueError:
+            pass
+
+    def get_report(self) -> Dict[str, object]:
+        """Per-run totals of blocked and allowed traffic."""
+        return {
+            'blocked_requests': sum(self.blocked.values()),
+            'stubbed_requests': sum(self.stubbed.values()),
+            'blocked_by_type': dict(self.blocked),
+            'top_blocked_hosts': dict(self.blocked_hosts.most_common(5)),
+            'estimated_bytes_saved': self.estimated_bytes_saved,
+            'allowed_requests': self.allowed_requests,
+            'allowed_bytes': self.allowed_bytes,
+        }
+
+    def summary(self) -> str:
+        """One-line summary for console output."""
+        report = self.get_report()
+        saved = report['blocked_requests'] + report['stubbed_requests']
+        return (f"{saved} requests blocked (~{report['estimated_bytes_saved'] / 1_000_000:.1f} MB saved, est.), "
+                f"{report['allowed_requests']} allowed ({report['allowed_bytes'] / 1_000_000:.1f} MB)")
@@ -0,0 +1,126 @@
+"""
+Encrypted cache of the browser session (Playwright storage_state).
+
+After a successful Microsoft sign-in the context's cookies and localStorage
+are saved, encrypted with a key derived from the scraper credentials (or
+SCRAPER_SESSION_KEY), so later runs can skip the login flow. Entries whose
+cookies have all expired (or older than an optional maximum age) are ignored,
+and a session the site rejects is discarded; the scraper then falls back to a
+full login.
+
+Requires the optional ``cryptography`` package; without it the cache is
+disabled and nothing is written to disk.
+"""
+import base64
+import hashlib
+import json
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # pragma: no cover - optional dependency
+    Fernet = None
+    InvalidToken = Exception
+
+
+SALT_BYTES = 16
+KDF_ITERATIONS = 200_000
+
+
+class SessionCache:
+    """
+    Encrypted on-disk storage_state for reuse across runs.
+    """
+
+    def __init__(self, cache_path: Path, secret: Optional[str], max_age_hours: int = 0):
+        """
+        Initialize the session cache.
+
+        Args:
+            cache_path: Encrypted cache file
+            secret: Key material (SCRAPER_SESSION_KEY or the login credentials)
+            max_age_hours: Cached sessions older than this are not reused (0: no age limit,
+                cookie expiry and the site decide)
+        """
+        self.cache_path = Path(cache_path)
+        self.secret = secret
+        self.max_age = timedelta(hours=max_age_hours) if max_age_hours > 0 else None
+        self.logger = logging.getLogger(__name__)
+
+        if Fernet is None:
+            self.logger.info("[SESSION] cryptography is not installed, session cache disabled")
+        elif not secret:
+            self.logger.info("[SESSION] No credentials or SCRAPER_SESSION_KEY, session cache disabled")
+
+    @property
+    def enabled(self) -> bool:
+        return Fernet is not None and bool(self.secret)
+
+    def _fernet(self, salt: bytes) -> "Fernet":
+        key = hashlib.pbkdf2_hmac("sha256", self.secret.encode("utf-8"), salt, KDF_ITERATIONS)
+        return Fernet(base64.urlsafe_b64encode(key))
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Load a usable storage_state.
+
+        Returns:
+            storage_state dict with expired cookies removed, or None if there is
+            no cache, it cannot be decrypted, is too old, or has no live cookies
+        """
+        if not self.enabled or not self.cache_path.exists():
+            return None
+        try:
+            blob = self.cache_path.read_bytes()
+            salt, token = blob[:SALT_BYTES], blob[SALT_BYTES:]
+            payload = json.loads(self._fernet(salt).decrypt(token))
+        except (InvalidToken, ValueError) as e:
+            # Credentials changed or file corrupted - it can never be used again
+            self.logger.warning(f"[SESSION] Could not decrypt session cache, discarding it: {str(e) or 'invalid token'}")
+            self.clear()
+            return None
+
+        saved_at = datetime.fromisoformat(payload["saved_at"])
+        if self.max_age and datetime.now() - saved_at > self.max_age:
+            self.logger.info(f"[SESSION] Cached session from {payload['saved_at']} is older than {self.max_age}, ignoring it")
+            return None
+
+        state = payload["state"]
+        now = time.time()
+        # Session cookies have expires == -1 and stay valid until the server rejects them
+        cookies = [c for c in state.get("cookies", []) if c.get("expires", -1) in (-1, None) or c["expires"] > now]
+        if not cookies:
+            self.logger.info("[SESSION] All cached cookies have expired, ignoring cached session")
+            return None
+        state["cookies"] = cookies
+
+        self.logger.info(f"[SESSION] Reusing cached session from {payload['saved_at']} ({len(cookies)} cookies)")
+        return state
+
+    def save(self, state: Dict[str, Any]):
+        """Encrypt and atomically write a storage_state."""
+        if not self.enabled:
+            return
+        salt = os.urandom(SALT_BYTES)
+        payload = json.dumps({"saved_at": datetime.now().isoformat(), "state": state}).encode("utf-8")
+        blob = salt + self._fernet(salt).encrypt(payload)
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(blob)
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, self.cache_path)
+        self.logger.info(f"[SESSION] Saved encrypted session cache: {self.cache_path}")
+
+    def clear(self):
+        """Delete the cache (e.g. after the server rejected the session)."""
+        try:
+            self.cache_path.unlink()
+        except FileNotFoundError:
+            pass
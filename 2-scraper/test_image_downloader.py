@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for ImageDownloader over the shared aiohttp session (no Playwright page).
+
+A local aiohttp server stands in for the image host: it serves a JPEG with an
+ETag and Last-Modified and answers 304 to a matching If-None-Match.
+"""
+
+import asyncio
+import os
+import sys
+
+from aiohttp import web
+
+# Add the scraper directory to the path so we can import the src package
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.services.image_downloader import ImageDownloader  # noqa: E402
+
+IMAGE_BYTES = b"\xff\xd8\xff\xe0" + b"jpeg" * 64
+ETAG = '"v1"'
+LAST_MODIFIED = "Wed, 01 Oct 2025 08:00:00 GMT"
+
+
+async def _download_twice(images_dir):
+    requests = []
+
+    async def serve_image(request):
+        requests.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == ETAG:
+            return web.Response(status=304)
+        return web.Response(body=IMAGE_BYTES, content_type="image/jpeg",
+                            headers={"ETag": ETAG, "Last-Modified": LAST_MODIFIED})
+
+    app = web.Application()
+    app.router.add_get("/api/image/john.jpg", serve_image)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    url = f"http://127.0.0.1:{port}/api/image/john.jpg"
+    try:
+        downloader = ImageDownloader(str(images_dir))
+        first = await downloader.download_image(url, "John Smith")
+        second = await downloader.download_image(url, "John Smith")
+        await downloader.close()
+    finally:
+        await runner.cleanup()
+    return downloader, requests, first, second
+
+
+def test_download_and_conditional_fetch(tmp_path):
+    downloader, requests, first, second = asyncio.run(_download_twice(tmp_path))
+
+    # 200: the image is stored with the validators from the response headers
+    assert first is not None
+    filename = first.rsplit("/", 1)[-1]
+    assert (tmp_path / filename).read_bytes() == IMAGE_BYTES
+    entry = downloader.manifest[filename]
+    assert entry["etag"] == ETAG
+    assert entry["last_modified"] == LAST_MODIFIED
+
+    # 304: the second request is conditional and keeps the stored file
+    assert requests[1].get("If-None-Match") == ETAG
+    assert requests[1].get("If-Modified-Since") == LAST_MODIFIED
+    assert second == first
+    assert downloader.stats["downloaded"] == 1
+    assert downloader.stats["not_modified"] == 1
+    assert downloader.stats["failed"] == 0
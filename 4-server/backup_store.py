@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Content-addressed, deduplicated store for computer data backups.
+
+The server used to back up every submission as a full pretty-printed JSON file
+in docs/assets/computer_info_data_backup/, although most submissions of a
+machine differ only in their timestamps. ``BackupStore`` keeps, under
+docs/assets/computer_info_backup/:
+
+- blobs/<sha256>.json: each distinct payload once, as canonical JSON (sorted
+  keys, no whitespace) without the volatile fields (timestamps, live memory
+  usage); the name is the SHA-256 of that JSON. Blobs aren't gzipped: git
+  compresses objects itself, and its delta compression between similar blobs
+  doesn't work on gzipped files (a gzipped store packed ~50% larger)
+- machines/<computer>.json: the time series of one machine: an entry
+  ({"blob", "human_name", "seen"}) for every submission that changed its data.
+  A submission identical to the machine's latest one writes nothing, so
+  repeated check-ins add nothing to the repository (the individual computer
+  data file records when a machine last reported)
+
+``compact`` applies a retention policy (the latest entries of every machine
+plus all recent ones) and deletes the blobs no entry refers to.
+
+Usage:
+    python 4-server/backup_store.py migrate [--remove]   # import computer_info_data_backup/
+    python 4-server/backup_store.py compact --keep-entries 50 --keep-days 365
+    python 4-server/backup_store.py stats
+
+Standard library only.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from pathlib import Path
+
+
+BACKUP_STORE_VERSION = 1
+# Differ between otherwise identical submissions; the time series records when a payload was seen
+VOLATILE_FIELDS = frozenset({
+    'server_timestamp', 'timestamp', 'Date', 'Collection Date', 'collection_date', 'last_updated',
+    'server_processing_timestamp', 'Available Memory Bytes', 'Used Memory Bytes', 'Memory Usage Percent',
+})
+VOLATILE_SYSTEM_INFO_FIELDS = frozenset({'available_memory_bytes', 'used_memory_bytes', 'memory_percent'})
+# Default retention: the latest entries of each machine, plus every entry from the last KEEP_DAYS days
+KEEP_ENTRIES = 50
+KEEP_DAYS = 365
+# Unreferenced blobs younger than this are left alone (a submission may be writing its entry right now)
+SWEEP_GRACE_SECONDS = 3600
+
+_ASSETS_DIR = Path(__file__).resolve().parent.parent / 'docs' / 'assets'
+DEFAULT_STORE_DIR = _ASSETS_DIR / 'computer_info_backup'
+LEGACY_BACKUP_DIR = _ASSETS_DIR / 'computer_info_data_backup'
+
+
+def strip_volatile(payload: dict) -> dict:
+    """Payload without the fields that change between otherwise identical submissions."""
+    stripped = {key: value for key, value in payload.items() if key not in VOLATILE_FIELDS}
+    if isinstance(stripped.get('system_info'), dict):
+        stripped['system_info'] = {key: value for key, value in stripped['system_info'].items()
+                                   if key not in VOLATILE_SYSTEM_INFO_FIELDS}
+    return stripped
+
+
+def canonical_json(data) -> bytes:
+    """Byte-stable JSON: sorted keys, no whitespace, UTF-8."""
+    return json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str).encode('utf-8')
+
+
+def machine_key(payload: dict) -> str:
+    """File-name-safe computer name of a payload."""
+    name = str(payload.get('Computername') or payload.get('computer_name') or 'unknown')
+    return name.replace(' ', '_').replace('/', '_').replace('\\', '_')
+
+
+def _write_durable(path: Path, payload: bytes):
+    """Write bytes atomically and fsync them."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        raise
+
+
+class BackupStore:
+    """
+    Deduplicated backups of computer data submissions.
+    """
+
+    def __init__(self, root=DEFAULT_STORE_DIR, lock=None):
+        """
+        Initialize the store.
+
+        Args:
+            root: Store directory (blobs/ and machines/ are created in it)
+            lock: Called with a machine index path; returns the context manager held
+                while that machine's index is updated (none by default)
+        """
+        self.root = Path(root)
+        self.blobs_dir = self.root / 'blobs'
+        self.machines_dir = self.root / 'machines'
+        self._lock = lock or (lambda path: nullcontext())
+
+    def blob_path(self, blob_id: str) -> Path:
+        return self.blobs_dir / f'{blob_id}.json'
+
+    def index_path(self, computer: str) -> Path:
+        return self.machines_dir / f'{computer}.json'
+
+    def put(self, payload: dict, seen_at: str = None) -> tuple:
+        """
+        Back up one submission.
+
+        Args:
+            payload: Computer data as submitted
+            seen_at: ISO time of the submission (default: its server_timestamp, else now)
+
+        Returns:
+            (blob id, True if the machine's data changed, i.e. an entry was added)
+        """
+        canonical = canonical_json(strip_volatile(payload))
+        blob_id = hashlib.sha256(canonical).hexdigest()
+        computer = machine_key(payload)
+        seen_at = seen_at or str(payload.get('server_timestamp') or datetime.now().isoformat())
+        index_path = self.index_path(computer)
+        with self._lock(str(index_path)):
+            index = self._read_index(computer)
+            entries = index['entries']
+            if entries and entries[-1]['blob'] == blob_id and entries[-1]['human_name'] == payload.get('human_name'):
+                return blob_id, False
+            blob_path = self.blob_path(blob_id)
+            if not blob_path.exists():
+                _write_durable(blob_path, canonical)
+            entries.append({'blob': blob_id, 'human_name': payload.get('human_name'), 'seen': seen_at})
+            self._write_index(index)
+        return blob_id, True
+
+    def get(self, blob_id: str) -> dict:
+        """Stored payload of a blob."""
+        return json.loads(self.blob_path(blob_id).read_bytes())
+
+    def history(self, computer: str) -> list:
+        """Entries of a machine, oldest first."""
+        return self._read_index(computer)['entries']
+
+    def machines(self) -> list:
+        return sorted(path.stem for path in self.machines_dir.glob('*.json'))
+
+    def _read_index(self, computer: str) -> dict:
+        path = self.index_path(computer)
+        if path.exists():
+            index = json.loads(path.read_text(encoding='utf-8'))
+            if index.get('version') == BACKUP_STORE_VERSION:
+                return index
+        return {'version': BACKUP_STORE_VERSION, 'computer_name': computer, 'entries': []}
+
+    def _write_index(self, index: dict):
+        payload = json.dumps(index, indent=2, ensure_ascii=False) + '\n'
+        _write_durable(self.index_path(index['computer_name']), payload.encode('utf-8'))
+
+    def compact(self, keep_entries: int = KEEP_ENTRIES, keep_days: float = KEEP_DAYS, now: datetime = None) -> dict:
+        """
+        Apply the retention policy and delete unreferenced blobs.
+
+        Every machine keeps its latest keep_entries entries and every entry from the last
+        keep_days days (its latest entry always survives).
+
+        Returns:
+            Counts of the entries and blobs removed
+        """
+        cutoff = ((now or datetime.now()) - timedelta(days=keep_days)).isoformat()
+        referenced = set()
+        entries_removed = 0
+        for computer in self.machines():
+            with self._lock(str(self.index_path(computer))):
+                index = self._read_index(computer)
+                entries = index['entries']
+                recent = max(1, keep_entries)
+                kept = [entry for position, entry in enumerate(entries)
+                        if position >= len(entries) - recent or entry['seen'] >= cutoff]
+                if len(kept) != len(entries):
+                    entries_removed += len(entries) - len(kept)
+                    index['entries'] = kept
+                    self._write_index(index)
+                referenced.update(entry['blob'] for entry in kept)
+
+        blobs_removed = 0
+        grace_cutoff = time.time() - SWEEP_GRACE_SECONDS
+        for blob_path in self.blobs_dir.glob('*.json'):
+            if blob_path.stem not in referenced and blob_path.stat().st_mtime < grace_cutoff:
+                blob_path.unlink()
+                blobs_removed += 1
+        return {'entries_removed': entries_removed, 'blobs_removed': blobs_removed}
+
+    def stats(self) -> dict:
+        """Machines, entries, blobs and bytes on disk."""
+        machines = self.machines()
+        files = [path for path in self.root.rglob('*') if path.is_file()]
+        return {
+            'machines': len(machines),
+            'entries': sum(len(self.history(computer)) for computer in machines),
+            'blobs': sum(1 for _ in self.blobs_dir.glob('*.json')),
+            'files': len(files),
+            'bytes': sum(path.stat().st_size for path in files),
+        }
+
+
+def _legacy_seen_at(path: Path, payload: dict) -> str:
+    """Submission time of a legacy backup: its server_timestamp, else the time in its file name."""
+    if payload.get('server_timestamp'):
+        return str(payload['server_timestamp'])
+    match = re.search(r'_(\d{8})_(\d{6})\.json$', path.name)
+    if match:
+        return datetime.strptime(''.join(match.groups()), '%Y%m%d%H%M%S').isoformat()
+    return datetime.fromtimestamp(path.stat().st_mtime).isoformat()
+
+
+def migrate(store: BackupStore, legacy_dir: Path = LEGACY_BACKUP_DIR, remove: bool = False) -> dict:
+    """
+    Import the per-submission backup files of computer_info_data_backup/ in time order.
+
+    Args:
+        store: Store to import into
+        legacy_dir: Directory of the old backup files
+        remove: Delete each old file once it is imported
+
+    Returns:
+        Counts and sizes before and after
+    """
+    backups = []
+    for path in sorted(Path(legacy_dir).glob('*.json')):
+        try:
+            payload = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Skipping unreadable backup {path.name}: {e}")
+            continue
+        backups.append((_legacy_seen_at(path, payload), path, payload))
+    backups.sort(key=lambda backup: backup[0])
+
+    legacy_bytes = sum(path.stat().st_size for _, path, _ in backups)
+    for seen_at, path, payload in backups:
+        store.put(payload, seen_at=seen_at)
+        if remove:
+            path.unlink()
+    return {'imported': len(backups), 'legacy_bytes': legacy_bytes, **store.stats()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Manage the deduplicated computer data backup store")
+    parser.add_argument('--store', type=Path, default=DEFAULT_STORE_DIR, help="Store directory")
+    commands = parser.add_subparsers(dest='command', required=True)
+    migrate_parser = commands.add_parser('migrate', help="Import the old per-submission backup files")
+    migrate_parser.add_argument('--legacy-dir', type=Path, default=LEGACY_BACKUP_DIR, help="Old backup directory")
+    migrate_parser.add_argument('--remove', action='store_true', help="Delete the old files once imported")
+    compact_parser = commands.add_parser('compact', help="Apply the retention policy and drop unreferenced blobs")
+    compact_parser.add_argument('--keep-entries', type=int, default=KEEP_ENTRIES, help="Latest entries kept per machine")
+    compact_parser.add_argument('--keep-days', type=float, default=KEEP_DAYS, help="Keep entries this many days old")
+    commands.add_parser('stats', help="Show what the store holds")
+    args = parser.parse_args()
+
+    store = BackupStore(args.store)
+    if args.command == 'migrate':
+        result = migrate(store, args.legacy_dir, remove=args.remove)
+        print(f"📦 Imported {result['imported']} backup files ({result['legacy_bytes'] / 1024:.0f} KiB): the store "
+              f"now holds {result['blobs']} blobs and {result['entries']} entries of {result['machines']} machines "
+              f"in {result['files']} files ({result['bytes'] / 1024:.0f} KiB)")
+    elif args.command == 'compact':
+        result = store.compact(args.keep_entries, args.keep_days)
+        print(f"🧹 Removed {result['entries_removed']} entries and {result['blobs_removed']} blobs")
+    else:
+        print(json.dumps(store.stats(), indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Load test for the computer data ingestion endpoint.
+
+Starts server.py on a local port inside a throwaway repo-shaped tree, fires a
+burst of POST /api/computer-data requests from concurrent clients and reports
+how fast they were accepted (202 + ticket), then polls the status endpoint
+until the worker pool has processed every ticket and reports the drain time.
+With --commit-delay the batched git commit is replaced by a sleep of that
+many seconds, to show that a slow push doesn't hold up requests.
+
+Usage:
+    python 4-server/benchmark_ingest.py --posts 500 --concurrency 50
+    python 4-server/benchmark_ingest.py --posts 500 --commit-delay 5
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+def _payload(rng: random.Random, number: int, employees: int) -> dict:
+    person = number % employees
+    return {"computer_info": {
+        "Computername": f"EANY-{person:05d}-{rng.randrange(4)}",
+        "Username": f"user{person}",
+        "human_name": f"Load Test {person}",
+        "os": "Microsoft Windows 11 Enterprise",
+        "manufacturer": "Dell Inc.",
+        "model": "Precision 5820 Tower",
+        "system_info": {"total_memory_bytes": 68719476736, "total_memory_formatted": "64.0 GB"},
+        "all_gpus": {"gpu_1": {"name": "NVIDIA RTX A4000", "driver": "31.0.15.3623", "priority": 3}},
+        "all_cpus": {"cpu_1": {"name": "Intel(R) Xeon(R) W-2123 CPU @ 3.60GHz", "cores": 4}},
+    }}
+
+
+def _request(url: str, body: dict = None) -> tuple:
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(req, timeout=60) as response:
+        return response.status, json.loads(response.read())
+
+
+def _percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Burst-test the computer data ingestion endpoint")
+    parser.add_argument("--posts", type=int, default=500, help="Number of submissions to send")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent clients")
+    parser.add_argument("--employees", type=int, default=200, help="Distinct employees the posts are spread over")
+    parser.add_argument("--workers", type=int, default=4, help="Ingest worker threads")
+    parser.add_argument("--commit-delay", type=float, default=None,
+                        help="Simulate batched commits taking this many seconds")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for the payloads")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="ingest_benchmark_") as tmp:
+        root = Path(tmp)
+        (root / "docs" / "assets").mkdir(parents=True)
+        # server.py finds the repository root from the working directory when imported
+        os.chdir(root)
+        os.environ["INGEST_QUEUE_PATH"] = str(root / ".cache" / "ingest_queue.sqlite3")
+        os.environ["INGEST_WORKERS"] = str(args.workers)
+        sys.path.insert(0, str(Path(__file__).resolve().parent))
+        import server
+        from werkzeug.serving import make_server
+
+        if args.commit_delay is not None:
+            server.commit_coalescer.commit_func = lambda names: time.sleep(args.commit_delay) or True
+        logging.getLogger("werkzeug").setLevel(logging.ERROR)
+        http_server = make_server("127.0.0.1", 0, server.app, threaded=True)
+        threading.Thread(target=http_server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{http_server.server_port}/api/computer-data"
+
+        rng = random.Random(args.seed)
+        payloads = [_payload(rng, number, args.employees) for number in range(args.posts)]
+        latencies = []
+
+        def post(payload):
+            started = time.perf_counter()
+            status, body = _request(base_url, payload)
+            latencies.append(time.perf_counter() - started)
+            return status, body.get("ticket")
+
+        print(f"Sending {args.posts} posts from {args.concurrency} clients ({args.workers} workers)")
+        log = open(os.devnull, "w")
+        real_stdout, sys.stdout = sys.stdout, log
+        try:
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+                results = list(pool.map(post, payloads))
+            accept_elapsed = time.perf_counter() - started
+
+            tickets = [ticket for status, ticket in results if status == 202 and ticket]
+            statuses = {}
+            while True:
+                statuses = {ticket: _request(f"{base_url}/{ticket}")[1]["status"] for ticket in tickets}
+                if all(status not in ("queued", "processing") for status in statuses.values()):
+                    break
+                time.sleep(0.2)
+            drain_elapsed = time.perf_counter() - started
+            if args.commit_delay is not None:
+                server.commit_coalescer.stop()
+        finally:
+            sys.stdout = real_stdout
+            log.close()
+            http_server.shutdown()
+
+        counts = {}
+        for status in statuses.values():
+            counts[status] = counts.get(status, 0) + 1
+        print(f"  accepted : {len(tickets)}/{args.posts} in {accept_elapsed:.2f}s "
+              f"({len(tickets) / accept_elapsed:.0f} posts/s)")
+        print(f"  latency  : p50 {_percentile(latencies, 0.5) * 1000:.1f} ms, "
+              f"p95 {_percentile(latencies, 0.95) * 1000:.1f} ms, max {max(latencies) * 1000:.1f} ms")
+        print(f"  processed: all tickets done after {drain_elapsed:.2f}s {counts}")
+        if args.commit_delay is not None:
+            print(f"  commits  : {server.commit_coalescer.commits}")
+        os.chdir(Path(__file__).resolve().parent)
+        return 0 if len(tickets) == args.posts and set(counts) <= {"saved", "partial"} else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
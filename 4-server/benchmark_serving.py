@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Throughput comparison of the development server and the gunicorn setup.
+
+Each server runs as a subprocess in its own throwaway repo-shaped tree and gets
+the same burst of POST /api/computer-data requests from concurrent clients;
+requests per second and p50/p99 latency are reported. The server is then
+stopped with SIGTERM, and the shutdown time and the submissions left
+unprocessed in its queue are reported (0 means the queue was drained).
+
+Usage:
+    python 4-server/benchmark_serving.py --requests 2000 --concurrency 64
+    python 4-server/benchmark_serving.py --modes gunicorn --gunicorn-workers 8
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+SERVER_DIR = Path(__file__).resolve().parent
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _payload(number: int, employees: int) -> bytes:
+    person = number % employees
+    return json.dumps({"computer_info": {
+        "Computername": f"EANY-{person:05d}",
+        "human_name": f"Load Test {person}",
+        "os": "Microsoft Windows 11 Enterprise",
+        "system_info": {"total_memory_bytes": 68719476736, "total_memory_formatted": "64.0 GB"},
+        "all_gpus": {"gpu_1": {"name": "NVIDIA RTX A4000", "driver": "31.0.15.3623", "priority": 3}},
+        "all_cpus": {"cpu_1": {"name": "Intel(R) Xeon(R) W-2123 CPU @ 3.60GHz", "cores": 4}},
+    }}).encode("utf-8")
+
+
+def _start(mode: str, root: Path, port: int, args) -> subprocess.Popen:
+    env = {key: value for key, value in os.environ.items() if key not in ("GITHUB_TOKEN", "GITHUB_ACTIONS")}
+    env.update(PORT=str(port), INGEST_QUEUE_PATH=str(root / ".cache" / "ingest_queue.sqlite3"),
+               SERVER_LOCK_DIR=str(root / ".cache" / "locks"))
+    if mode == "dev":
+        command = [sys.executable, str(SERVER_DIR / "server.py")]
+    else:
+        env.update(GUNICORN_BIND=f"127.0.0.1:{port}", GUNICORN_WORKERS=str(args.gunicorn_workers))
+        command = [sys.executable, "-m", "gunicorn", "-c", str(SERVER_DIR / "gunicorn.conf.py"),
+                   "--pythonpath", str(SERVER_DIR), "server:app"]
+    process = subprocess.Popen(command, cwd=root, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/api/health", timeout=1):
+                return process
+        except (urllib.error.URLError, ConnectionError):
+            if process.poll() is not None:
+                break
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError(f"{mode} server did not start")
+
+
+def _burst(port: int, requests: int, concurrency: int, employees: int) -> dict:
+    url = f"http://127.0.0.1:{port}/api/computer-data"
+    bodies = [_payload(number, employees) for number in range(requests)]
+
+    def post(body):
+        started = time.perf_counter()
+        req = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(req, timeout=60) as response:
+                response.read()
+                ok = response.status == 202
+        except (urllib.error.URLError, ConnectionError):
+            ok = False
+        return ok, time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(post, bodies))
+    elapsed = time.perf_counter() - started
+    latencies = sorted(latency for _, latency in results)
+    return {
+        "rps": len(results) / elapsed,
+        "p50": latencies[len(latencies) // 2],
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "errors": sum(1 for ok, _ in results if not ok),
+    }
+
+
+def _leftover(root: Path) -> tuple:
+    with sqlite3.connect(root / ".cache" / "ingest_queue.sqlite3") as connection:
+        counts = dict(connection.execute("SELECT status, COUNT(*) FROM submissions GROUP BY status").fetchall())
+    left = counts.get("queued", 0) + counts.get("processing", 0)
+    return left, sum(counts.values())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare the development server with gunicorn under load")
+    parser.add_argument("--requests", type=int, default=2000, help="Submissions to send per server")
+    parser.add_argument("--concurrency", type=int, default=64, help="Concurrent clients")
+    parser.add_argument("--employees", type=int, default=300, help="Distinct employees the posts are spread over")
+    parser.add_argument("--gunicorn-workers", type=int, default=4, help="gunicorn worker processes")
+    parser.add_argument("--modes", nargs="+", choices=["dev", "gunicorn"], default=["dev", "gunicorn"])
+    args = parser.parse_args()
+
+    print(f"{args.requests} posts from {args.concurrency} clients")
+    failed = False
+    for mode in args.modes:
+        with tempfile.TemporaryDirectory(prefix=f"serving_benchmark_{mode}_") as tmp:
+            root = Path(tmp)
+            (root / "docs" / "assets").mkdir(parents=True)
+            port = _free_port()
+            process = _start(mode, root, port, args)
+            try:
+                result = _burst(port, args.requests, args.concurrency, args.employees)
+            finally:
+                stopped = time.perf_counter()
+                process.send_signal(signal.SIGTERM)
+                try:
+                    process.wait(timeout=120)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+            shutdown = time.perf_counter() - stopped
+            left, total = _leftover(root)
+            label = mode if mode == "dev" else f"gunicorn x{args.gunicorn_workers}"
+            print(f"  {label:<12}: {result['rps']:7.0f} req/s, p50 {result['p50'] * 1000:6.1f} ms, "
+                  f"p99 {result['p99'] * 1000:6.1f} ms, {result['errors']} errors; "
+                  f"shutdown {shutdown:.1f}s with {left}/{total} submissions unprocessed")
+            failed = failed or result["errors"] > 0 or total != args.requests
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""
+Production serving settings for server.py (gunicorn).
+
+Run from the 4-server directory (the repository root is found from the working directory):
+    gunicorn -c gunicorn.conf.py server:app
+
+Every setting can be overridden with an environment variable:
+    GUNICORN_BIND             Address to listen on (default 0.0.0.0:$PORT, PORT defaults to 5000)
+    GUNICORN_WORKERS          Worker processes (default WEB_CONCURRENCY, else 2 per CPU up to 8)
+    GUNICORN_THREADS          Request threads per worker (default 8)
+    GUNICORN_TIMEOUT          Seconds before a silent worker is killed and replaced (default 30)
+    GUNICORN_GRACEFUL_TIMEOUT Seconds a stopping worker gets to finish (default 30)
+    GUNICORN_KEEPALIVE        Seconds to keep idle client connections open (default 5)
+
+Each worker process runs its own ingest worker pool and commit coalescer on the shared
+queue database (see server.py). On shutdown (SIGTERM, or SIGHUP/USR2 reloads) a worker
+stops accepting requests, keeps draining the queue for up to INGEST_DRAIN_SECONDS
+(default 20, keep it below the graceful timeout) and commits what it saved.
+"""
+
+import multiprocessing
+import os
+
+
+bind = os.environ.get('GUNICORN_BIND', f"0.0.0.0:{os.environ.get('PORT', '5000')}")
+workers = int(os.environ.get('GUNICORN_WORKERS') or os.environ.get('WEB_CONCURRENCY')
+              or min(2 * multiprocessing.cpu_count(), 8))
+# Threaded workers: requests are short, and the git push runs on a background thread anyway
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', '8'))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '30'))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', '30'))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', '5'))
+# Each worker imports the app itself, so no SQLite connection or thread crosses a fork
+preload_app = False
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG')
+errorlog = '-'
+
+
+def post_worker_init(worker):
+    # Pick up submissions left queued by a restart or by a worker that died
+    from server import ingest_workers
+    ingest_workers.start()
+
+
+def worker_exit(server, worker):
+    # Drain the queue and flush pending commits before the process goes away
+    from server import ingest_workers
+    ingest_workers.stop()
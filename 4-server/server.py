@@ -3,23 +3,56 @@
 Server Component for EmployeeData
 Handles POST requests from AboutMe app and merges computer data into employee data
 This server is designed to run on GitHub Actions and handle repository dispatch events
+
+In Flask server mode POST /api/computer-data only validates a submission, appends it to
+a durable queue (IngestQueue, SQLite) and answers 202 with a ticket id; a pool of worker
+threads writes the backup (deduplicated, see backup_store.py) and individual files
+(fsynced), and CommitCoalescer commits the saved files in batches instead of one git
+commit, fetch, rebase and push per submission.
+GET /api/computer-data/<ticket> reports the progress of a submission. A repository dispatch
+run handles a single submission and commits it directly.
+
+For production, serve `app` with several processes through gunicorn (see gunicorn.conf.py);
+file writes and git operations are coordinated between processes with file locks, and
+each worker drains the queue before it exits.
 """
 
+import atexit
+import copy
 import json
 import os
+import signal
+import sqlite3
+import subprocess
 import sys
+import tempfile
+import threading
 import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from flask import Flask, request, jsonify
 from difflib import SequenceMatcher
 
+from backup_store import BackupStore
+
+try:
+    import fcntl
+except ImportError:  # Windows: locks only cover the threads of one process
+    fcntl = None
+
 app = Flask(__name__)
 
 # Configuration
 GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN')
 REPO_OWNER = os.environ.get('REPO_OWNER', 'Ennead-Architects-LLP')
 REPO_NAME = os.environ.get('REPO_NAME', 'EmployeeData')
+# Submissions are saved locally right away and committed in batches: one commit every
+# COMMIT_INTERVAL_SECONDS, or as soon as COMMIT_BATCH_SIZE submissions are waiting
+COMMIT_INTERVAL_SECONDS = float(os.environ.get('COMMIT_INTERVAL_SECONDS', '30'))
+COMMIT_BATCH_SIZE = int(os.environ.get('COMMIT_BATCH_SIZE', '50'))
 
 def get_repository_root():
     """Smart function to get repository root for both local and GitHub environments"""
@@ -53,37 +86,206 @@ REPO_ROOT = get_repository_root()
 
 # Using individual JSON files only - direct updates to employee records
 
+# Deduplicated backups of every submission (see backup_store.py)
+COMPUTER_BACKUP_STORE_DIR = os.path.join(REPO_ROOT, 'docs', 'assets', 'computer_info_backup')
+# One file per submission, written before the backup store; still committed until migrated
 COMPUTER_BACKUP_DIR = os.path.join(REPO_ROOT, 'docs', 'assets', 'computer_info_data_backup')
 INDIVIDUAL_COMPUTER_DATA_DIR = os.path.join(REPO_ROOT, 'docs', 'assets', 'individual_computer_data')
+# Accepted submissions waiting for (or done with) processing; outside the committed data
+INGEST_QUEUE_PATH = os.environ.get('INGEST_QUEUE_PATH', os.path.join(REPO_ROOT, '.cache', 'ingest_queue.sqlite3'))
+INGEST_WORKERS = int(os.environ.get('INGEST_WORKERS', '4'))
+# Seconds a stopping worker pool keeps processing queued submissions before it exits
+INGEST_DRAIN_SECONDS = float(os.environ.get('INGEST_DRAIN_SECONDS', '20'))
+# Lock files shared by all server processes (kept out of the committed data directories)
+SERVER_LOCK_DIR = os.environ.get('SERVER_LOCK_DIR', os.path.join(REPO_ROOT, '.cache', 'locks'))
+# Held shared while a data file is written and exclusively while git stages or rebases
+DATA_LOCK_PATH = os.path.join(SERVER_LOCK_DIR, 'data.lock')
+# Held while one process runs git (commit, rebase, push)
+GIT_LOCK_PATH = os.path.join(SERVER_LOCK_DIR, 'git.lock')
+SERVER_PORT = int(os.environ.get('PORT', '5000'))
+# Individual computer data files kept parsed in memory (per process)
+COMPUTER_DATA_CACHE_SIZE = int(os.environ.get('COMPUTER_DATA_CACHE_SIZE', '256'))
+# In-process locks the employees are spread over (employees sharing one wait for each other)
+COMPUTER_DATA_LOCK_STRIPES = 64
+
+
+_thread_locks = {}
+_thread_locks_guard = threading.Lock()
+
+
+@contextmanager
+def file_lock(lock_path, shared=False):
+    """
+    Hold a lock identified by a lock file, across threads and processes.
+
+    Uses flock, so it is released if the holder dies. Without fcntl (Windows) a
+    per-path thread lock is used instead and shared locks are exclusive.
+
+    Args:
+        lock_path: Lock file (created if missing)
+        shared: Take a shared lock (several holders) instead of an exclusive one
+    """
+    if fcntl is None:
+        with _thread_locks_guard:
+            lock = _thread_locks.setdefault(lock_path, threading.Lock())
+        with lock:
+            yield
+        return
+    os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+    # Every acquisition opens its own descriptor, so threads of one process exclude each other too
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def data_file_lock(file_path):
+    """Lock one data file for a read-modify-write (and keep git from staging meanwhile)."""
+    with file_lock(DATA_LOCK_PATH, shared=True):
+        with file_lock(os.path.join(SERVER_LOCK_DIR, os.path.basename(file_path) + '.lock')):
+            yield
+
+
+def write_json_durable(file_path, data):
+    """Write JSON atomically and fsync it, so a saved submission survives a crash or power loss"""
+    directory = os.path.dirname(file_path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(file_path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    # Persist the rename itself (directory entry); not supported on Windows
+    if hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _file_signature(file_path):
+    # os.replace() gives every rewrite a new inode, so a rewrite by another process is always seen
+    stat = os.stat(file_path)
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+class ComputerDataStore:
+    """
+    Individual computer data files ({name}_computer_info.json, computers by name).
+
+    update() is a locked read-modify-write: submissions for different employees run in
+    parallel, while two for the same employee (say a laptop and a desktop) are applied
+    one after the other, so both computers end up in the file. Employees map to one of
+    a fixed set of striped thread locks; across processes the per-file lock of
+    data_file_lock applies. Files are replaced atomically and fsynced
+    (write_json_durable). Recently used files are kept parsed in an LRU cache and reused
+    while the file's inode, mtime and size are unchanged.
+    """
+
+    def __init__(self, directory=INDIVIDUAL_COMPUTER_DATA_DIR, cache_size=COMPUTER_DATA_CACHE_SIZE,
+                 stripes=COMPUTER_DATA_LOCK_STRIPES):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory of the individual computer data files
+            cache_size: Files kept parsed in memory (0 disables the cache)
+            stripes: Number of in-process locks shared out among employees
+        """
+        self.directory = directory
+        self.cache_size = cache_size
+        self._stripes = [threading.Lock() for _ in range(max(1, stripes))]
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def path_for(self, human_name):
+        """File holding an employee's computers."""
+        safe_name = human_name.replace(' ', '_').replace('/', '_').replace('\\', '_')
+        return os.path.join(self.directory, f"{safe_name}_computer_info.json")
+
+    def _stripe(self, file_path):
+        return self._stripes[hash(file_path) % len(self._stripes)]
+
+    def _load(self, file_path):
+        """Records in a file (a copy of the cached ones if it is unchanged); {} if missing or unreadable."""
+        try:
+            signature = _file_signature(file_path)
+        except FileNotFoundError:
+            return {}
+        with self._cache_lock:
+            cached = self._cache.get(file_path)
+            if cached is not None and cached[0] == signature:
+                self._cache.move_to_end(file_path)
+                self.cache_hits += 1
+                return dict(cached[1])
+            self.cache_misses += 1
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                records = json.load(f)
+        except Exception as e:
+            print(f"⚠️  Warning: Could not load existing computer data file: {e}")
+            return {}
+        if not isinstance(records, dict):
+            return {}
+        self._remember(file_path, signature, records)
+        return dict(records)
+
+    def _remember(self, file_path, signature, records):
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[file_path] = (signature, records)
+            self._cache.move_to_end(file_path)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def get(self, human_name):
+        """All computers recorded for an employee, by computer name ({} if none)."""
+        return copy.deepcopy(self._load(self.path_for(human_name)))
+
+    def update(self, human_name, computer_name, computer_info):
+        """
+        Add or replace one computer in an employee's file, keeping the other computers.
+
+        Returns:
+            str: Path of the file written
+        """
+        file_path = self.path_for(human_name)
+        os.makedirs(self.directory, exist_ok=True)
+        with self._stripe(file_path), data_file_lock(file_path):
+            # Top-level copy: the cached records are never modified in place
+            records = self._load(file_path)
+            records[computer_name] = computer_info
+            write_json_durable(file_path, records)
+            self._remember(file_path, _file_signature(file_path), records)
+        return file_path
+
+
+computer_data_store = ComputerDataStore()
+# Machine indexes are updated under the same locks as the individual files
+computer_backup_store = BackupStore(COMPUTER_BACKUP_STORE_DIR, lock=data_file_lock)
 
 
 def create_individual_computer_data_file(computer_data):
     """Create/update individual computer data JSON file for each employee"""
     try:
-        # Ensure directory exists
-        os.makedirs(INDIVIDUAL_COMPUTER_DATA_DIR, exist_ok=True)
-        
         # Get human name for filename
         human_name = computer_data.get('human_name', 'Unknown').strip()
         if not human_name or human_name == 'Unknown':
             print("❌ No human_name provided for individual computer data file")
             return False
         
-        # Create safe filename
-        safe_name = human_name.replace(' ', '_').replace('/', '_').replace('\\', '_')
-        filename = f"{safe_name}_computer_info.json"
-        file_path = os.path.join(INDIVIDUAL_COMPUTER_DATA_DIR, filename)
-        
-        # Load existing data if file exists
-        existing_data = {}
-        if os.path.exists(file_path):
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
-            except Exception as e:
-                print(f"⚠️  Warning: Could not load existing computer data file: {e}")
-                existing_data = {}
-        
         # Create computer info entry using ALL available data from ComputerInfo class
         computer_name = computer_data.get('Computername', computer_data.get('computer_name', 'Unknown'))
         
@@ -101,12 +303,8 @@ def create_individual_computer_data_file(computer_data):
         computer_info['processed_by_server'] = True
         computer_info['server_processing_timestamp'] = datetime.now().isoformat()
         
-        # Update or add computer info (dict of dicts format)
-        existing_data[computer_name] = computer_info
-        
-        # Save updated file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(existing_data, f, indent=2, ensure_ascii=False, default=str)
+        # Update or add computer info (dict of dicts format), keeping the employee's other computers
+        file_path = computer_data_store.update(human_name, computer_name, computer_info)
         
         print(f"✅ Individual computer data saved to {file_path}")
         return True
@@ -118,17 +316,6 @@ def create_individual_computer_data_file(computer_data):
 def backup_computer_data(computer_data):
     """Create a backup of computer data for archival purposes"""
     try:
-        # Ensure backup directory exists
-        os.makedirs(COMPUTER_BACKUP_DIR, exist_ok=True)
-        
-        # Generate filename with timestamp
-        # Create safe filename from computer name (handle both old and new field names)
-        computer_name = (computer_data.get('Computername', computer_data.get('computer_name', 'unknown'))
-                        .replace(' ', '_').replace('/', '_'))
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{computer_name}_{timestamp}.json"
-        file_path = os.path.join(COMPUTER_BACKUP_DIR, filename)
-        
         # Use ALL available data from ComputerInfo class (rich data structure)
         backup_data = computer_data.copy()
         
@@ -143,11 +330,12 @@ def backup_computer_data(computer_data):
         backup_data["backup_type"] = "full_computer_data"
         backup_data["structure_version"] = computer_data.get('payload_version', '1.0')
         
-        # Save backup file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(backup_data, f, indent=2, ensure_ascii=False, default=str)
-        
-        print(f"✅ Computer data backup saved to {file_path}")
+        # Stored once per distinct payload; a repeat of the machine's last submission writes nothing
+        blob_id, changed = computer_backup_store.put(backup_data)
+        if changed:
+            print(f"✅ Computer data backup saved to {computer_backup_store.blob_path(blob_id)}")
+        else:
+            print(f"✅ Computer data unchanged since the last backup ({blob_id[:12]})")
         return True
         
     except Exception as e:
@@ -155,8 +343,19 @@ def backup_computer_data(computer_data):
         return False
 
 
-def process_computer_data_workflow(computer_data):
-    """Unified workflow for processing computer data - handles backup, individual files, and GitHub commit"""
+def process_computer_data_workflow(computer_data, commit_now=True, ticket=None):
+    """
+    Unified workflow for processing computer data - handles backup, individual files, and GitHub commit
+
+    Args:
+        computer_data: Extracted computer data of one submission
+        commit_now: Commit and push before returning (one-shot runs); otherwise the
+            submission is handed to the commit coalescer and committed with its batch
+        ticket: Ingest queue ticket of the submission, marked committed with its batch
+
+    Returns:
+        (success_count, total_operations)
+    """
     success_count = 0
     total_operations = 3  # backup, individual file, commit
     
@@ -181,8 +380,15 @@ def process_computer_data_workflow(computer_data):
     else:
         print("⚠️  Warning: Individual computer data file creation failed, but continuing with other operations")
     
+    if not commit_now:
+        # The local files are durable now; the coalescer commits them with the rest of its batch
+        if commit_coalescer.submit(summary['human_name'], ticket):
+            success_count += 1
+            print("✅ Changes queued for the next batched GitHub commit")
+        else:
+            print("⚠️  Warning: GitHub commits are not configured, data was saved locally")
     # Commit to GitHub (if configured)
-    if commit_to_github(computer_data):
+    elif commit_to_github([summary['human_name']]):
         success_count += 1
         print("✅ Changes committed to GitHub successfully")
     else:
@@ -190,15 +396,27 @@ def process_computer_data_workflow(computer_data):
     
     return success_count, total_operations
 
-def commit_to_github(computer_data=None):
-    """Commit changes to GitHub repository using git commands"""
+def commit_to_github(human_names=None):
+    """
+    Commit pending computer data changes in one commit and push it
+
+    Args:
+        human_names: Employees whose submissions are included (for the commit message)
+
+    Returns:
+        bool: True once nothing is left to push
+    """
     if not GITHUB_TOKEN:
         print("⚠️  No GitHub token available for committing")
         return False
     
+    # Server processes share one working tree: one of them runs git at a time
+    with file_lock(GIT_LOCK_PATH):
+        return _commit_and_push(human_names)
+
+
+def _commit_and_push(human_names):
     try:
-        import subprocess
-        
         # Determine current branch (default to main)
         branch = os.environ.get('GITHUB_REF_NAME') or os.environ.get('GITHUB_HEAD_REF') or 'main'
         
@@ -206,19 +424,30 @@ def commit_to_github(computer_data=None):
         subprocess.run(['git', 'config', '--local', 'user.email', 'action@github.com'], check=True)
         subprocess.run(['git', 'config', '--local', 'user.name', 'GitHub Action'], check=True)
         
-        # Add changes
-        subprocess.run(['git', 'add', COMPUTER_BACKUP_DIR, INDIVIDUAL_COMPUTER_DATA_DIR], check=True)
+        # Stage and commit while no request is halfway through writing a file
+        with file_lock(DATA_LOCK_PATH):
+            data_dirs = [path for path in (COMPUTER_BACKUP_STORE_DIR, COMPUTER_BACKUP_DIR, INDIVIDUAL_COMPUTER_DATA_DIR)
+                         if os.path.exists(path)]
+            subprocess.run(['git', 'add', *data_dirs], check=True)
+            
+            # Check if there are changes to commit
+            result = subprocess.run(['git', 'diff', '--staged', '--quiet'], capture_output=True)
+            if result.returncode != 0:
+                names = sorted(set(human_names or [])) or ['Unknown']
+                if len(names) == 1:
+                    subject = names[0]
+                else:
+                    subject = f"{len(names)} employees ({', '.join(names[:5])}{', ...' if len(names) > 5 else ''})"
+                commit_message = f"$$$_Action_Computer_Data_Update: {subject} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                subprocess.run(['git', 'commit', '-m', commit_message], check=True)
         
-        # Check if there are changes to commit
-        result = subprocess.run(['git', 'diff', '--staged', '--quiet'], capture_output=True)
         if result.returncode == 0:
-            print("📝 No changes to commit")
-            return True
-        
-        # Commit changes
-        human_name = computer_data.get('human_name', 'Unknown') if computer_data else 'Unknown'
-        commit_message = f"$$$_Action_Computer_Data_Update: {human_name} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        subprocess.run(['git', 'commit', '-m', commit_message], check=True)
+            # A commit from an earlier batch may still be waiting for a successful push
+            ahead = subprocess.run(['git', 'rev-list', '--count', f'origin/{branch}..HEAD'],
+                                   capture_output=True, text=True)
+            if ahead.returncode != 0 or ahead.stdout.strip() == '0':
+                print("📝 No changes to commit")
+                return True
         
         # Push changes with rebase + retry to handle concurrent updates
         max_attempts = 3
@@ -226,7 +455,15 @@ def commit_to_github(computer_data=None):
             try:
                 # Fetch and rebase before pushing to minimize conflicts
                 subprocess.run(['git', 'fetch', 'origin', branch], check=True)
-                subprocess.run(['git', 'rebase', f'origin/{branch}'], check=True)
+                # The rebase rewrites the working tree, so no submission may be saved meanwhile;
+                # files saved since the commit are stashed and restored around it
+                with file_lock(DATA_LOCK_PATH):
+                    try:
+                        subprocess.run(['git', 'rebase', '--autostash', f'origin/{branch}'], check=True)
+                    except subprocess.CalledProcessError:
+                        # Don't leave the working tree mid-rebase for the next attempt or batch
+                        subprocess.run(['git', 'rebase', '--abort'], check=False)
+                        raise
                 subprocess.run(['git', 'push', 'origin', branch], check=True)
                 print("✅ Changes committed and pushed to GitHub")
                 return True
@@ -247,6 +484,366 @@ def commit_to_github(computer_data=None):
         print(f"❌ Error committing to GitHub: {e}")
         return False
 
+
+class CommitCoalescer:
+    """
+    Batches git commits of saved submissions.
+
+    submit() only records that a submission was saved; a background thread commits
+    everything pending in one commit (see commit_to_github) every interval seconds,
+    or as soon as batch_size submissions are waiting. Failed batches stay pending
+    and are retried with the next one.
+    """
+
+    def __init__(self, interval=COMMIT_INTERVAL_SECONDS, batch_size=COMMIT_BATCH_SIZE, commit_func=commit_to_github,
+                 on_commit=None):
+        """
+        Initialize the coalescer (the flusher thread starts with the first submission).
+
+        Args:
+            interval: Seconds between flushes while submissions are pending
+            batch_size: Pending submissions that trigger an immediate flush
+            commit_func: Called with the pending human names; returns True on success
+            on_commit: Called with the ingest tickets of each committed batch
+        """
+        self.interval = interval
+        self.batch_size = max(1, batch_size)
+        self.commit_func = commit_func
+        self.on_commit = on_commit
+        self._pending = []
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+        self._stopping = False
+        self.commits = 0
+
+    @property
+    def pending_count(self):
+        with self._condition:
+            return len(self._pending)
+
+    def submit(self, human_name, ticket=None):
+        """Queue a saved submission for the next commit; False if commits are not configured."""
+        if not GITHUB_TOKEN and self.commit_func is commit_to_github:
+            return False
+        with self._condition:
+            self._pending.append((human_name, ticket))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='commit-coalescer', daemon=True)
+                self._thread.start()
+                atexit.register(self.stop)
+            self._condition.notify()
+        return True
+
+    def flush(self):
+        """Commit everything pending now; returns False if the commit failed (it stays pending)."""
+        with self._flush_lock:
+            with self._condition:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return True
+            print(f"📦 Committing {len(batch)} batched computer data submission(s)")
+            if self.commit_func([human_name for human_name, _ in batch]):
+                self.commits += 1
+                tickets = [ticket for _, ticket in batch if ticket]
+                if tickets and self.on_commit:
+                    self.on_commit(tickets)
+                return True
+            with self._condition:
+                # Keep the names for the next attempt (their files are committed by it anyway)
+                self._pending[:0] = batch
+            return False
+
+    def _run(self):
+        while True:
+            with self._condition:
+                # Sleep until something is pending, then give the batch up to interval to fill
+                while not self._pending and not self._stopping:
+                    self._condition.wait()
+                deadline = time.monotonic() + self.interval
+                while not self._stopping and len(self._pending) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if self._stopping:
+                    return
+            self.flush()
+
+    def stop(self):
+        """Stop the flusher thread and commit whatever is still pending (safe to call again)."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+
+commit_coalescer = CommitCoalescer(on_commit=lambda tickets: ingest_queue.mark_committed(tickets))
+
+
+def _process_running(pid):
+    """Whether a process that claimed a submission still runs (never the current one: it just connected)."""
+    if not pid or pid == os.getpid() or os.name == 'nt':
+        # On Windows os.kill() would terminate the process; there is one server process there anyway
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class IngestQueue:
+    """
+    Durable queue of accepted computer data submissions.
+
+    Rows live in a SQLite database (WAL, synchronous=FULL, so an accepted submission
+    survives a crash). A submission moves from queued to processing to saved (both
+    files written), partial or failed, and records when the batch holding it was
+    committed. Submissions of the same employee are handed out one at a time and in
+    order, so the latest one is written last. Several server processes can share the
+    database; each claim records the claiming process, and claims of processes that
+    are gone (restart, crashed worker) are queued again.
+    """
+
+    def __init__(self, path=INGEST_QUEUE_PATH):
+        """
+        Initialize the queue (the database is opened on first use).
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        # Guards the connection within a process; writers of all processes also take the
+        # file lock, which wakes a waiting writer right away (SQLite's busy handler sleeps)
+        self._lock = threading.Lock()
+        self._write_lock_path = os.path.abspath(path) + '.lock'
+        self._connection = None
+        self._pid = None
+
+    def _connect(self):
+        # SQLite connections must not be used across fork(), so every process opens its own
+        if self._connection is None or self._pid != os.getpid():
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            # Autocommit mode: every statement outside BEGIN is its own (fsynced) transaction
+            connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=30)
+            connection.row_factory = sqlite3.Row
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=FULL')
+            connection.execute('''
+                CREATE TABLE IF NOT EXISTS submissions (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    ticket TEXT NOT NULL UNIQUE,
+                    status TEXT NOT NULL,
+                    human_name TEXT NOT NULL,
+                    computer_name TEXT,
+                    payload TEXT,
+                    operations_completed TEXT,
+                    error TEXT,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    committed_at TEXT,
+                    claimed_by INTEGER
+                )''')
+            columns = {row['name'] for row in connection.execute('PRAGMA table_info(submissions)')}
+            if 'claimed_by' not in columns:
+                connection.execute('ALTER TABLE submissions ADD COLUMN claimed_by INTEGER')
+            connection.execute('CREATE INDEX IF NOT EXISTS submissions_status ON submissions (status, seq)')
+            self._requeue_interrupted(connection)
+            self._connection, self._pid = connection, os.getpid()
+        return self._connection
+
+    @staticmethod
+    def _requeue_interrupted(connection):
+        """Queue again the submissions claimed by processes that no longer run (the writes are idempotent)."""
+        claimants = [row[0] for row in connection.execute(
+            "SELECT DISTINCT claimed_by FROM submissions WHERE status = 'processing'")]
+        gone = [pid for pid in claimants if not _process_running(pid)]
+        connection.executemany(
+            "UPDATE submissions SET status = 'queued', claimed_by = NULL WHERE status = 'processing' AND claimed_by IS ?",
+            [(pid,) for pid in gone])
+
+    def enqueue(self, computer_data):
+        """Store a validated submission and return its ticket id."""
+        ticket = uuid.uuid4().hex
+        now = datetime.now().isoformat()
+        summary = get_computer_summary(computer_data)
+        payload = json.dumps(computer_data, ensure_ascii=False, default=str)
+        with self._lock, file_lock(self._write_lock_path):
+            self._connect().execute(
+                'INSERT INTO submissions (ticket, status, human_name, computer_name, payload, created_at, updated_at) '
+                "VALUES (?, 'queued', ?, ?, ?, ?, ?)",
+                (ticket, summary['human_name'], summary['computer_name'], payload, now, now))
+        return ticket
+
+    def claim(self):
+        """
+        Take the oldest submission that can be processed now.
+
+        Returns:
+            (ticket, computer_data), or None if nothing is waiting
+        """
+        with self._lock, file_lock(self._write_lock_path):
+            connection = self._connect()
+            # IMMEDIATE takes the write lock up front, so two processes can't claim the same row
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                row = connection.execute(
+                    "SELECT ticket, payload FROM submissions WHERE status = 'queued' AND human_name NOT IN "
+                    "(SELECT human_name FROM submissions WHERE status = 'processing') ORDER BY seq LIMIT 1"
+                ).fetchone()
+                if row is not None:
+                    connection.execute(
+                        "UPDATE submissions SET status = 'processing', claimed_by = ?, updated_at = ? WHERE ticket = ?",
+                        (os.getpid(), datetime.now().isoformat(), row['ticket']))
+                connection.execute('COMMIT')
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+        if row is None:
+            return None
+        return row['ticket'], json.loads(row['payload'])
+
+    def finish(self, ticket, status, operations_completed=None, error=None):
+        """Record the outcome of a claimed submission (its payload is no longer needed)."""
+        with self._lock, file_lock(self._write_lock_path):
+            self._connect().execute(
+                'UPDATE submissions SET status = ?, operations_completed = ?, error = ?, payload = NULL, '
+                'updated_at = ? WHERE ticket = ?',
+                (status, operations_completed, error, datetime.now().isoformat(), ticket))
+
+    def mark_committed(self, tickets):
+        """Record that the submissions' files were committed and pushed."""
+        now = datetime.now().isoformat()
+        with self._lock, file_lock(self._write_lock_path):
+            self._connect().executemany('UPDATE submissions SET committed_at = ? WHERE ticket = ?',
+                                        [(now, ticket) for ticket in tickets])
+
+    def get(self, ticket):
+        """Status of a submission as a dict, or None for an unknown ticket."""
+        with self._lock:
+            row = self._connect().execute(
+                'SELECT ticket, status, human_name, computer_name, operations_completed, error, created_at, '
+                'updated_at, committed_at FROM submissions WHERE ticket = ?', (ticket,)).fetchone()
+        if row is None:
+            return None
+        status = dict(row)
+        status['committed'] = status['committed_at'] is not None
+        return status
+
+    def depth(self):
+        """Number of submissions queued or being processed."""
+        with self._lock:
+            return self._connect().execute(
+                "SELECT COUNT(*) FROM submissions WHERE status IN ('queued', 'processing')").fetchone()[0]
+
+
+class IngestWorkerPool:
+    """
+    Threads that drain the ingest queue through process_computer_data_workflow.
+    """
+
+    def __init__(self, queue, workers=INGEST_WORKERS):
+        """
+        Initialize the pool (threads start with start()).
+
+        Args:
+            queue: IngestQueue to drain
+            workers: Number of worker threads
+        """
+        self.queue = queue
+        self.workers = max(1, workers)
+        self._condition = threading.Condition()
+        # Bumped on every notify() so a worker that found nothing doesn't miss a new submission
+        self._generation = 0
+        self._threads = []
+        self._stopping = False
+        self._drain_deadline = 0.0
+
+    def start(self):
+        """Start the worker threads (no-op if running)."""
+        with self._condition:
+            if self._threads:
+                return
+            self._stopping = False
+            for number in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f'ingest-worker-{number + 1}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        atexit.register(self.stop)
+
+    def notify(self):
+        """Wake idle workers (a submission was queued or an employee's next one became available)."""
+        with self._condition:
+            self._generation += 1
+            self._condition.notify_all()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if self._stopping and time.monotonic() >= self._drain_deadline:
+                    return
+                generation = self._generation
+            try:
+                claimed = self.queue.claim()
+            except Exception as e:
+                print(f"❌ Error reading the ingest queue: {e}")
+                claimed = None
+            if claimed is None:
+                with self._condition:
+                    while generation == self._generation and not self._stopping:
+                        self._condition.wait()
+                    if self._stopping:
+                        # Drained (or the rest waits for another worker's employee)
+                        return
+                continue
+            self._process(*claimed)
+            self.notify()
+
+    def _process(self, ticket, computer_data):
+        try:
+            success_count, total_operations = process_computer_data_workflow(computer_data, commit_now=False,
+                                                                             ticket=ticket)
+            if success_count == total_operations:
+                status = 'saved'
+            elif success_count > 0:
+                status = 'partial'
+            else:
+                status = 'failed'
+            self.queue.finish(ticket, status, f'{success_count}/{total_operations}')
+        except Exception as e:
+            print(f"❌ Error processing queued submission {ticket}: {e}")
+            try:
+                self.queue.finish(ticket, 'failed', error=str(e))
+            except Exception as finish_error:
+                print(f"❌ Could not record the failure of {ticket}: {finish_error}")
+
+    def stop(self, drain_seconds=INGEST_DRAIN_SECONDS):
+        """
+        Stop the workers, then commit what they saved.
+
+        Args:
+            drain_seconds: Keep processing queued submissions for up to this long first;
+                whatever is left stays queued for the next start
+        """
+        with self._condition:
+            if not self._stopping:
+                self._drain_deadline = time.monotonic() + drain_seconds
+            self._stopping = True
+            self._condition.notify_all()
+            threads, self._threads = self._threads, []
+        for thread in threads:
+            thread.join()
+        commit_coalescer.stop()
+
+
+ingest_queue = IngestQueue()
+ingest_workers = IngestWorkerPool(ingest_queue)
+
 def flatten_nested_structure(computer_data):
     """Flatten nested structure for backward compatibility with existing processing"""
     
@@ -372,12 +969,12 @@ def extract_computer_data_from_request(data):
 
 @app.route('/api/computer-data', methods=['POST'])
 def handle_computer_data():
-    """Handle POST request from AboutMe app"""
+    """Handle POST request from AboutMe app: validate and queue the submission (processed in the background)"""
     try:
         # Get JSON data from request
-        data = request.get_json()
+        data = request.get_json(silent=True)
         
-        if not data:
+        if not data or not isinstance(data, dict):
             return jsonify({'error': 'No data provided'}), 400
         
         # Extract computer data using unified function
@@ -387,51 +984,47 @@ def handle_computer_data():
             # Handle backward compatibility deadline errors
             return jsonify({'error': str(e)}), 400
         
-        if not computer_data:
+        if not computer_data or not isinstance(computer_data, dict):
             return jsonify({'error': 'No computer data provided'}), 400
         
+        human_name = computer_data.get('human_name')
+        if not isinstance(human_name, str) or not human_name.strip() or human_name.strip() == 'Unknown':
+            return jsonify({'error': 'No human_name provided'}), 400
+        
         # Log received data structure for debugging with enhanced summary
         summary = get_computer_summary(computer_data)
         print(f"📥 Received computer data for: {summary['human_name']} ({summary['computer_name']})")
-        print(f"   Hardware: {summary['cpu_name']} + {summary['gpu_name']}")
-        print(f"   Memory: {summary['memory']}")
         print(f"   Payload Version: {computer_data.get('payload_version', 'Unknown')}")
-        print(f"   Data Source: {computer_data.get('data_source', 'Unknown')}")
-        
-        # Log structured data counts
-        if 'all_gpus' in computer_data:
-            print(f"   GPUs: {len(computer_data['all_gpus'])} found")
-        if 'all_cpus' in computer_data:
-            print(f"   CPUs: {len(computer_data['all_cpus'])} found")
-        if 'system_info' in computer_data:
-            print(f"   System Info: Available")
-        
         print(f"📊 Total fields: {len(computer_data)}")
         
-        # Process computer data using unified workflow
-        success_count, total_operations = process_computer_data_workflow(computer_data)
-        
-        # Determine response based on success rate
-        if success_count == total_operations:
-            message = 'Computer data processed successfully'
-            status_code = 200
-        elif success_count > 0:
-            message = f'Computer data partially processed ({success_count}/{total_operations} operations succeeded)'
-            status_code = 200
-        else:
-            message = 'Computer data processing failed'
-            status_code = 500
+        # Durable before the response; the worker pool writes the files and queues the commit
+        ticket = ingest_queue.enqueue(computer_data)
+        ingest_workers.start()
+        ingest_workers.notify()
         
         return jsonify({
-            'success': success_count > 0,
-            'message': message,
-            'operations_completed': f'{success_count}/{total_operations}',
-            'updated_employees': 1 if success_count > 0 else 0
-        }), status_code
+            'success': True,
+            'message': 'Computer data queued for processing',
+            'ticket': ticket,
+            'status_url': f'/api/computer-data/{ticket}',
+            'queued_submissions': ingest_queue.depth()
+        }), 202
         
     except Exception as e:
-        print(f"❌ Error processing computer data: {e}")
+        print(f"❌ Error queueing computer data: {e}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/computer-data/<ticket>', methods=['GET'])
+def computer_data_status(ticket):
+    """Progress of a queued submission: queued, processing, saved, partial or failed (plus committed)"""
+    try:
+        submission = ingest_queue.get(ticket)
+    except Exception as e:
+        print(f"❌ Error reading submission status: {e}")
         return jsonify({'error': str(e)}), 500
+    if submission is None:
+        return jsonify({'error': 'Unknown ticket'}), 404
+    return jsonify(submission), 200
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
@@ -439,7 +1032,9 @@ def health_check():
     return jsonify({
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
-        'version': '1.0.0'
+        'version': '1.0.0',
+        'queued_submissions': ingest_queue.depth(),
+        'pending_commits': commit_coalescer.pending_count
     }), 200
 
 @app.route('/', methods=['GET'])
@@ -449,7 +1044,8 @@ def index():
         'message': 'EmployeeData Server',
         'version': '1.0.0',
         'endpoints': {
-            'POST /api/computer-data': 'Submit computer data from AboutMe app',
+            'POST /api/computer-data': 'Submit computer data from AboutMe app (202 + ticket)',
+            'GET /api/computer-data/<ticket>': 'Processing status of a submission',
             'GET /api/health': 'Health check'
         }
     }), 200
@@ -515,8 +1111,8 @@ def main():
     print(f"📁 Repository root: {REPO_ROOT}")
     print(f"📁 Individual employees computer data dir: {INDIVIDUAL_COMPUTER_DATA_DIR}")
     print(f"📁 Individual employees computer data exists: {os.path.exists(INDIVIDUAL_COMPUTER_DATA_DIR)}")
-    print(f"📁 Computer backup dir: {COMPUTER_BACKUP_DIR}")
-    print(f"📁 Computer backup exists: {os.path.exists(COMPUTER_BACKUP_DIR)}")
+    print(f"📁 Computer backup store: {COMPUTER_BACKUP_STORE_DIR}")
+    print(f"📁 Computer backup store exists: {os.path.exists(COMPUTER_BACKUP_STORE_DIR)}")
     
     # Environment detection
     if os.environ.get('GITHUB_ACTIONS'):
@@ -542,8 +1138,10 @@ def main():
         print("⚠️  Warning: No GitHub token configured")
     
     print(f"👥 Individual computer data directory: {INDIVIDUAL_COMPUTER_DATA_DIR}")
-    print(f"💾 Computer backup directory: {COMPUTER_BACKUP_DIR}")
-    print(f"🌐 Server starting on port 5000")
+    print(f"💾 Computer backup store: {COMPUTER_BACKUP_STORE_DIR}")
+    print(f"🌐 Server starting on port {SERVER_PORT} (development server; use gunicorn.conf.py in production)")
+    print(f"📦 Commits batched every {COMMIT_INTERVAL_SECONDS:g}s or {COMMIT_BATCH_SIZE} submissions")
+    print(f"📬 Ingest queue: {INGEST_QUEUE_PATH} ({INGEST_WORKERS} workers)")
     
     # Check backward compatibility deadline
     from datetime import date
@@ -558,8 +1156,11 @@ def main():
         print(f"✅ Backward compatibility has expired ({COMPATIBILITY_DEADLINE})")
         print("   Only new ComputerInfo payload structures are accepted")
     
-    # Start Flask server
-    app.run(host='0.0.0.0', port=5000, debug=False)
+    # Drain submissions accepted before a restart, then start Flask server
+    ingest_workers.start()
+    # Stop on SIGTERM like on Ctrl+C, so the atexit handlers drain the queue and commit
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    app.run(host='0.0.0.0', port=SERVER_PORT, debug=False, threaded=True)
 
 if __name__ == "__main__":
     main()
@@ -17,9 +17,15 @@ Output: composite_employees.json
 import pandas as pd
 import json
 import re
+import sys
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Any, Optional
-from fuzzywuzzy import fuzz, process
+
+# The name matching engine is shared with .github/scripts/merge_all_data_for_website.py
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / ".github" / "scripts"))
+from name_matcher import NameMatcher, name_similarity, nickname_match
 
 class ExcelToJsonMerger:
     def __init__(self):
@@ -36,6 +42,9 @@ class ExcelToJsonMerger:
             'tech_data_lost': 0,
             'employee_data_lost': 0
         }
+        # Names in employee_data (blocked fuzzy lookups) and computer usernames -> employee name
+        self.name_matcher = NameMatcher(threshold=0.75, cache_path=REPO_ROOT / ".cache" / "name_match_cache.json")
+        self.usernames = {}
         
     def normalize_name(self, name: str, source: str = "unknown") -> str:
         """Normalize names for consistent matching"""
@@ -118,16 +127,8 @@ class ExcelToJsonMerger:
             
             # Try to find matching employee in existing base
             found_match = False
-            best_match = None
-            best_score = 0
-            
-            for emp_name, emp_data in self.employee_data.items():
-                if self.names_match(full_name, emp_name, threshold=75):
-                    # Calculate match score for ranking
-                    score = fuzz.token_sort_ratio(full_name, emp_name)
-                    if score > best_score:
-                        best_score = score
-                        best_match = emp_name
+            best_match, score = self.name_matcher.match(full_name)
+            best_score = round(score * 100)
             
             if best_match:
                 # Update existing employee with basic info
@@ -163,6 +164,7 @@ class ExcelToJsonMerger:
                     'title': "",
                     'office_location': ""
                 }
+                self.name_matcher.add(full_name)
                 new_count += 1
                 # Track as unmatched from tech list
                 self.unmatched_records['tech_records'].append({
@@ -224,34 +226,22 @@ class ExcelToJsonMerger:
                 'date': row['Date'].isoformat() if not pd.isna(row['Date']) else ""
             }
             
-            # Try to find matching employee in existing base
+            # Try to find matching employee in existing base (name_to_use could be Name or Username)
             found_match = False
-            best_match = None
-            best_score = 0
+            best_match, score = self.name_matcher.match(name_to_use)
+            best_score = round(score * 100) if best_match else 0
             
-            for emp_name, emp_data in self.employee_data.items():
-                # Try matching with the name we're using (could be Name or Username)
-                if self.names_match(name_to_use, emp_name, threshold=75):
-                    # Calculate match score for ranking
-                    score = fuzz.token_sort_ratio(name_to_use, emp_name)
-                    if score > best_score:
-                        best_score = score
-                        best_match = emp_name
-                
-                # If we're using a username, also try matching against employee usernames
-                if name_source == 'Username':
-                    # Check if any employee has this username in their computer specs
-                    for comp in emp_data.get('computers', []):
-                        if comp.get('username', '').lower() == name_to_use.lower():
-                            score = 100  # Exact username match
-                            if score > best_score:
-                                best_score = score
-                                best_match = emp_name
-                                break
+            # If we're using a username, an employee with a computer under that username is an exact match
+            if name_source == 'Username':
+                owner = self.usernames.get(name_to_use.lower())
+                if owner and best_score < 100:
+                    best_match, best_score = owner, 100
             
             if best_match:
                 # Add computer to existing employee
                 self.employee_data[best_match]['computers'].append(computer_spec)
+                if computer_spec['username']:
+                    self.usernames.setdefault(computer_spec['username'].lower(), best_match)
                 found_match = True
                 matched_count += 1
                 
@@ -279,6 +269,9 @@ class ExcelToJsonMerger:
                     'title': "",
                     'office_location': ""
                 }
+                self.name_matcher.add(name_to_use)
+                if computer_spec['username']:
+                    self.usernames.setdefault(computer_spec['username'].lower(), name_to_use)
                 new_count += 1
                 # Track as unmatched from base
                 self.unmatched_records['gpu_records'].append({
@@ -326,6 +319,7 @@ class ExcelToJsonMerger:
                 'title': title,
                 'office_location': office_location
             }
+            self.name_matcher.add(normalized_name)
         
         print(f"Created base dataset with {tech_count} employees from Master Technology List")
     
@@ -341,94 +335,19 @@ class ExcelToJsonMerger:
         if not n1 or not n2:
             return False
         
-        # Exact match
-        if n1.lower() == n2.lower():
-            return True
-        
-        # Use fuzzywuzzy for better matching
-        # Try different matching strategies
-        ratios = [
-            fuzz.ratio(n1, n2),
-            fuzz.partial_ratio(n1, n2),
-            fuzz.token_sort_ratio(n1, n2),
-            fuzz.token_set_ratio(n1, n2)
-        ]
-        
-        # Use the best ratio
-        best_ratio = max(ratios)
-        
-        # Also check if one name is contained in the other (for nicknames)
-        if n1.lower() in n2.lower() or n2.lower() in n1.lower():
-            return True
-        
-        # Check for common nickname patterns
-        if self.check_nickname_match(n1, n2):
-            return True
-        
-        return best_ratio >= threshold
+        # Handles exact matches, nicknames, middle names and name order (see name_matcher)
+        return name_similarity(n1, n2) * 100 >= threshold
     
     def check_nickname_match(self, name1: str, name2: str) -> bool:
         """Check for common nickname patterns"""
-        # Common nickname mappings
-        nicknames = {
-            'robert': ['bob', 'rob', 'bobby'],
-            'richard': ['rick', 'dick', 'rich'],
-            'william': ['will', 'bill', 'billy'],
-            'michael': ['mike', 'mick'],
-            'david': ['dave', 'davey'],
-            'christopher': ['chris', 'christy'],
-            'daniel': ['dan', 'danny'],
-            'matthew': ['matt', 'matty'],
-            'anthony': ['tony', 'ant'],
-            'andrew': ['andy', 'drew'],
-            'joseph': ['joe', 'joey'],
-            'james': ['jim', 'jimmy', 'jamie'],
-            'charles': ['charlie', 'chuck'],
-            'thomas': ['tom', 'tommy'],
-            'alexander': ['alex', 'al'],
-            'benjamin': ['ben', 'benny'],
-            'samuel': ['sam', 'sammy'],
-            'jonathan': ['jon', 'johnny'],
-            'nicholas': ['nick', 'nicky'],
-            'timothy': ['tim', 'timmy'],
-            'jennifer': ['jen', 'jenny'],
-            'elizabeth': ['liz', 'beth', 'betty'],
-            'patricia': ['pat', 'patty', 'tricia'],
-            'jessica': ['jess', 'jessie'],
-            'sarah': ['sally', 'sara'],
-            'michelle': ['mich', 'shell'],
-            'stephanie': ['steph', 'stephie'],
-            'katherine': ['kate', 'katie', 'kat'],
-            'christina': ['chris', 'christy'],
-            'amanda': ['mandy', 'mandi']
-        }
-        
-        # Normalize names for comparison
-        n1_parts = name1.lower().split()
-        n2_parts = name2.lower().split()
-        
-        # Check if any part of name1 matches a nickname of any part of name2
-        for part1 in n1_parts:
-            for part2 in n2_parts:
-                if part1 in nicknames and part2 in nicknames[part1]:
-                    return True
-                if part2 in nicknames and part1 in nicknames[part2]:
-                    return True
-        
-        return False
+        return nickname_match(name1, name2)
     
     def find_best_match(self, target_name: str, candidate_names: List[str], threshold: int = 80) -> Optional[str]:
         """Find the best matching name from a list of candidates"""
         if not target_name or not candidate_names:
             return None
         
-        # Use fuzzywuzzy's process.extractOne for best match
-        result = process.extractOne(target_name, candidate_names, scorer=fuzz.token_sort_ratio)
-        
-        if result and result[1] >= threshold:
-            return result[0]
-        
-        return None
+        return NameMatcher(candidate_names, threshold=threshold / 100).best_match(target_name)
     
     def generate_summary(self) -> Dict[str, Any]:
         """Generate summary statistics with data quality alerts"""
@@ -519,7 +438,7 @@ class ExcelToJsonMerger:
             'mismatch_alerts': self.mismatch_alerts[:20],  # Show first 20 for debugging
             'invalid_names': self.invalid_names[:20],  # Show first 20 for debugging
             'alerts': alerts,
-            'matching_algorithm': 'Enhanced fuzzy matching with nickname support',
+            'matching_algorithm': 'Blocked fuzzy matching with nickname support (name_matcher)',
             'generation_timestamp': datetime.now().isoformat()
         }
     
@@ -553,6 +472,7 @@ class ExcelToJsonMerger:
         
         # Save composite JSON
         self.save_json(output_file)
+        self.name_matcher.save_cache()
         
         # Print summary with alerts
         summary = self.generate_summary()
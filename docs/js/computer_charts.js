@@ -1,19 +1,26 @@
 // Load employees and build charts of computer specs
 (async function () {
     try {
-        const url = (function buildEmployeesUrl() {
+        const assetUrl = (function buildAssetUrl() {
             const { protocol, hostname, pathname } = window.location;
-            if (protocol === 'file:') return 'assets/employees.json';
+            if (protocol === 'file:') return path => path;
             if (hostname.includes('github.io')) {
                 const parts = pathname.split('/').filter(Boolean);
                 const repo = parts[0] || 'EmployeeData';
-                return `/${repo}/assets/employees.json`;
+                return path => `/${repo}/${path}`;
             }
-            return 'assets/employees.json';
+            return path => path;
         })();
 
-        const res = await fetch(url, { cache: 'no-store' });
-        const data = await res.json();
+        // Minified, content-hashed copy from the site data manifest; employees.json if not published
+        let data;
+        try {
+            const manifest = await (await fetch(assetUrl('assets/site_data/manifest.json'), { cache: 'no-store' })).json();
+            data = await (await fetch(assetUrl(`assets/site_data/${manifest.employees}`))).json();
+        } catch (e) {
+            const res = await fetch(assetUrl('assets/employees.json'), { cache: 'no-store' });
+            data = await res.json();
+        }
         const employees = Array.isArray(data) ? data : Object.values(data);
 
         const computers = [];
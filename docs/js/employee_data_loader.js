@@ -1,9 +1,19 @@
 // Individual Employee Data Loader
-// Loads employee data from individual JSON files instead of a big collected JSON
+// Loads the compact employee index from assets/site_data/ (see .github/scripts/site_data.py),
+// then each employee's detail shard when their card scrolls into view, and the full data only
+// when search or the project filter needs it. Falls back to the merged employees.json when the
+// site data is missing.
 
 // Global variables
 let allEmployees = [];
 let filteredEmployees = [];
+// manifest.json of assets/site_data/ (null when loaded from employees.json)
+let siteDataManifest = null;
+// detail shard path -> Promise of its employee record
+const employeeDetailRequests = new Map();
+// Promise of the full employee data (see ensureFullEmployeeData)
+let fullEmployeeDataRequest = null;
+let employeeCardObserver = null;
 // Computer data is now embedded in individual employee data
 
 // Determine the base path for assets (GitHub Pages vs local)
@@ -30,8 +40,8 @@ document.addEventListener('DOMContentLoaded', function() {
 
 async function initializeApp() {
     try {
-        // Only use merged employees.json; no fallbacks
-        const mergedLoaded = await tryLoadMergedEmployees();
+        // Compact index first; the merged employees.json only if the site data isn't published
+        const mergedLoaded = await tryLoadSiteDataIndex() || await tryLoadMergedEmployees();
         if (!mergedLoaded) {
             showError('Data not found');
             return;
@@ -68,6 +78,9 @@ async function initializeApp() {
         // Hide loading indicator
         document.getElementById('loadingIndicator').style.display = 'none';
 
+        // Bios, projects etc. for search and the project filter, once the user reaches for them
+        setupFullEmployeeDataTriggers();
+
     } catch (error) {
         console.error('Error initializing app:', error);
         showError('Data not found');
@@ -76,24 +89,152 @@ async function initializeApp() {
 
 // Deprecated: individual loading and fallbacks removed by policy
 
-async function tryLoadMergedEmployees() {
-    // Build URL that works for: GitHub Pages, local server, and IDE file preview
-    const url = (function buildEmployeesUrl() {
-        const { protocol, hostname, pathname } = window.location;
-        // If opened directly from filesystem (IDE preview without server)
-        if (protocol === 'file:') {
-            // Relative path from docs/index.html
-            return 'assets/employees.json';
+// Build URL that works for: GitHub Pages, local server, and IDE file preview
+function buildAssetUrl(assetPath) {
+    const { protocol, hostname, pathname } = window.location;
+    // If opened directly from filesystem (IDE preview without server)
+    if (protocol === 'file:') {
+        // Relative path from docs/index.html
+        return assetPath;
+    }
+    // GitHub Pages: https://<org>.github.io/<repo>/...
+    if (hostname.includes('github.io')) {
+        const parts = pathname.split('/').filter(Boolean);
+        const repo = parts[0] || 'EmployeeData';
+        return `/${repo}/${assetPath}`;
+    }
+    // Default: local http server serving from docs/
+    return assetPath;
+}
+
+async function fetchSiteDataFile(fileName) {
+    // Content-hashed file names never change content, so the browser cache can keep them
+    const response = await fetch(buildAssetUrl(`assets/site_data/${fileName}`), { signal: AbortSignal.timeout(10000) });
+    if (!response.ok) {
+        throw new Error(`${fileName}: ${response.status} ${response.statusText}`);
+    }
+    return response.json();
+}
+
+async function tryLoadSiteDataIndex() {
+    try {
+        const response = await fetch(buildAssetUrl('assets/site_data/manifest.json'), { cache: 'no-store', signal: AbortSignal.timeout(10000) });
+        if (!response.ok) {
+            console.warn(`Site data manifest not available: ${response.status} ${response.statusText}`);
+            return false;
+        }
+        const manifest = await response.json();
+        const index = await fetchSiteDataFile(manifest.index);
+        if (!Array.isArray(index.employees) || index.employees.length === 0) {
+            return false;
+        }
+        siteDataManifest = manifest;
+        allEmployees = index.employees.map(entry => ({ ...entry, detailsLoaded: false }));
+        filteredEmployees = [...allEmployees];
+        console.log(`Loaded ${allEmployees.length} employees from site data index ${manifest.index}`);
+        return true;
+    } catch (e) {
+        console.warn('Failed to load site data index:', e?.message || e);
+    }
+    return false;
+}
+
+// Fill in an index entry from its detail shard (shared request per shard)
+function loadEmployeeDetails(employee) {
+    if (!siteDataManifest || employee.detailsLoaded || !employee.detail) {
+        return Promise.resolve(employee);
+    }
+    if (!employeeDetailRequests.has(employee.detail)) {
+        employeeDetailRequests.set(employee.detail, fetchSiteDataFile(employee.detail));
+    }
+    return employeeDetailRequests.get(employee.detail).then(details => {
+        Object.assign(employee, details, { detailsLoaded: true });
+        return employee;
+    });
+}
+
+// Called by renderEmployees: cards rendered from the index are re-rendered with full details
+// once they come near the viewport
+function observeEmployeeCards(grid, employees) {
+    if (employeeCardObserver) {
+        employeeCardObserver.disconnect();
+    }
+    if (!siteDataManifest || typeof IntersectionObserver === 'undefined') {
+        return;
+    }
+    const cardEmployees = new Map();
+    employeeCardObserver = new IntersectionObserver(entries => {
+        entries.forEach(entry => {
+            if (!entry.isIntersecting) return;
+            const card = entry.target;
+            employeeCardObserver.unobserve(card);
+            loadEmployeeDetails(cardEmployees.get(card)).then(employee => {
+                if (!card.isConnected) return;
+                const holder = document.createElement('div');
+                holder.innerHTML = createEmployeeCard(employee);
+                const fullCard = holder.firstElementChild;
+                card.replaceWith(fullCard);
+                setupImageErrorHandling(fullCard);
+            }).catch(e => console.warn(`Failed to load details for ${cardEmployees.get(card)?.human_name}:`, e?.message || e));
+        });
+    }, { rootMargin: '600px 0px' });
+    Array.from(grid.children).forEach((card, i) => {
+        const employee = employees[i];
+        if (employee && !employee.detailsLoaded) {
+            cardEmployees.set(card, employee);
+            employeeCardObserver.observe(card);
         }
-        // GitHub Pages: https://<org>.github.io/<repo>/...
-        if (hostname.includes('github.io')) {
-            const parts = pathname.split('/').filter(Boolean);
-            const repo = parts[0] || 'EmployeeData';
-            return `/${repo}/assets/employees.json`;
+    });
+}
+
+// The full file is only needed to search bios/projects/education and to list project names
+function setupFullEmployeeDataTriggers() {
+    if (!siteDataManifest) return;
+    const searchInput = document.getElementById('searchInput');
+    if (searchInput) {
+        searchInput.addEventListener('focus', ensureFullEmployeeData);
+        searchInput.addEventListener('input', ensureFullEmployeeData);
+    }
+    const projectFilter = document.querySelector('.project-filter details');
+    if (projectFilter) {
+        projectFilter.addEventListener('toggle', () => {
+            if (projectFilter.open) ensureFullEmployeeData();
+        });
+    }
+}
+
+function ensureFullEmployeeData() {
+    if (!siteDataManifest) return Promise.resolve();
+    if (!fullEmployeeDataRequest) {
+        fullEmployeeDataRequest = loadAllEmployeeDetails().catch(e => {
+            console.warn('Failed to load full employee data:', e?.message || e);
+            // Let the next search or filter use try again
+            fullEmployeeDataRequest = null;
+        });
+    }
+    return fullEmployeeDataRequest;
+}
+
+async function loadAllEmployeeDetails() {
+    const data = await fetchSiteDataFile(siteDataManifest.employees);
+    allEmployees.forEach(employee => {
+        const details = data[employee.human_name];
+        if (details) {
+            Object.assign(employee, details, { detailsLoaded: true });
         }
-        // Default: local http server serving from docs/
-        return 'assets/employees.json';
-    })();
+    });
+    console.log(`Loaded full data for ${allEmployees.length} employees from ${siteDataManifest.employees}`);
+    window.dispatchEvent(new CustomEvent('EmployeeDetailsLoaded', { detail: { count: allEmployees.length } }));
+
+    // A search typed before the full data arrived only saw names, titles and offices
+    const searchInput = document.getElementById('searchInput');
+    if (searchInput && searchInput.value && typeof handleSearch === 'function') {
+        handleSearch();
+    }
+}
+
+async function tryLoadMergedEmployees() {
+    const url = buildAssetUrl('assets/employees.json');
     try {
         console.log('Trying merged employees file:', url);
         const response = await fetch(url, { cache: 'no-store', signal: AbortSignal.timeout(10000) });
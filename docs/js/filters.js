@@ -245,6 +245,10 @@ document.addEventListener('DOMContentLoaded', function() {
             applyFilters();
         }
     });
+    // Project names come with the full employee data when the page started from the site data index
+    window.addEventListener('EmployeeDetailsLoaded', () => {
+        buildProjectFilter(allEmployees);
+    });
 });
 
 function buildPositionFilter(employees) {
@@ -37,6 +37,11 @@ function renderEmployees(employees = filteredEmployees) {
         
         // Set up image error handling after rendering
         setupImageErrorHandling();
+
+        // Cards rendered from the compact index load their details when scrolled to
+        if (typeof observeEmployeeCards === 'function') {
+            observeEmployeeCards(grid, employees);
+        }
     }
     
     // Reset the rendering flag after a short delay
@@ -232,6 +237,9 @@ function createEmployeeCard(employee) {
     if (employee.image_local_path && employee.image_local_path.trim() !== '') {
         // Adjust path for GitHub Pages
         imageUrl = basePath + employee.image_local_path;
+    } else if (employee.thumb && employee.thumb.trim() !== '') {
+        // Compact site data index entry (details not loaded yet)
+        imageUrl = /^https?:/.test(employee.thumb) ? employee.thumb : basePath + employee.thumb;
     } else if (employee.image_url && employee.image_url.trim() !== '') {
         // Use the remote image URL as-is
         imageUrl = employee.image_url;
@@ -242,6 +250,18 @@ function createEmployeeCard(employee) {
     
     // Create a unique ID for this image to prevent conflicts
     const imageId = `img_${employee.human_name?.replace(/\s+/g, '_')}_${Date.now()}`;
+    
+    // Responsive AVIF/WebP/JPEG variants generated by the scraper (image_srcset: format -> srcset)
+    const imageSources = ['avif', 'webp', 'jpeg']
+        .filter(format => employee.image_srcset && employee.image_srcset[format])
+        .map(format => {
+            const srcset = employee.image_srcset[format]
+                .split(', ')
+                .map(candidate => basePath + candidate)
+                .join(', ');
+            return `<source type="image/${format}" srcset="${srcset}" sizes="120px">`;
+        })
+        .join('');
     // Handle projects - they can be an object or array
     let projects = [];
     if (employee.projects) {
@@ -355,7 +375,7 @@ function createEmployeeCard(employee) {
     return `
         <div class="employee-card">
             <div class="employee-image">
-                <img id="${imageId}" src="${imageUrl}" alt="${employee.human_name}">
+                <picture>${imageSources}<img id="${imageId}" src="${imageUrl}" alt="${employee.human_name}" width="120" height="120" loading="lazy" decoding="async"></picture>
             </div>
             <div class="employee-info">
                 <h3 class="employee-name">
@@ -445,9 +465,9 @@ function createEmployeeCard(employee) {
 
 // Computer data is now integrated into individual employee cards
 
-// Set up image error handling for all images in the grid
-function setupImageErrorHandling() {
-    const images = document.querySelectorAll('.employee-image img');
+// Set up image error handling for all images in the grid (or in one re-rendered card)
+function setupImageErrorHandling(root = document) {
+    const images = root.querySelectorAll('.employee-image img');
     images.forEach(img => {
         // Remove any existing error handlers
         img.onerror = null;
@@ -463,12 +483,14 @@ function setupImageErrorHandling() {
                 const basePath = isGitHubPages ? '/EmployeeData/' : '';
                 const fallbackUrl = basePath + 'assets/icons/default_profile_image.jpg';
                 console.log(`Trying fallback image: ${fallbackUrl}`);
+                // <source> candidates win over src, drop them so the fallback is used
+                this.parentElement.querySelectorAll('source').forEach(source => source.remove());
                 this.src = fallbackUrl;
             } else {
                 // If fallback also failed, show placeholder
                 console.log('Fallback image also failed, showing placeholder');
                 this.style.display = 'none';
-                this.parentElement.innerHTML = '<div class="no-image-placeholder">📷</div>';
+                this.closest('.employee-image').innerHTML = '<div class="no-image-placeholder">📷</div>';
             }
         });
         